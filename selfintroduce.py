@@ -1,14 +1,34 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk
+import functools
 import re
-import sqlite3
+import io
 import os
+import queue
+import sys
+import threading
+import time
+
+from selfintroduce_core import (
+    PERF, Company, CharCounter, Question, AutosaveWriter, DocumentStore, NgramIndex, SortedNameIndex, TextArchive,
+    Job, BinaryArchive, EditJournal, is_archive_path, is_json_path, is_sqlite_path, read_company_digests, replay_journal,
+    run_tasks, write_archive_file, write_json_file, atomic_write_text, export_companies_sql, format_company, lazy_import,
+    new_json_app_id, parse_companies, read_sql_file, timed, write_blocks, company_digest,
+)
+
+# 대화상자와 SQLite는 첫 화면 이후에 필요하므로 처음 사용할 때 불러옵니다.
+filedialog = lazy_import("tkinter.filedialog")
+messagebox = lazy_import("tkinter.messagebox")
+sqlite3 = lazy_import("sqlite3")
 
 
 # QuestionFrame 클래스 (PanedWindow 및 UI 레이아웃 수정)
 class QuestionFrame(ttk.Frame):
     """자소서 문항 하나에 대한 입력 필드와 글자수 측정 기능을 제공하는 프레임"""
 
+    # 글자수 표시 갱신 지연 시간 (연속 입력 시 마지막 입력 후 한 번만 다시 그림)
+    COUNT_DEBOUNCE_MS = 150
+
     def __init__(self, parent, question_number, initial_title=None, initial_data=None):
         super().__init__(parent, padding="10")
         self.question_number = question_number
@@ -16,24 +36,128 @@ class QuestionFrame(ttk.Frame):
         default_title = initial_title if initial_title else f"문항 {self.question_number}"
         self.title_var = tk.StringVar(value=default_title)
 
+        # 글자수 카운터 및 표시 옵션 (개행을 2바이트로 셀지 여부)
+        self.char_counter = CharCounter()
+        self.newline_two_bytes_var = tk.BooleanVar(value=False)
+        self._count_after_id = None
+
+        # 불러온 원본 문항과, 그 뒤로 답변이 편집되었는지 여부 (질문은 Text의 modified 플래그 사용)
+        self.source = None
+        self._answer_dirty = False
+
         self.create_widgets()
+        self._install_answer_hook()
 
         if initial_data:
             self._load_initial_data(initial_data)
 
-        self.answer_text.bind('<KeyRelease>', self.update_char_count)
+        self.answer_text.bind('<<Modified>>', self._on_answer_modified)
+        self.update_char_count()
+
+    def reset(self, question_number, initial_title=None, initial_data=None):
+        """위젯을 다시 만들지 않고 번호/제목/내용을 새 문항 데이터로 바꿉니다. (프레임 풀 재사용)"""
+        self.question_number = question_number
+        self.title_var.set(initial_title if initial_title else f"문항 {self.question_number}")
+        # 이전 탭에서 바꾼 표시 옵션은 새로 만든 프레임과 같게 되돌립니다.
+        self.newline_two_bytes_var.set(False)
+
+        self._load_initial_data(initial_data)
+        for text_widget in (self.question_text, self.answer_text):
+            text_widget.mark_set(tk.INSERT, "1.0")
+            text_widget.yview_moveto(0)
+
+        if self._count_after_id is not None:
+            self.after_cancel(self._count_after_id)
         self.update_char_count()
 
+    def _install_answer_hook(self):
+        """답변 Text 위젯의 Tcl 명령을 가로채 insert/delete 변경분만 카운터에 반영합니다."""
+        widget = self.answer_text
+        self._answer_orig_cmd = widget._w + "_orig"
+        self.tk.call("rename", widget._w, self._answer_orig_cmd)
+        self.tk.createcommand(widget._w, self._dispatch_answer_command)
+        widget.bind('<Destroy>', self._remove_answer_hook, add="+")
+
+    def _remove_answer_hook(self, event=None):
+        """위젯 파괴 시 가로채기 명령을 해제합니다."""
+        try:
+            self.tk.deletecommand(self.answer_text._w)
+        except tk.TclError:
+            pass
+
+    def _answer_call(self, *args):
+        return self.tk.call((self._answer_orig_cmd,) + args)
+
+    def _answer_index(self, index):
+        return str(self._answer_call("index", index))
+
+    def _answer_compare(self, index1, op, index2):
+        return self.tk.getboolean(self._answer_call("compare", index1, op, index2))
+
+    def _deleted_range(self, index1, index2=None):
+        """delete 명령이 실제로 지울 범위를 Tk 규칙(마지막 개행은 보존)에 맞춰 계산합니다."""
+        start = self._answer_index(index1)
+        if index2 is None:
+            if self._answer_compare(start, ">=", "end-1c"):
+                return None
+            return start, self._answer_index(start + "+1c")
+
+        stop = self._answer_index(index2)
+        if not self._answer_compare(start, "<", stop):
+            return None
+        if stop == self._answer_index("end"):
+            # 끝까지 지우는 경우 Tk는 마지막 개행 대신 그 앞의 개행을 지웁니다.
+            stop = self._answer_index("end-1c")
+            if start.endswith(".0") and start != "1.0":
+                start = self._answer_index(start + "-1c")
+        return start, stop
+
+    def _dispatch_answer_command(self, *args):
+        """답변 위젯 명령 디스패처: 편집 명령은 변경분을 계산한 뒤 원래 명령에 위임합니다."""
+        op = args[0] if args else ""
+        if op not in ("insert", "delete", "replace") or str(self._answer_call("cget", "-state")) == "disabled":
+            return self._answer_call(*args)
+
+        self._answer_dirty = True
+
+        if op == "insert":
+            result = self._answer_call(*args)
+            self.char_counter.add("".join(args[2::2]))
+            return result
+
+        if op == "delete" and len(args) > 3:
+            # 여러 범위 동시 삭제는 드물기 때문에 전체 재계산으로 처리
+            result = self._answer_call(*args)
+            self.recount_chars()
+            return result
+
+        removed_range = self._deleted_range(*args[1:3])
+        removed = self._answer_call("get", *removed_range) if removed_range else ""
+        result = self._answer_call(*args)
+        self.char_counter.remove(removed)
+        if op == "replace":
+            self.char_counter.add("".join(args[3::2]))
+        return result
+
+    def recount_chars(self):
+        """답변 전체를 기준으로 카운터를 다시 계산합니다. (불러오기 등 일괄 변경 시)"""
+        self.char_counter.reset(self._answer_call("get", "1.0", "end-1c"))
+
     def _load_initial_data(self, data):
-        """저장된 데이터를 기반으로 위젯의 내용을 채웁니다."""
+        """저장된 문항(Question 또는 None)을 기반으로 위젯의 내용을 채웁니다."""
         self.question_text.delete("1.0", tk.END)
-        self.question_text.insert("1.0", data.get("질문", ""))
+        self.question_text.insert("1.0", (data.question or "") if data else "")
 
         self.type_entry.delete(0, tk.END)
-        self.type_entry.insert(0, data.get("문항유형", ""))
+        self.type_entry.insert(0, (data.type or "") if data else "")
 
         self.answer_text.delete("1.0", tk.END)
-        self.answer_text.insert("1.0", data.get("답변", ""))
+        self.answer_text.insert("1.0", (data.answer or "") if data else "")
+
+        # 불러온 직후는 원본과 같은 상태
+        self.source = data
+        self._answer_dirty = False
+        self.question_text.edit_modified(False)
 
     def update_question_number(self, new_number):
         """문항 번호와 UI 제목을 업데이트합니다."""
@@ -194,23 +318,38 @@ class QuestionFrame(ttk.Frame):
         # borderwidth=0, relief="flat"으로 테두리 제거. background 설정으로 배경색 일치.
         self.count_display = tk.Text(self, height=1, wrap='word', font=('Arial', 10), state='disabled',
                                      borderwidth=0, relief="flat", foreground='gray40')
-        self.count_display.grid(row=2, column=0, columnspan=2, padx=5, pady=(5, 0), sticky="ew")
+        self.count_display.grid(row=2, column=0, padx=5, pady=(5, 0), sticky="ew")
+
+        # 개행 바이트 계산 방식 선택 (채용 사이트마다 개행을 1바이트/2바이트로 셈)
+        ttk.Checkbutton(
+            self,
+            text="개행 2바이트",
+            variable=self.newline_two_bytes_var,
+            command=self.update_char_count
+        ).grid(row=2, column=1, padx=5, pady=(5, 0), sticky="e")
 
         # 태그 설정: 숫자만 크게, 색깔 다르게
         self.count_display.tag_config('count_all', foreground='#00008B', font=('Arial', 12, 'bold'))  # 진한 파란색
         self.count_display.tag_config('count_no_space', foreground='#0A7959', font=('Arial', 12, 'bold'))  # 진한 녹색
+        self.count_display.tag_config('count_bytes', foreground='#8B4500', font=('Arial', 10, 'bold'))  # 갈색
         self.count_display.tag_config('normal', font=('Arial', 10, 'normal'))
 
+    def _on_answer_modified(self, event=None):
+        """<<Modified>> 이벤트마다 표시 갱신을 예약합니다. (디바운스)"""
+        self.answer_text.edit_modified(False)
+        if self._count_after_id is not None:
+            self.after_cancel(self._count_after_id)
+        self._count_after_id = self.after(self.COUNT_DEBOUNCE_MS, self.update_char_count)
 
+    @timed("update_char_count")
     def update_char_count(self, event=None):
-        """답변 텍스트를 분석하여 글자수를 실시간으로 업데이트하고, tk.Text에 태그를 적용하여 표시합니다."""
+        """누적된 카운터 값으로 글자수/바이트수 표시를 갱신하고, tk.Text에 태그를 적용하여 표시합니다."""
+        self._count_after_id = None
 
-        text_content = self.answer_text.get("1.0", tk.END)
-        if text_content.endswith('\n'):
-            text_content = text_content[:-1]
-
-        char_count_all = len(text_content)
-        char_count_no_space = len(text_content.replace(' ', ''))
+        counter = self.char_counter
+        char_count_all = counter.chars
+        char_count_no_space = counter.no_space
+        newline_bytes = 2 if self.newline_two_bytes_var.get() else 1
 
         # tk.Text를 사용하여 태그로 스타일 적용
         self.count_display.config(state='normal')
@@ -227,26 +366,103 @@ class QuestionFrame(ttk.Frame):
         self.count_display.insert(tk.END, str(char_count_no_space), 'count_no_space')
         self.count_display.insert(tk.END, "자", 'normal')
 
+        # 3. 바이트수 (UTF-8 / EUC-KR)
+        self.count_display.insert(tk.END, " | UTF-8: ", 'normal')
+        self.count_display.insert(tk.END, str(counter.utf8_bytes(newline_bytes)), 'count_bytes')
+        self.count_display.insert(tk.END, "B, EUC-KR: ", 'normal')
+        self.count_display.insert(tk.END, str(counter.euckr_bytes(newline_bytes)), 'count_bytes')
+        self.count_display.insert(tk.END, "B", 'normal')
+
         self.count_display.config(state='disabled')
 
-    def get_data(self):
-        """이 문항 프레임의 데이터를 딕셔너리로 반환합니다. (제목 포함)"""
+    def is_modified(self):
+        """불러온 원본 문항 이후 내용이 바뀌었는지 확인합니다. (본문 텍스트는 비교하지 않음)"""
+        source = self.source
+        return (source is None or self._answer_dirty
+                or self.tk.getboolean(self.question_text.edit_modified())
+                or self.title_var.get() != source.title
+                or self.type_entry.get().strip() != source.type)
+
+    def to_question(self):
+        """이 문항 프레임의 내용을 Question으로 반환합니다. 바뀐 것이 없으면 원본 객체를 그대로 반환합니다."""
+        if not self.is_modified():
+            return self.source
+
+        # 화면에 없는 태그/읽기 전용 값과 JSON 문항 id는 원본 문항의 값을 그대로 이어받습니다.
+        fields = {'title': self.title_var.get(), 'type': self.type_entry.get().strip(),
+                  'question': self.question_text.get("1.0", tk.END).strip(),
+                  'answer': self.answer_text.get("1.0", tk.END).strip()}
+        question = Question(**fields) if self.source is None else self.source.replace(**fields)
 
-        question_content = self.question_text.get("1.0", tk.END).strip()
-        answer_content = self.answer_text.get("1.0", tk.END).strip()
+        # 반환한 문항을 새 기준으로 삼아, 다음 저장 때는 다시 읽지 않도록 합니다.
+        self.source = question
+        self._answer_dirty = False
+        self.question_text.edit_modified(False)
+        return question
 
-        return {
-            "제목": self.title_var.get(),
-            "질문": question_content,
-            "문항유형": self.type_entry.get().strip(),
-            "답변": answer_content,
-        }
+
+# LazyQuestionTab 클래스: 아직 열어보지 않은 문항 탭의 자리표시자
+class LazyQuestionTab(ttk.Frame):
+    """위젯 없이 문항 데이터만 들고 있는 탭. 처음 선택될 때 QuestionFrame으로 교체됩니다."""
+
+    def __init__(self, parent, question_number, initial_title=None, initial_data=None):
+        super().__init__(parent)
+        self.question_number = question_number
+        self.initial_data = initial_data
+
+        default_title = initial_title if initial_title else f"문항 {self.question_number}"
+        self.title_var = tk.StringVar(value=default_title)
+
+    def update_question_number(self, new_number):
+        """문항 번호와 기본 제목을 업데이트합니다. (QuestionFrame과 동일한 규칙)"""
+        self.question_number = new_number
+        if re.fullmatch(r"문항 (\d+)", self.title_var.get()):
+            self.title_var.set(f"문항 {self.question_number}")
+
+    def to_question(self):
+        """위젯을 만들지 않고 원본 문항을 반환합니다. 번호 재조정 등으로 제목만 바뀌었으면 제목만 교체합니다."""
+        title = self.title_var.get()
+        if self.initial_data is None:
+            self.initial_data = Question(title)
+        elif self.initial_data.title != title:
+            self.initial_data = self.initial_data.replace(title=title)
+        return self.initial_data
 
 
 # Application 클래스: 메인 윈도우와 전체 로직을 정의합니다.
 class Application(tk.Tk):
     MAX_QUESTIONS = 20
 
+    # 회사 목록 필터 입력 후 목록을 다시 거르기까지의 지연 시간
+    COMPANY_FILTER_DEBOUNCE_MS = 100
+
+    # 회사 전환 시 재사용할 문항 프레임 수 (한 회사의 최대 문항 수만큼 유지)
+    QUESTION_FRAME_POOL_SIZE = MAX_QUESTIONS
+
+    # 검색어 입력 후 검색을 시작하기까지의 지연 시간과, 결과를 한 번에 표시하는 건수
+    SEARCH_DEBOUNCE_MS = 200
+    SEARCH_BATCH_SIZE = 50
+    SEARCH_POLL_MS = 30
+
+    # 자동 저장: 스냅샷을 만드는 주기, 파일 기록 최소 간격(초), 결과 확인 주기
+    AUTOSAVE_SNAPSHOT_MS = 3000
+    AUTOSAVE_WRITE_INTERVAL = 15.0
+    AUTOSAVE_POLL_MS = 500
+    AUTOSAVE_DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".selfintroducer_autosave.txt")
+
+    # 성능 패널 표 갱신 주기
+    PERF_PANEL_REFRESH_MS = 500
+
+    # 파일 작업(불러오기/저장/내보내기) 진행률 확인 주기, 종료 시 취소한 작업을 기다리는 시간(초)
+    JOB_POLL_MS = 100
+    JOB_CLOSE_TIMEOUT = 5.0
+
+    # 여러 파일 불러오기에서 파일을 나눠 읽을 작업 프로세스 수
+    IMPORT_PROCESSES = os.cpu_count() or 1
+
+    # 편집 저널이 이 크기(바이트)를 넘으면 자동 저장 주기에 본 파일에 합침
+    JOURNAL_COMPACT_BYTES = 1024 * 1024
+
     def __init__(self):
         super().__init__()
         self.title("자소서 문항 정리 및 저장 애플리케이션 (UI 개선)")
@@ -256,21 +472,365 @@ class Application(tk.Tk):
         self.current_company_name = None
         self.question_counter = 0
 
+        # 탭에서 떼어낸 뒤 재사용을 기다리는 QuestionFrame 목록
+        self._frame_pool = []
+
+        # 회사 목록 Treeview 순서를 정하는 정렬 색인과 필터 디바운스 상태
+        self.company_index = SortedNameIndex()
+        self._filter_after_id = None
+
+        # 전체 문항 검색용 역색인 (데이터 변경 시 점진적으로 갱신)
+        self.search_index = NgramIndex()
+
+        # 회사 변경 버전(Company.version)별로 캐시된 텍스트 블록/내용 해시 {회사명: (버전, 값)}
+        # 저장/내보내기 작업 스레드도 채우므로 _cache_lock으로 보호합니다.
+        self._block_cache = {}
+        self._digest_cache = {}
+        self._cache_lock = threading.Lock()
+
+        # 데이터가 바뀔 때마다 증가하는 전체 변경 번호 (자동 저장 필요 여부 판단)
+        self.data_generation = 0
+        self._autosaved_state = None
+
         # --- 새로운 상태 변수: 마지막으로 저장/불러온 파일 경로 ---
         self.last_save_path = None
 
+        # 본 파일 옆의 편집 저널 (EditJournal): 열려 있으면 변경된 회사만 덧붙여 기록하고 자동 저장은 쉽니다.
+        # 저널이 journal_squash_bytes 이상 커지면 회사마다 마지막 기록만 남기도록 줄입니다.
+        self.journal = None
+        self.journal_squash_bytes = self.JOURNAL_COMPACT_BYTES
+
+        # SQLite 저장소 모드: 열려 있으면 all_companies_data에는 현재 회사만 올라와 있고
+        # 나머지 회사 값은 None(아직 불러오지 않음)입니다.
+        self.document_store = None
+
+        # 성능 계측 켜기/끄기 (도구 메뉴와 성능 패널이 공유, 환경 변수로 켜진 상태에서 시작할 수 있음)
+        self.perf_enabled_var = tk.BooleanVar(value=PERF.enabled)
+        self.perf_enabled_var.trace_add('write', lambda *args: setattr(PERF, 'enabled', self.perf_enabled_var.get()))
+
+        # 자동 저장 스레드는 첫 화면을 그린 뒤 _finish_startup에서 시작합니다.
+        self.autosave_writer = None
+
+        # 작업 스레드에서 실행 중인 파일 작업 (한 번에 하나, 실행 중에는 파일 메뉴의 입출력 항목만 잠금)
+        self.current_job = None
+
         self.create_menu_bar()
         self.create_widgets()
 
         #self.add_new_company("새 회사 1")
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # 창을 먼저 보여주고, 첫 화면에 필요 없는 초기화는 이벤트 루프가 한가해질 때 합니다.
+        self.after_idle(self._finish_startup)
+
+    def _finish_startup(self):
+        """첫 화면 이후의 초기화: 자동 저장 시작, 첫 회사 선택이 빠르도록 문항 프레임 하나를 미리 만들어 둠"""
+        if self.autosave_writer is None:
+            self.autosave_writer = AutosaveWriter(self.AUTOSAVE_WRITE_INTERVAL)
+            self.after(self.AUTOSAVE_SNAPSHOT_MS, self._autosave_tick)
+            self.after(self.AUTOSAVE_POLL_MS, self._poll_autosave_results)
+
+        if not self._frame_pool and not self.notebook.tabs():
+            self._frame_pool.append(QuestionFrame(self.notebook, 0))
+
+    def report_startup_time(self, file_path):
+        """시작 시간 측정용: 창이 처음 화면에 그려진 시각(time.time())을 file_path에 기록하고 종료합니다."""
+        def on_map(event):
+            if event.widget is self:
+                self.unbind('<Map>')
+                self.after_idle(write_and_exit)
+
+        def write_and_exit():
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(repr(time.time()))
+            self.on_closing()
+
+        self.bind('<Map>', on_map)
+
     def on_closing(self):
         """앱 종료 전 현재 편집 중인 내용을 저장합니다."""
+        if self.current_job is not None:
+            if not messagebox.askyesno("작업 진행 중", f"'{self.current_job.title}' 작업이 진행 중입니다.\n작업을 취소하고 종료할까요?"):
+                return
+            # 저장은 임시 파일에 기록한 뒤 교체하므로, 취소되어도 기존 파일은 그대로 남습니다.
+            self.current_job.cancel()
+            self.current_job.wait(self.JOB_CLOSE_TIMEOUT)
         if self.current_company_name:
             self.save_current_company_data()
+        if self.journal is not None and not self._close_journal():
+            return
+        # 아직 기록되지 않은 변경이 있으면 마지막 자동 저장을 마친 뒤 종료합니다.
+        if self.autosave_writer is not None:
+            snapshot = self._take_autosave_snapshot()
+            if snapshot is not None:
+                self.autosave_writer.close(*snapshot)
+            else:
+                self.autosave_writer.close()
+        if self.document_store is not None:
+            self.document_store.close()
         self.destroy()
 
+    def _autosave_path(self):
+        """자동 저장 파일 경로: 마지막으로 저장/불러온 파일 옆, 없으면 홈 디렉터리 (자동 저장은 항상 텍스트 형식)"""
+        if self.last_save_path:
+            return os.path.splitext(self.last_save_path)[0] + ".autosave.txt"
+        return self.AUTOSAVE_DEFAULT_PATH
+
+    def _take_autosave_snapshot(self):
+        """마지막 자동 저장 이후 바뀐 것이 있으면 (경로, 스냅샷)을, 없으면 None을 반환합니다.
+
+        회사별 문항 목록의 참조와 변경 버전만 모으므로 회사 수에 비례하는 가벼운 작업입니다.
+        저장소 모드와 편집 저널을 쓰는 동안에는 이미 변경마다 기록되므로 자동 저장하지 않습니다.
+        """
+        if self.document_store is not None or self.journal is not None or not self.all_companies_data:
+            return None
+
+        file_path = self._autosave_path()
+        state = (self.data_generation, file_path)
+        if state == self._autosaved_state:
+            return None
+        self._autosaved_state = state
+
+        # 원본 파일에서 아직 읽지 않은 회사는 자동 저장 스레드가 기록할 때 읽도록 함수로 넘깁니다.
+        return file_path, self._snapshot_companies()
+
+    def _autosave_tick(self):
+        """현재 편집 내용을 데이터에 반영하고, 바뀐 것이 있으면 자동 저장 스레드에 스냅샷을 넘깁니다."""
+        if self.current_company_name:
+            self.save_current_company_data()
+        snapshot = self._take_autosave_snapshot()
+        if snapshot is not None:
+            self.autosave_writer.submit(*snapshot)
+        if self.journal is not None and self.journal.error is not None:
+            self._journal_failed(self.journal.error)
+        if (self.journal is not None and self.current_job is None
+                and self.journal.size() >= self.journal_squash_bytes):
+            self._squash_journal()
+        self.after(self.AUTOSAVE_SNAPSHOT_MS, self._autosave_tick)
+
+    def _poll_autosave_results(self):
+        """자동 저장 결과를 상태 표시줄에 표시합니다."""
+        try:
+            while True:
+                kind, file_path, value = self.autosave_writer.results.get_nowait()
+                if kind == 'saved':
+                    saved_at = time.strftime("%H:%M:%S", time.localtime(value))
+                    self.autosave_status_var.set(f"자동 저장: {saved_at} ({os.path.basename(file_path)})")
+                else:
+                    self.autosave_status_var.set(f"자동 저장 실패: {value}")
+        except queue.Empty:
+            pass
+        self.after(self.AUTOSAVE_POLL_MS, self._poll_autosave_results)
+
+    # --- 편집 저널: 저장한 파일 옆에 변경된 회사만 덧붙여 기록하고, 저장할 때 본 파일에 합침 ---
+    # 저널은 사용자가 직접 저장한 파일에만 붙입니다. 본 파일은 사용자가 저장하거나 종료 시 저장을 고를 때만 다시 씁니다.
+
+    def _attach_journal(self, main_path, in_sync, main_names=(), reset=False):
+        """main_path(방금 저장한 파일) 옆의 편집 저널을 열고 이후 변경을 기록합니다. (저장소 모드에서는 쓰지 않음)
+
+        본 파일에 저널을 재생한 결과가 현재 데이터와 같도록, 본 파일과 내용이 다른 회사(in_sync(회사명, Company)가
+        거짓)는 문항 전체를, main_names 중 지금은 없는 회사는 삭제를 먼저 기록합니다. reset이면 기존 기록을 버립니다.
+        """
+        self._detach_journal()
+        if self.document_store is not None:
+            return
+
+        journal = EditJournal(main_path)
+        try:
+            journal.open(reset=reset)
+            for company_name, company in list(self.all_companies_data.items()):
+                if not in_sync(company_name, company):
+                    journal.put(company_name, self._get_questions(company_name))
+            for company_name in main_names:
+                if company_name not in self.all_companies_data:
+                    journal.remove(company_name)
+        except Exception as e:
+            journal.close()
+            messagebox.showwarning("편집 저널 오류", f"편집 저널을 열 수 없어 자동 저장을 계속 사용합니다: {e}")
+            return
+        self.journal = journal
+        self.journal_squash_bytes = self.JOURNAL_COMPACT_BYTES
+
+    def _detach_journal(self):
+        """편집 저널을 닫습니다. 저널 파일은 남겨 두므로 본 파일을 다시 열면 재생됩니다."""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def _journal_record(self, op, company_name, *args):
+        """편집 저널에 put/remove 기록을 맡깁니다. (쓰기와 fsync는 저널의 기록 스레드에서 함)"""
+        if self.journal is None:
+            return
+        if self.journal.error is not None:
+            self._journal_failed(self.journal.error)
+            return
+        getattr(self.journal, op)(company_name, *args)
+
+    def _journal_failed(self, error):
+        """기록 스레드가 저널에 쓰지 못했으면 저널을 닫고 자동 저장으로 되돌아갑니다."""
+        self._detach_journal()
+        self._autosaved_state = None  # 저널에 쓰지 못한 변경이 다음 자동 저장에 들어가도록
+        messagebox.showwarning("편집 저널 오류", f"편집 저널에 기록하지 못해 저널을 닫습니다. 이후 변경은 자동 저장됩니다: {error}")
+
+    def _replay_journal(self, records):
+        """저널 기록을 현재 데이터에 차례로 적용하고, 기록에 나온 회사명 집합을 반환합니다. (연속된 put은 한 번에 병합)"""
+        pending = {}
+        infos = {}
+        for record in records:
+            company_name = record["company"]
+            if record["op"] == "put":
+                pending[company_name] = [Question(*row) for row in record["questions"]]
+                infos[company_name] = record.get("info")
+                continue
+            if pending:
+                self._merge_imported_companies(pending, infos)
+                pending = {}
+            if company_name in self.all_companies_data:
+                if company_name == self.current_company_name:
+                    self._close_current_company()
+                del self.all_companies_data[company_name]
+                self._drop_company(company_name)
+        if pending:
+            self._merge_imported_companies(pending, infos)
+        self._update_treeview()
+        return {record["company"] for record in records}
+
+    def _fold_journal(self, on_done, on_error):
+        """편집 저널을 본 파일에 합칩니다. 현재 스냅샷으로 본 파일을 다시 쓴 뒤, 그 뒤에 쌓인 기록만 저널에 남깁니다.
+
+        저널 기록은 재생을 반복해도 결과가 같으므로, 본 파일을 교체한 직후 종료되어도 내용은 그대로입니다.
+        """
+        journal = self.journal
+        self.save_current_company_data()
+        _, save = self._save_task(journal.main_path, self._snapshot_companies())
+        offset = journal.mark()
+
+        def fold(job):
+            result = save(job)
+            journal.compact(offset.result())
+            return result
+
+        def on_folded(result):
+            if self.journal is journal:
+                self.journal_squash_bytes = self.JOURNAL_COMPACT_BYTES
+            on_done(result)
+        return self.run_job("편집 저널 합치기", fold, on_folded, on_error)
+
+    def _squash_journal(self):
+        """저널이 커지면 회사마다 마지막 기록만 남기도록 작업 스레드에서 줄입니다. (본 파일은 그대로)
+
+        줄인 뒤에도 큰 저널(긴 답변의 회사를 많이 편집한 경우)을 매번 다시 줄이지 않도록,
+        다음 기준은 줄인 뒤 크기의 두 배 이상으로 잡습니다.
+        """
+        journal = self.journal
+
+        def set_next_threshold():
+            if self.journal is journal:
+                self.journal_squash_bytes = max(self.JOURNAL_COMPACT_BYTES, 2 * journal.size())
+
+        def on_done(result):
+            set_next_threshold()
+            self.autosave_status_var.set(f"편집 저널 정리: {time.strftime('%H:%M:%S')}")
+
+        def on_error(e):
+            set_next_threshold()
+            self.autosave_status_var.set(f"편집 저널 정리 실패: {e}")
+        self.run_job("편집 저널 정리", lambda job: journal.squash(), on_done, on_error)
+
+    def _close_journal(self):
+        """종료 전에 저장하지 않은 저널 기록을 파일에 저장할지 묻습니다. 종료를 취소하면 False를 반환합니다.
+
+        예: 본 파일에 합침 (실패하면 오류를 알리고 종료 취소), 아니요: 저널을 지움, 취소: 종료 취소
+        """
+        journal = self.journal
+        journal.flush()
+        if journal.size() > 0 or journal.error is not None:
+            answer = messagebox.askyesnocancel(
+                "저장하지 않은 변경", f"마지막 저장 이후의 변경을 다음 파일에 저장할까요?\n{journal.main_path}")
+            if answer is None:
+                return False
+            if not answer:
+                self.journal = None
+                journal.discard()
+                return True
+            # 실행 중인 작업(on_closing에서 취소 요청됨)이 같은 파일에 쓰는 중일 수 있으므로 끝날 때까지 기다립니다.
+            running = self.current_job
+            if running is not None and not running.wait(self.JOB_CLOSE_TIMEOUT):
+                messagebox.showerror("저장 실패", f"'{running.title}' 작업이 끝나지 않아 변경을 저장하지 못했습니다.\n"
+                                                f"잠시 후 다시 종료해주세요.")
+                return False
+            self.status_var.set("편집 저널을 파일에 합치는 중...")
+            self.update_idletasks()
+            _, save = self._save_task(journal.main_path, self._snapshot_companies())
+            offset = journal.mark()
+            job = Job("편집 저널 합치기", lambda job: (save(job), journal.compact(offset.result()))).start()
+            job.wait()
+            if job.error is not None:
+                self.status_var.set("편집 저널 합치기 실패")
+                messagebox.showerror("저장 실패", f"변경을 파일에 저장하지 못했습니다. 창을 닫지 않습니다: {job.error}")
+                return False
+        self._detach_journal()
+        return True
+
+    # --- 파일 작업: 작업 스레드에서 실행하고 after()로 진행률/결과를 확인 ---
+
+    def run_job(self, title, func, on_done, on_error):
+        """func(job)를 작업 스레드에서 실행합니다. 끝나면 화면 스레드에서 on_done(결과) 또는 on_error(예외)를 호출합니다.
+
+        실행 중에는 파일 메뉴의 불러오기/저장/내보내기 항목만 잠그므로 편집은 계속할 수 있습니다.
+        """
+        if self.current_job is not None:
+            messagebox.showwarning("작업 진행 중", f"'{self.current_job.title}' 작업이 끝난 뒤 다시 시도해주세요.")
+            return None
+
+        job = Job(title, func)
+        self.current_job = job
+        self._set_file_io_locked(True)
+        self.job_progress.config(value=0)
+        self.job_cancel_button.config(state=tk.NORMAL)
+        self.job_frame.pack(side="right", padx=(5, 10), before=self.status_bar)
+        self.status_var.set(f"{title} 중...")
+        job.start()
+        self.after(self.JOB_POLL_MS, self._poll_job, job, on_done, on_error)
+        return job
+
+    def _poll_job(self, job, on_done, on_error):
+        """진행률을 표시하고, 작업이 끝났으면 결과 처리 함수를 호출합니다."""
+        if not job.finished.is_set():
+            if job.total:
+                self.job_progress.config(value=min(job.done / job.total, 1.0))
+            self.after(self.JOB_POLL_MS, self._poll_job, job, on_done, on_error)
+            return
+
+        self.current_job = None
+        self.job_frame.pack_forget()
+        self._set_file_io_locked(False)
+
+        if job.cancelled:
+            self.status_var.set(f"{job.title}: 취소되었습니다.")
+        elif job.error is not None:
+            self.status_var.set("")
+            on_error(job.error)
+        else:
+            self.status_var.set("")
+            on_done(job.result)
+
+    def cancel_job(self):
+        """실행 중인 파일 작업에 취소를 요청합니다. (다음 진행률 보고 시점에 중단)"""
+        if self.current_job is not None:
+            self.current_job.cancel()
+            self.job_cancel_button.config(state=tk.DISABLED)
+            self.status_var.set(f"{self.current_job.title} 취소 중...")
+
+    def _set_file_io_locked(self, locked):
+        """파일 작업 중에는 다른 파일 작업을 시작하지 못하도록 파일 메뉴의 입출력 항목을 잠급니다."""
+        load_state = tk.DISABLED if locked else tk.NORMAL
+        for label in self.menu_load_entries:
+            self.file_menu.entryconfig(label, state=load_state)
+        self._update_save_menu_state()
+        if not self.current_company_name:
+            self.file_menu.entryconfig(self.menu_save_current, state=tk.DISABLED)
+
     def create_menu_bar(self):
         """메뉴 바를 생성하고 새로운 파일 관리 기능을 추가합니다."""
         menubar = tk.Menu(self)
@@ -280,8 +840,10 @@ class Application(tk.Tk):
         file_menu = tk.Menu(menubar, tearoff=0)
 
         # --- 불러오기/추출하기 ---
-        file_menu.add_command(label="텍스트 파일 불러오기", command=self.load_text_file)
+        file_menu.add_command(label="파일 불러오기 (여러 개 선택, 병합)", command=self.load_text_file)
+        file_menu.add_command(label="대용량 텍스트/아카이브 파일 열기 (필요할 때 읽기)", command=self.open_text_archive)
         file_menu.add_command(label="SQL 파일로부터 추출하기", command=self.load_from_sql_file)
+        file_menu.add_command(label="SQLite 저장소 열기 (실시간 저장)", command=self.open_document_store)
         file_menu.add_separator()
 
         # --- 저장하기 ---
@@ -295,6 +857,8 @@ class Application(tk.Tk):
 
         # 4. SQL 파일로 내보내기
         file_menu.add_command(label="SQL 파일로 내보내기", command=self.export_to_sql, state=tk.DISABLED)
+        # 5. 웹 도구(Jasoser.html) JSON으로 내보내기
+        file_menu.add_command(label="Jasoser JSON으로 내보내기", command=self.export_to_json, state=tk.DISABLED)
         file_menu.add_separator()
 
         file_menu.add_command(label="종료", command=self.on_closing)
@@ -303,23 +867,58 @@ class Application(tk.Tk):
         # 2. 도구 메뉴 (검색)
         tool_menu = tk.Menu(menubar, tearoff=0)
         tool_menu.add_command(label="전체 문항 검색", command=self.open_search_popup)
+        tool_menu.add_separator()
+        tool_menu.add_checkbutton(label="성능 계측", variable=self.perf_enabled_var)
+        tool_menu.add_command(label="성능 패널", command=self.open_perf_panel)
         menubar.add_cascade(label="도구", menu=tool_menu)
 
         # 메뉴바 저장 버튼 상태를 외부에서 접근할 수 있도록 저장 (인덱스 변경됨)
-        self.menu_save_current = file_menu.entrycget(3, "label")
-        self.menu_save_all = file_menu.entrycget(4, "label")
-        self.menu_save_all_as = file_menu.entrycget(5, "label")
-        self.menu_export_sql = file_menu.entrycget(7, "label")
+        self.menu_save_current = file_menu.entrycget(5, "label")
+        self.menu_save_all = file_menu.entrycget(6, "label")
+        self.menu_save_all_as = file_menu.entrycget(7, "label")
+        self.menu_export_sql = file_menu.entrycget(9, "label")
+        self.menu_export_json = file_menu.entrycget(10, "label")
+        self.menu_load_entries = [file_menu.entrycget(index, "label") for index in range(4)]
         self.file_menu = file_menu
 
     def create_widgets(self):
         # UI 생성 로직
+        # 하단 상태 표시줄 (불러오기 진행률 등) + 오른쪽에 마지막 자동 저장 시각
+        status_frame = ttk.Frame(self)
+        status_frame.pack(side="bottom", fill="x", padx=10, pady=(0, 5))
+
+        self.autosave_status_var = tk.StringVar(value="")
+        ttk.Label(status_frame, textvariable=self.autosave_status_var, foreground='gray40').pack(side="right")
+
+        self.status_var = tk.StringVar(value="")
+        status_bar = ttk.Label(status_frame, textvariable=self.status_var, anchor="w", foreground='gray40')
+        status_bar.pack(side="left", fill="x", expand=True)
+        self.status_bar = status_bar
+
+        # 파일 작업 진행률과 취소 버튼 (작업 중에만 표시)
+        self.job_frame = ttk.Frame(status_frame)
+        self.job_progress = ttk.Progressbar(self.job_frame, mode='determinate', length=160, maximum=1.0)
+        self.job_progress.pack(side="left", padx=(0, 5))
+        self.job_cancel_button = ttk.Button(self.job_frame, text="취소", command=self.cancel_job)
+        self.job_cancel_button.pack(side="left")
+
         paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
         paned_window.pack(fill="both", expand=True, padx=10, pady=10)
 
         left_frame = ttk.Frame(paned_window, width=280, padding="5")
         left_frame.pack_propagate(False)
 
+        # 회사 목록 필터 (입력하는 대로 접두어/부분 문자열로 좁힘)
+        filter_frame = ttk.Frame(left_frame)
+        filter_frame.pack(fill="x", pady=(0, 5))
+
+        ttk.Label(filter_frame, text="필터:").pack(side="left", padx=(0, 5))
+        self.company_filter_var = tk.StringVar()
+        self.company_filter_var.trace_add('write', self._on_company_filter_changed)
+        company_filter_entry = ttk.Entry(filter_frame, textvariable=self.company_filter_var)
+        company_filter_entry.pack(side="left", fill="x", expand=True)
+        company_filter_entry.bind('<Escape>', lambda event: self.company_filter_var.set(""))
+
         tree_container = ttk.Frame(left_frame)
         tree_container.pack(fill="both", expand=True)
 
@@ -382,6 +981,7 @@ class Application(tk.Tk):
 
         self.notebook = ttk.Notebook(right_frame)
         self.notebook.pack(fill="both", expand=True)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         control_frame = ttk.Frame(right_frame)
         control_frame.pack(fill="x", pady=10)
@@ -400,23 +1000,92 @@ class Application(tk.Tk):
 
         paned_window.add(right_frame, weight=1)
 
+    @timed("update_treeview")
     def _update_treeview(self):
-        """데이터를 기반으로 Treeview를 새로고침하고 저장 버튼 상태를 업데이트합니다."""
-
-        num_companies = len(self.all_companies_data)
-
-        for item in self.company_tree.get_children():
-            self.company_tree.delete(item)
+        """데이터를 기반으로 Treeview를 갱신(바뀐 행만 반영)하고 저장 버튼 상태를 업데이트합니다."""
+        self._sync_treeview_rows(self._visible_company_names())
+        self._update_save_menu_state()
+
+    def _visible_company_names(self):
+        """필터를 적용한, Treeview에 보여야 할 회사명 목록을 반환합니다."""
+        filter_text = self.company_filter_var.get().strip()
+        if filter_text:
+            return self.company_index.filter(filter_text)
+        return self.company_index.names
+
+    def _sync_treeview_rows(self, visible_names):
+        """현재 Treeview 행과 visible_names를 비교하여 삭제/이동/삽입만 적용합니다."""
+        current = self.company_tree.get_children()
+        if len(current) == len(visible_names) and list(current) == visible_names:
+            return
 
-        for company in sorted(self.all_companies_data.keys()):
-            self.company_tree.insert("", tk.END, values=(company,), iid=company)
+        visible_set = set(visible_names)
+        to_delete = [iid for iid in current if iid not in visible_set]
+        if to_delete:
+            self.company_tree.delete(*to_delete)
+
+        # 불변식: 반복 시작 시 Treeview의 앞쪽 position개 행은 visible_names[:position]과 같습니다.
+        remaining = [iid for iid in current if iid in visible_set]
+        existing = set(remaining)
+        placed = set()
+        j = 0
+        for position, name in enumerate(visible_names):
+            while j < len(remaining) and remaining[j] in placed:
+                j += 1
+            if j < len(remaining) and remaining[j] == name:
+                j += 1
+            elif name in existing:
+                self.company_tree.move(name, "", position)
+            else:
+                self.company_tree.insert("", position, values=(name,), iid=name)
+            placed.add(name)
 
-        # 메뉴바 저장 버튼 상태 업데이트
-        save_state = tk.NORMAL if num_companies > 0 else tk.DISABLED
+    def _tree_insert_company(self, company_name):
+        """회사 하나를 정렬 위치에 삽입합니다. (필터 사용 중이면 필터 결과로 다시 맞춤)"""
+        if self.company_filter_var.get().strip():
+            self._update_treeview()
+            return
+        if not self.company_tree.exists(company_name):
+            self.company_tree.insert("", self.company_index.index(company_name),
+                                     values=(company_name,), iid=company_name)
+        self._update_save_menu_state()
+
+    def _tree_delete_company(self, company_name):
+        """회사 하나의 행을 삭제합니다."""
+        if self.company_tree.exists(company_name):
+            self.company_tree.delete(company_name)
+        self._update_save_menu_state()
+
+    def _select_company(self, company_name):
+        """Treeview에서 회사를 선택합니다. 필터 때문에 보이지 않으면 필터를 지웁니다."""
+        if not self.company_tree.exists(company_name):
+            self.company_filter_var.set("")
+            self._apply_company_filter()
+        self.company_tree.selection_set(company_name)
+        self.company_tree.focus(company_name)
+        self.company_tree.see(company_name)
+
+    def _on_company_filter_changed(self, *args):
+        """필터 입력이 바뀌면 잠시 후 목록을 다시 거릅니다. (디바운스)"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(self.COMPANY_FILTER_DEBOUNCE_MS, self._apply_company_filter)
+
+    @timed("company_filter")
+    def _apply_company_filter(self):
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = None
+        self._sync_treeview_rows(self._visible_company_names())
+
+    def _update_save_menu_state(self):
+        # 메뉴바 저장 버튼 상태 업데이트 (파일 작업 중에는 잠금)
+        save_state = tk.NORMAL if self.all_companies_data and self.current_job is None else tk.DISABLED
         self.file_menu.entryconfig(self.menu_save_current, state=save_state)
         self.file_menu.entryconfig(self.menu_save_all, state=save_state)
         self.file_menu.entryconfig(self.menu_save_all_as, state=save_state)
         self.file_menu.entryconfig(self.menu_export_sql, state=save_state)
+        self.file_menu.entryconfig(self.menu_export_json, state=save_state)
 
     def _set_controls_state(self, state):
         """문항 및 회사명 관련 제어 버튼의 상태를 설정합니다."""
@@ -427,26 +1096,45 @@ class Application(tk.Tk):
         self.remove_company_button.config(state=state)
 
         # 현재 회사가 선택되면 단일 저장 버튼을 활성화
-        current_save_state = tk.NORMAL if self.current_company_name else tk.DISABLED
+        current_save_state = tk.NORMAL if self.current_company_name and self.current_job is None else tk.DISABLED
         self.file_menu.entryconfig(self.menu_save_current, state=current_save_state)
 
     def _clear_notebook(self):
-        """현재 Notebook의 모든 탭을 제거합니다."""
+        """현재 Notebook의 모든 탭을 제거하고, 문항 프레임은 재사용을 위해 풀에 돌려놓습니다."""
         for tab in self.notebook.tabs():
+            frame = self.nametowidget(tab)
             self.notebook.forget(tab)
+            self._release_question_frame(frame)
         self.question_counter = 0
 
+    def _acquire_question_frame(self, question_number, initial_title=None, initial_data=None):
+        """풀에 남는 문항 프레임이 있으면 내용만 바꿔 재사용하고, 없으면 새로 만듭니다."""
+        if self._frame_pool:
+            frame = self._frame_pool.pop()
+            frame.reset(question_number, initial_title, initial_data)
+            return frame
+        return QuestionFrame(self.notebook, question_number, initial_title, initial_data)
+
+    def _release_question_frame(self, frame):
+        """탭에서 뗀 문항 프레임을 풀에 돌려놓습니다. 풀이 가득 차면 위젯을 파괴합니다."""
+        if not isinstance(frame, QuestionFrame):
+            frame.destroy()
+        elif len(self._frame_pool) < self.QUESTION_FRAME_POOL_SIZE:
+            frame.reset(0)  # 큰 답변 텍스트를 붙잡고 있지 않도록 비워둠
+            self._frame_pool.append(frame)
+        else:
+            frame.destroy()
+
     def add_new_company(self, company_name):
         """새 회사 데이터를 추가하고 목록을 업데이트합니다."""
         if company_name in self.all_companies_data:
             messagebox.showwarning("중복", f"'{company_name}'은(는) 이미 회사 목록에 존재합니다.")
             return
 
-        self.all_companies_data[company_name] = []
-        self._update_treeview()
-
-        self.company_tree.selection_set(company_name)
-        self.company_tree.focus(company_name)
+        self.all_companies_data[company_name] = Company(company_name, [])
+        self._touch_company(company_name)
+        self._tree_insert_company(company_name)
+        self._select_company(company_name)
 
         self.load_company_data(None)
 
@@ -549,14 +1237,22 @@ class Application(tk.Tk):
 
         try:
             self.save_current_company_data()
-            self.all_companies_data[new_name] = self.all_companies_data.pop(old_name)
+            if self.document_store is not None:
+                self.document_store.rename_company(old_name, new_name)
+
+            company = self.all_companies_data.pop(old_name)
+            company.name = new_name
+            self.all_companies_data[new_name] = company
             self.current_company_name = new_name
 
-            self.current_company_name_var.set(new_name)
-            self._update_treeview()
+            # 저널에는 새 이름을 먼저 기록하므로, 그 사이에 종료되어도 회사가 사라지지 않습니다.
+            self._touch_company(new_name)
+            self._drop_company(old_name)
 
-            self.company_tree.selection_set(new_name)
-            self.company_tree.focus(new_name)
+            self.current_company_name_var.set(new_name)
+            self._tree_delete_company(old_name)
+            self._tree_insert_company(new_name)
+            self._select_company(new_name)
 
             messagebox.showinfo("수정 완료", f"회사 이름이 '{old_name}'에서 '{new_name}'(으)로 변경되었습니다.")
 
@@ -564,6 +1260,7 @@ class Application(tk.Tk):
             messagebox.showerror("이름 변경 오류", f"회사 이름 변경 중 오류가 발생했습니다: {e}")
             self.current_company_name = old_name
             self.current_company_name_var.set(old_name)
+            self.company_index = SortedNameIndex(self.all_companies_data)
             self._update_treeview()
 
     def remove_current_company(self):
@@ -581,40 +1278,171 @@ class Application(tk.Tk):
         if confirm:
             try:
                 del self.all_companies_data[company_to_remove]
+                self._drop_company(company_to_remove)
 
                 self.current_company_name = None
                 self.current_company_name_var.set("회사를 선택하거나 추가해주세요.")
                 self._clear_notebook()
                 self._set_controls_state(False)
-                self._update_treeview()
+                self._tree_delete_company(company_to_remove)
 
                 messagebox.showinfo("제거 완료", f"회사 '{company_to_remove}'가(이) 성공적으로 제거되었습니다.")
 
                 if self.company_tree.get_children():
-                    first_company_id = self.company_tree.get_children()[0]
-                    self.company_tree.selection_set(first_company_id)
-                    self.company_tree.focus(first_company_id)
+                    self._select_company(self.company_tree.get_children()[0])
                     self.load_company_data(None)
 
             except Exception as e:
                 messagebox.showerror("제거 오류", f"회사 제거 중 오류가 발생했습니다: {e}")
 
+    @timed("save_current_company")
     def save_current_company_data(self):
         """현재 Notebook에 표시된 문항 내용을 내부 데이터에 저장합니다."""
         if not self.current_company_name:
             return
 
+        company = self.all_companies_data.get(self.current_company_name)
+        if company is None:
+            return
+
         current_questions = []
         for tab_id in self.notebook.tabs():
             try:
                 frame = self.nametowidget(tab_id)
-                if isinstance(frame, QuestionFrame):
-                    current_questions.append(frame.get_data())
+                if isinstance(frame, (QuestionFrame, LazyQuestionTab)):
+                    current_questions.append(frame.to_question())
             except KeyError:
                 continue
 
-        self.all_companies_data[self.current_company_name] = current_questions
-
+        # 바뀌지 않은 탭은 원본 Question 객체를 그대로 돌려주므로, 본문 비교 없이 객체 동일성만 확인합니다.
+        stored = company.questions
+        if (stored is None or len(stored) != len(current_questions)
+                or any(new is not old for new, old in zip(current_questions, stored))):
+            company.questions = current_questions
+            self._touch_company(self.current_company_name)
+
+    def _touch_company(self, company_name):
+        """회사 데이터가 바뀌었음을 기록합니다. (변경 버전 증가, 저장소 기록 또는 검색 색인 갱신)"""
+        company = self.all_companies_data[company_name]
+        # 변경 버전은 전체 변경 번호를 그대로 써서, 제거 후 같은 이름으로 다시 추가되어도 재사용되지 않게 합니다.
+        self.data_generation += 1
+        company.version = self.data_generation
+        self.company_index.add(company_name)
+        if self.document_store is not None:
+            self.document_store.save_company(company_name, company.questions)
+        else:
+            self._touch_memory_company(company_name, company)
+
+    def _touch_companies(self, company_names):
+        """여러 회사의 변경을 한 번에 기록합니다. (회사 목록 색인은 한 번 정렬, 저장소 기록은 한 트랜잭션)"""
+        companies = [(company_name, self.all_companies_data[company_name]) for company_name in company_names]
+        for company_name, company in companies:
+            self.data_generation += 1
+            company.version = self.data_generation
+        self.company_index.update(company_names)
+        if self.document_store is not None:
+            self.document_store.save_companies((company_name, company.questions) for company_name, company in companies)
+        else:
+            for company_name, company in companies:
+                self._touch_memory_company(company_name, company)
+
+    def _touch_memory_company(self, company_name, company):
+        """메모리 모드에서 바뀐 회사를 검색 색인과 편집 저널에 반영합니다. (색인은 다음 검색 때 만듦)"""
+        if company.questions is None:
+            # 대용량 텍스트 파일에서 목록만 읽은 회사: 검색은 원본 파일을 직접 훑습니다.
+            self.search_index.remove_company(company_name)
+        else:
+            # 편집된 내용은 더 이상 원본 파일과 같지 않으므로 메모리에 둡니다.
+            company.source = None
+            self.search_index.update_company(company_name, company.questions)
+            self._journal_record('put', company_name, company.questions, company.info())
+
+    def _drop_company(self, company_name):
+        """제거되었거나 이름이 바뀐 회사의 변경 버전, 캐시 블록, 검색 색인을 정리합니다."""
+        self.data_generation += 1
+        with self._cache_lock:
+            self._block_cache.pop(company_name, None)
+            self._digest_cache.pop(company_name, None)
+        self.company_index.discard(company_name)
+        self.search_index.remove_company(company_name)
+        if self.document_store is not None:
+            self.document_store.delete_company(company_name)
+        self._journal_record('remove', company_name)
+
+    def _get_questions(self, company_name):
+        """회사의 문항 목록을 반환합니다. 아직 불러오지 않은 회사는 원본 파일이나 저장소에서 읽습니다."""
+        company = self.all_companies_data.get(company_name)
+        if company is None:
+            return []
+        if company.questions is None and company.source is not None:
+            return company.source.load_company(company_name)
+        if company.questions is None and self.document_store is not None:
+            return self.document_store.load_company(company_name)
+        return company.questions if company.questions is not None else []
+
+    def _iter_company_items(self):
+        """(회사명, 문항 목록) 쌍을 순서대로 내보냅니다. 저장소 모드에서는 회사 단위로 읽어옵니다."""
+        for company_name in list(self.all_companies_data):
+            yield company_name, self._get_questions(company_name)
+
+    def _snapshot_entry(self, company_name):
+        """회사 하나의 (회사명, 변경 버전, 문항 목록 또는 문항 목록을 반환하는 함수)를 만듭니다.
+
+        저장소 모드와 원본 파일에서 읽는 회사는 메모리 사용량을 회사 수와 무관하게 유지하기 위해
+        함수로 넘깁니다. 함수로 넘긴 회사의 블록은 캐시하지 않으며, 함수는 작업 스레드에서 호출해도 됩니다.
+        """
+        company = self.all_companies_data[company_name]
+        questions = company.questions
+        if self.document_store is not None or company.source is not None:
+            if questions is not None:
+                questions = (lambda questions=questions: questions)
+            elif company.source is not None:
+                questions = functools.partial(company.source.load_company, company_name)
+            else:
+                questions = functools.partial(self.document_store.load_company, company_name)
+        return company_name, company.version, questions
+
+    def _snapshot_companies(self, company_names=None):
+        """회사들의 스냅샷 항목 목록을 만듭니다. (문항 목록은 제자리 수정 없이 교체되므로 참조만 모음)
+
+        작업 스레드는 이 목록만 보고 기록하므로, 기록하는 동안 화면에서 편집을 계속해도 됩니다.
+        """
+        if company_names is None:
+            company_names = list(self.all_companies_data)
+        return [self._snapshot_entry(company_name) for company_name in company_names]
+
+    def _snapshot_digest(self, company_name, version, questions):
+        """스냅샷 항목의 내용 해시를 반환합니다. 변경 버전이 같으면 이전에 계산한 값을 씁니다. (작업 스레드에서도 호출)"""
+        with self._cache_lock:
+            cached = self._digest_cache.get(company_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        digest = company_digest(questions() if callable(questions) else questions)
+        with self._cache_lock:
+            self._digest_cache[company_name] = (version, digest)
+        return digest
+
+    def _snapshot_block(self, company_name, version, questions):
+        """스냅샷 항목의 텍스트 블록을 반환합니다. 마지막 포맷 이후 바뀌지 않았으면 캐시를 그대로 씁니다. (작업 스레드에서도 호출)"""
+        if callable(questions):
+            return format_company(company_name, questions())
+
+        with self._cache_lock:
+            cached = self._block_cache.get(company_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        block = format_company(company_name, questions)
+        with self._cache_lock:
+            self._block_cache[company_name] = (version, block)
+        return block
+
+    def _company_block(self, company_name):
+        """회사의 텍스트 블록을 반환합니다."""
+        return self._snapshot_block(*self._snapshot_entry(company_name))
+
+    @timed("load_company_data")
     def load_company_data(self, event):
         """Treeview에서 새 회사가 선택되면 데이터를 로드합니다."""
 
@@ -630,23 +1458,32 @@ class Application(tk.Tk):
 
         if self.current_company_name:
             self.save_current_company_data()
+            # 저장소 모드이거나 원본 파일과 내용이 같은 회사는 이전 회사를 메모리에서 내립니다. (다시 읽을 수 있음)
+            previous = self.all_companies_data.get(self.current_company_name)
+            if previous is not None and (self.document_store is not None or previous.source is not None):
+                previous.questions = None
 
         self.current_company_name = new_company_name
         self.current_company_name_var.set(new_company_name)
 
         self._clear_notebook()
 
-        questions_data = self.all_companies_data.get(new_company_name, [])
+        company = self.all_companies_data[new_company_name]
+        questions_data = self._get_questions(new_company_name)
+        if company.questions is None:
+            company.questions = questions_data
         if questions_data:
+            # 자리표시자 탭만 만들고, 위젯은 선택된(마지막) 탭 하나만 생성
             for data in questions_data:
-                self.add_question_tab(initial_data=data, initial_title=data.get('제목'))
+                self.add_question_tab(initial_data=data, initial_title=data.title, lazy=True)
+            self.notebook.select(self.notebook.tabs()[-1])
         else:
             self.add_question_tab()
 
         self._set_controls_state(True)
 
-    def add_question_tab(self, initial_data=None, initial_title=None):
-        """새로운 문항 탭을 추가하고 데이터를 로드합니다."""
+    def add_question_tab(self, initial_data=None, initial_title=None, lazy=False):
+        """새로운 문항 탭을 추가하고 데이터를 로드합니다. lazy이면 자리표시자 탭만 추가합니다."""
         if not self.current_company_name:
             messagebox.showwarning("선택 오류", "먼저 편집할 회사를 선택하거나 추가해주세요.")
             return
@@ -657,13 +1494,38 @@ class Application(tk.Tk):
 
         self.question_counter = len(self.notebook.tabs()) + 1  # 실제 탭 개수 기반으로 카운트
 
-        frame = QuestionFrame(self.notebook, self.question_counter, initial_title, initial_data)
+        if lazy:
+            placeholder = LazyQuestionTab(self.notebook, self.question_counter, initial_title, initial_data)
+            self.notebook.add(placeholder, text=placeholder.title_var.get())
+            return
+
+        frame = self._acquire_question_frame(self.question_counter, initial_title, initial_data)
 
         tab_name = frame.title_var.get()
         self.notebook.add(frame, text=tab_name)
 
         self.notebook.select(frame)
 
+    @timed("materialize_tab")
+    def _on_tab_changed(self, event=None):
+        """선택된 탭이 자리표시자이면 그 자리에서 QuestionFrame으로 교체합니다."""
+        selected_tab_id = self.notebook.select()
+        if not selected_tab_id:
+            return
+
+        placeholder = self.nametowidget(selected_tab_id)
+        if not isinstance(placeholder, LazyQuestionTab):
+            return
+
+        frame = self._acquire_question_frame(
+            placeholder.question_number, placeholder.title_var.get(), placeholder.initial_data)
+
+        # 새 프레임을 같은 위치에 넣고 선택한 뒤 자리표시자를 제거 (다른 탭이 선택되지 않도록)
+        self.notebook.insert(self.notebook.index(placeholder), frame, text=frame.title_var.get())
+        self.notebook.select(frame)
+        self.notebook.forget(placeholder)
+        placeholder.destroy()
+
     def remove_question_tab(self):
         """현재 선택된 문항 탭을 제거하고, 남은 탭들의 번호를 재조정합니다."""
         if not self.notebook.tabs():
@@ -674,9 +1536,9 @@ class Application(tk.Tk):
             return
 
         current_frame = self.nametowidget(selected_tab_id)
-        data = current_frame.get_data()
+        data = current_frame.to_question()
 
-        content_is_empty = not (data['질문'] or data['답변'] or data['문항유형'])
+        content_is_empty = not (data.question or data.answer or data.type)
 
         should_remove = True
         if not content_is_empty:
@@ -687,13 +1549,14 @@ class Application(tk.Tk):
 
         if should_remove:
             self.notebook.forget(selected_tab_id)
+            self._release_question_frame(current_frame)
 
             # 남은 탭들의 번호 및 제목 업데이트
             for i, tab_id in enumerate(self.notebook.tabs()):
                 frame = self.nametowidget(tab_id)
                 new_number = i + 1
 
-                if isinstance(frame, QuestionFrame):
+                if isinstance(frame, (QuestionFrame, LazyQuestionTab)):
                     frame.update_question_number(new_number)
                     self.notebook.tab(tab_id, text=frame.title_var.get())
 
@@ -703,101 +1566,109 @@ class Application(tk.Tk):
 
     def _parse_file_content(self, content):
         """구조화된 파일 내용을 파싱하여 {회사명: [문항 데이터 리스트]} 형식으로 반환합니다."""
-        parsed_data = {}
-        current_company = None
-        current_question = None
-
-        lines = content.strip().split('\n')
-
-        in_answer_section = False
+        return self._parse_lines(io.StringIO(content))
 
-        for line in lines:
-            line = line.strip()
+    def _parse_lines(self, lines):
+        """줄 단위 입력을 스트리밍 파싱하여 {회사명: [문항 데이터 리스트]} 형식으로 모읍니다."""
+        return parse_companies(lines)
 
-            if not line and current_question:
-                # 내용(질문/답변) 섹션에서 빈 줄은 포함
-                if not in_answer_section:
-                    current_question['질문'] += '\n'
-                else:
-                    current_question['답변'] += '\n'
-                continue
-
-            if line.startswith('[회사명]:'):
-                current_company = line.split(':', 1)[1].strip()
-                in_answer_section = False
-                current_question = None
-
-                if current_company not in parsed_data:
-                    parsed_data[current_company] = []
-
-            elif line == '--- 문항 시작 ---':
-                current_question = {"제목": "제목 없음", "질문": "", "답변": "", "문항유형": ""}
-                in_answer_section = False
-
-            elif line.startswith('<<제목>>:') and current_question:
-                current_question['제목'] = line.split(':', 1)[1].strip()
-            elif line.startswith('<<유형>>:') and current_question:
-                current_question['문항유형'] = line.split(':', 1)[1].strip()
-
-            elif line == '<<질문>>' and current_question:
-                in_answer_section = False
-            elif line == '<<답변>>' and current_question:
-                in_answer_section = True
-
-            elif line == '--- 문항 끝 ---' and current_company and current_question:
-                parsed_data[current_company].append(current_question)
-                current_question = None
-                in_answer_section = False
-
-            elif current_question:
-                # 질문/답변 내용 추가 (공백 줄은 위에서 처리했으므로 내용만 추가)
-                if not in_answer_section:
-                    current_question['질문'] += line + '\n'
-                else:
-                    current_question['답변'] += line + '\n'
-
-        # 최종 정리 및 끝 공백/개행 제거
-        for company, questions in parsed_data.items():
-            for q in questions:
-                q['질문'] = q['질문'].strip()
-                q['답변'] = q['답변'].strip()
-
-        return parsed_data
+    def _names_to_save(self, company_name=None):
+        """저장할 회사명 목록을 반환합니다. company_name이 있으면 그 회사만 반환합니다."""
+        if company_name and company_name in self.all_companies_data:
+            return [company_name]
+        return list(self.all_companies_data)
 
+    @timed("format_data")
     def _format_data(self, company_name=None):
         """특정 회사(company_name) 또는 전체 회사 데이터를 구조화된 텍스트 형식으로 포맷합니다."""
 
         # 항상 현재 작업 내용을 저장
         self.save_current_company_data()
 
-        formatted_text = ""
-
-        # 저장할 회사 목록 결정
-        if company_name and company_name in self.all_companies_data:
-            companies_to_save = {company_name: self.all_companies_data[company_name]}
-        else:
-            companies_to_save = self.all_companies_data
-
-        for name, questions in companies_to_save.items():
-
-            formatted_text += f"[회사명]: {name}\n"
-
-            for data in questions:
-                formatted_text += "--- 문항 시작 ---\n"
-                formatted_text += f"<<제목>>: {data.get('제목', '제목 없음')}\n"
-                formatted_text += f"<<유형>>: {data.get('문항유형', '')}\n"
-
-                formatted_text += "<<질문>>\n"
-                formatted_text += f"{data.get('질문', '')}\n"
-
-                formatted_text += "<<답변>>\n"
-                formatted_text += f"{data.get('답변', '')}\n"
-
-                formatted_text += "--- 문항 끝 ---\n"
-
-            formatted_text += "=== 회사 끝 ===\n\n"
-
-        return formatted_text.strip()
+        buffer = io.StringIO()
+        write_blocks(buffer, map(self._company_block, self._names_to_save(company_name)))
+        return buffer.getvalue()
+
+    def _save_task(self, file_path, entries):
+        """스냅샷 항목을 파일 확장자에 맞는 형식(텍스트/SQLite/아카이브)으로 기록하는 (제목, 작업 함수)를 만듭니다."""
+        if is_sqlite_path(file_path):
+            return "SQLite 파일 저장", self._sql_export_job(file_path, entries)
+        if is_archive_path(file_path):
+            return "아카이브 파일 저장", self._archive_save_job(file_path, entries)
+        if is_json_path(file_path):
+            return "JSON 파일 저장", self._json_save_job(file_path, entries)
+        return "텍스트 파일 저장", self._text_save_job(file_path, entries)
+
+    def _start_save(self, file_path, on_done, on_error, company_name=None, attach_journal=False):
+        """회사 데이터를 작업 스레드에서 파일로 기록합니다.
+
+        attach_journal이면 저장한 파일을 본 파일로 삼아 편집 저널을 새로 시작합니다. (저장 중 편집한 회사는 저널에 기록)
+        """
+        # 항상 현재 작업 내용을 저장한 뒤, 그 시점의 스냅샷을 기록
+        self.save_current_company_data()
+        entries = self._snapshot_companies(self._names_to_save(company_name))
+        title, save = self._save_task(file_path, entries)
+
+        if attach_journal:
+            versions = {name: version for name, version, _ in entries}
+
+            def on_saved(result, on_done=on_done):
+                self._attach_journal(file_path, lambda name, company: versions.get(name) == company.version,
+                                     versions, reset=True)
+                on_done(result)
+            on_done = on_saved
+        self.run_job(title, save, on_done, on_error)
+
+    def _text_save_job(self, file_path, entries):
+        """텍스트 파일 기록 작업: 바뀐 회사만 다시 포맷하고 나머지는 캐시 블록을 씁니다."""
+        @timed("write_text_file")
+        def write_text_file(job):
+            blocks = (self._snapshot_block(*entry) for entry in job.iterate(entries))
+            atomic_write_text(file_path, lambda f: write_blocks(f, blocks))
+        return write_text_file
+
+    def _archive_save_job(self, file_path, entries):
+        """아카이브 파일 기록 작업: 회사마다 레코드 하나를 압축해 기록합니다. (지원 정보는 화면 스레드에서 모아 둠)"""
+        infos = {company_name: self.all_companies_data[company_name].info() for company_name, _, _ in entries}
+
+        def write_archive(job):
+            companies = ((company_name, questions() if callable(questions) else questions)
+                         for company_name, version, questions in job.iterate(entries))
+            return write_archive_file(file_path, companies, infos)
+        return write_archive
+
+    def _json_save_job(self, file_path, entries):
+        """Jasoser.html JSON 기록 작업: 지원 정보(상태/날짜/id)는 화면 스레드에서 스냅샷과 함께 모아 둡니다.
+
+        지원 id가 없거나(텍스트 등에서 읽은 회사) 다른 회사와 겹치면(둘 다 유지) 새 id를 붙여 두어,
+        다음 내보내기에서도 같은 id를 씁니다.
+        """
+        infos = {}
+        app_ids = set()
+        for company_name, _, _ in entries:
+            company = self.all_companies_data[company_name]
+            if company.app_id is None or company.app_id in app_ids:
+                company.app_id = new_json_app_id()
+            app_ids.add(company.app_id)
+            infos[company_name] = company.info()
+
+        def write_json(job):
+            companies = ((company_name, questions() if callable(questions) else questions, infos[company_name])
+                         for company_name, version, questions in job.iterate(entries))
+            return write_json_file(file_path, companies)
+        return write_json
+
+    def _sql_export_job(self, file_path, entries):
+        """SQLite 내보내기 작업: 파일에 저장된 해시와 비교해 바뀐 회사만 갱신합니다.
+
+        취소되면 하나의 트랜잭션 전체가 롤백되어 기존 파일은 그대로 남습니다.
+        """
+        def export(job):
+            companies = ((company_name, self._snapshot_digest(company_name, version, questions),
+                          questions if callable(questions) else (lambda questions=questions: questions))
+                         for company_name, version, questions in job.iterate(entries))
+            return export_companies_sql(file_path, companies)
+        return export
 
     # 1. 현재 회사 저장 (단일 텍스트)
     def save_current_company_to_file(self):
@@ -806,24 +1677,22 @@ class Application(tk.Tk):
             messagebox.showwarning("저장 불가", "먼저 저장할 회사를 선택해주세요.")
             return
 
-        formatted_data = self._format_data(company_name=self.current_company_name)
-
-        initial_filename = f"{self.current_company_name}_문항.txt"
+        company_name = self.current_company_name
+        initial_filename = f"{company_name}_문항.txt"
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
             initialfile=initial_filename,
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            title=f"'{self.current_company_name}' 문항 내용을 저장합니다."
+            title=f"'{company_name}' 문항 내용을 저장합니다."
         )
 
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_data)
-                messagebox.showinfo("저장 완료", f"'{self.current_company_name}' 데이터가 성공적으로 저장되었습니다:\n{file_path}")
-            except Exception as e:
-                messagebox.showerror("저장 오류", f"파일 저장 중 오류가 발생했습니다: {e}")
+            self._start_save(
+                file_path,
+                lambda result: messagebox.showinfo("저장 완료", f"'{company_name}' 데이터가 성공적으로 저장되었습니다:\n{file_path}"),
+                lambda e: messagebox.showerror("저장 오류", f"파일 저장 중 오류가 발생했습니다: {e}"),
+                company_name=company_name)
 
     # 2. 전체 회사를 다른 이름으로 저장 (기존 new_save 대체)
     def save_all_companies_as(self):
@@ -832,8 +1701,6 @@ class Application(tk.Tk):
             messagebox.showwarning("저장 불가", "저장할 회사 데이터가 없습니다.")
             return
 
-        formatted_data = self._format_data()
-
         initial_filename = "자소서_통합본.txt"
         if self.current_company_name:
             initial_filename = f"{self.current_company_name}_통합본.txt"
@@ -841,21 +1708,21 @@ class Application(tk.Tk):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
             initialfile=initial_filename,
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            title="모든 회사 문항 내용을 새 파일로 저장합니다."
+            filetypes=[("Text files", "*.txt"), ("자소서 아카이브", "*.sia"), ("Jasoser JSON", "*.json"),
+                       ("All files", "*.*")],
+            title="모든 회사 문항 내용을 새 파일로 저장합니다. (.sia는 압축 아카이브, .json은 웹 도구 형식)"
         )
 
         if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_data)
-
+            def on_done(result):
                 # 저장 성공 시 경로 업데이트
                 self.last_save_path = file_path
                 messagebox.showinfo("저장 완료", f"모든 회사 데이터가 새 파일에 성공적으로 저장되었습니다:\n{file_path}")
 
-            except Exception as e:
-                messagebox.showerror("저장 오류", f"파일 저장 중 오류가 발생했습니다: {e}")
+            self._start_save(
+                file_path, on_done,
+                lambda e: messagebox.showerror("저장 오류", f"파일 저장 중 오류가 발생했습니다: {e}"),
+                attach_journal=True)
 
     # 3. 전체 회사를 저장 (Ctrl+S)
     def save_all_companies(self):
@@ -866,14 +1733,20 @@ class Application(tk.Tk):
 
         if self.last_save_path and os.path.exists(self.last_save_path):
             # 저장 경로가 있고 파일이 존재하면 덮어쓰기
-            try:
-                formatted_data = self._format_data()
-                with open(self.last_save_path, 'w', encoding='utf-8') as f:
-                    f.write(formatted_data)
-                messagebox.showinfo("저장 완료", f"현재 데이터가 다음 파일에 덮어쓰기 저장되었습니다:\n{self.last_save_path}")
-            except Exception as e:
+            file_path = self.last_save_path
+
+            def on_error(e):
                 messagebox.showerror("저장 오류", f"파일 덮어쓰기 중 오류가 발생했습니다: {e}")
-                self.last_save_path = None  # 저장 실패 시 경로 초기화
+                if self.last_save_path == file_path:
+                    self.last_save_path = None  # 저장 실패 시 경로 초기화
+
+            on_done = (lambda result: messagebox.showinfo(
+                "저장 완료", f"현재 데이터가 다음 파일에 덮어쓰기 저장되었습니다:\n{file_path}"))
+            # 편집 저널을 쓰는 중이면 변경은 이미 기록되어 있으므로, 저장은 저널을 본 파일에 합치는 것입니다.
+            if self.journal is not None and self.journal.main_path == os.path.abspath(file_path):
+                self._fold_journal(on_done, on_error)
+            else:
+                self._start_save(file_path, on_done, on_error, attach_journal=True)
         else:
             # 경로가 없거나 유효하지 않으면 '다른 이름으로 저장' 실행
             self.save_all_companies_as()
@@ -894,85 +1767,434 @@ class Application(tk.Tk):
             title="모든 회사 데이터를 SQLite 파일로 내보냅니다."
         )
 
-        if file_path:
-            try:
-                conn = sqlite3.connect(file_path)
-                cursor = conn.cursor()
-
-                # 테이블 생성 (기존 테이블이 있다면 삭제 후 재생성)
-                cursor.execute("DROP TABLE IF EXISTS questions")
-                cursor.execute("""
-                               CREATE TABLE questions
-                               (
-                                   id               INTEGER PRIMARY KEY AUTOINCREMENT,
-                                   company_name     TEXT NOT NULL,
-                                   question_title   TEXT,
-                                   question_type    TEXT,
-                                   question_content TEXT,
-                                   answer_content   TEXT
-                               )
-                               """)
-
-                # 데이터 삽입
-                for company_name, questions in self.all_companies_data.items():
-                    for q_data in questions:
-                        cursor.execute("""
-                                       INSERT INTO questions (company_name, question_title, question_type,
-                                                              question_content, answer_content)
-                                       VALUES (?, ?, ?, ?, ?)
-                                       """, (
-                                           company_name,
-                                           q_data.get('제목', '제목 없음'),
-                                           q_data.get('문항유형', ''),
-                                           q_data.get('질문', ''),
-                                           q_data.get('답변', '')
-                                       ))
-
-                conn.commit()
-                conn.close()
+        if not file_path:
+            return
+
+        def on_done(result):
+            changed, incremental = result
+            if incremental:
+                messagebox.showinfo("내보내기 완료",
+                                    f"기존 SQLite 파일에 변경된 {changed}개 회사의 데이터만 반영했습니다:\n{file_path}")
+            else:
                 messagebox.showinfo("내보내기 완료", f"데이터가 SQLite 파일에 성공적으로 저장되었습니다:\n{file_path}")
 
-            except Exception as e:
-                messagebox.showerror("SQL 내보내기 오류", f"데이터베이스 저장 중 오류가 발생했습니다: {e}")
+        self.run_job("SQL 파일로 내보내기", self._sql_export_job(file_path, self._snapshot_companies()), on_done,
+                     lambda e: messagebox.showerror("SQL 내보내기 오류", f"데이터베이스 저장 중 오류가 발생했습니다: {e}"))
+
+    # 5. Jasoser.html JSON으로 내보내기
+    def export_to_json(self):
+        """모든 회사 데이터를 웹 도구(Jasoser.html)에서 불러올 수 있는 JSON 파일로 내보냅니다."""
+        if not self.all_companies_data:
+            messagebox.showwarning("내보내기 불가", "내보낼 데이터가 없습니다.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            initialfile="project_data.json",
+            filetypes=[("Jasoser JSON", "*.json"), ("All files", "*.*")],
+            title="모든 회사 데이터를 Jasoser.html JSON 파일로 내보냅니다."
+        )
+
+        if file_path:
+            self._start_save(
+                file_path,
+                lambda result: messagebox.showinfo("내보내기 완료", f"데이터가 JSON 파일에 성공적으로 저장되었습니다:\n{file_path}"),
+                lambda e: messagebox.showerror("JSON 내보내기 오류", f"JSON 파일 저장 중 오류가 발생했습니다: {e}"))
+
+    # SQLite 저장소 열기 (실시간 저장 모드)
+    def open_document_store(self):
+        """SQLite 저장소 파일을 열거나 새로 만들고, 이후 모든 편집을 저장소에 바로 기록합니다."""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".sqlite",
+            initialfile="jaesoseo_store.sqlite",
+            filetypes=[("SQLite Database", "*.sqlite"), ("All files", "*.*")],
+            title="열거나 새로 만들 SQLite 저장소 파일을 선택하세요.",
+            confirmoverwrite=False
+        )
+
+        if not file_path:
+            return
+
+        self.save_current_company_data()
+
+        # 현재 목록을 새 저장소로 옮길지 확인
+        carry_over = False
+        if self.all_companies_data:
+            carry_over = messagebox.askyesnocancel(
+                "저장소 열기",
+                "현재 목록의 회사 데이터를 저장소에 함께 저장할까요?\n('아니요'를 선택하면 현재 목록은 닫힙니다.)"
+            )
+            if carry_over is None:
+                return
+
+        try:
+            store = DocumentStore(file_path)
+        except Exception as e:
+            messagebox.showerror("저장소 오류", f"SQLite 저장소를 여는 중 오류가 발생했습니다: {e}")
+            return
+
+        try:
+            if carry_over:
+                for company_name, questions in self._iter_company_items():
+                    store.save_company(company_name, questions)
+        except Exception as e:
+            store.close()
+            messagebox.showerror("저장소 오류", f"회사 데이터를 저장소에 기록하는 중 오류가 발생했습니다: {e}")
+            return
+
+        if self.document_store is not None:
+            self.document_store.close()
+        self._detach_journal()
+        self.document_store = store
+
+        # 회사 목록만 불러오고, 문항은 회사를 선택할 때 읽습니다.
+        self.all_companies_data = {company_name: Company(company_name) for company_name in store.company_names()}
+        self.company_index = SortedNameIndex(self.all_companies_data)
+        with self._cache_lock:
+            self._block_cache.clear()
+            self._digest_cache.clear()
+        self.search_index = NgramIndex()
+
+        self.current_company_name = None
+        self.current_company_name_var.set("회사를 선택하거나 추가해주세요.")
+        self._clear_notebook()
+        self._set_controls_state(False)
+        self._update_treeview()
+        self.status_var.set(f"SQLite 저장소: {file_path}")
+
+        if self.company_tree.get_children():
+            self._select_company(self.company_tree.get_children()[0])
+            self.load_company_data(None)
 
     # 1. 텍스트 파일 불러오기
     def load_text_file(self):
-        """파일을 열어 데이터를 파싱하고 회사 목록에 추가/갱신합니다."""
+        """여러 텍스트/SQLite/아카이브 파일을 골라 병렬로 읽고, 내용 해시로 비교해 회사 목록에 병합합니다."""
+        file_paths = filedialog.askopenfilenames(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("SQLite Database", "*.sqlite"), ("자소서 아카이브", "*.sia"),
+                       ("Jasoser JSON", "*.json"), ("All files", "*.*")],
+            title="불러올 자소서 파일을 선택하세요. (여러 개 선택 가능, Jasoser.html의 project_data.json 포함)"
+        )
+
+        if file_paths:
+            self._start_import(list(file_paths))
+
+    def _start_import(self, file_paths):
+        """파일들을 작업 프로세스에서 나눠 읽고(회사별 내용 해시 포함), 끝나면 화면 스레드에서 병합합니다."""
+        # 가져온 회사와 비교할 기존 회사의 스냅샷 (해시 계산은 작업 스레드에서)
+        self.save_current_company_data()
+        entries = {entry[0]: entry for entry in self._snapshot_companies()}
+
+        def import_files(job):
+            loaded = []
+            failed = []
+            job.progress(0, len(file_paths))
+            # 파일이 하나면 이 작업 스레드에서 읽으므로 읽은 바이트 수로 진행률을 보고하고 도중에 취소할 수 있습니다.
+            read = (functools.partial(read_company_digests, progress=job.progress) if len(file_paths) == 1
+                    else read_company_digests)
+            results = run_tasks(read, file_paths, self.IMPORT_PROCESSES)
+            try:
+                for done, (file_path, companies, error) in enumerate(results, 1):
+                    if error is not None:
+                        failed.append((file_path, error))
+                    else:
+                        loaded.append((file_path, companies))
+                    job.progress(done, len(file_paths))
+            finally:
+                results.close()  # 취소되면 남은 파일은 읽지 않음
+
+            # 파일 하나를 불러오면 그 파일의 편집 저널(이전 세션에서 본 파일에 합치지 못한 변경)을 먼저 재생합니다.
+            journal_records = []
+            if len(file_paths) == 1 and loaded and self.document_store is None:
+                journal_records = EditJournal(file_paths[0]).read_records()
+                if journal_records:
+                    loaded[0] = (file_paths[0], replay_journal(loaded[0][1], journal_records))
+
+            names = {company[0] for _, companies in loaded for company in companies}
+            existing = {company_name: (entries[company_name][1], self._snapshot_digest(*entries[company_name]))
+                        for company_name in names if company_name in entries}
+            return loaded, failed, existing, len(journal_records)
+
+        self.run_job("파일 불러오기", import_files, lambda result: self._apply_import(file_paths, *result),
+                     lambda e: messagebox.showerror("불러오기 오류", f"파일을 읽거나 파싱하는 중 오류가 발생했습니다: {e}"))
+
+    @timed("apply_import")
+    def _apply_import(self, file_paths, loaded, failed, existing, replayed=0):
+        """읽어온 회사를 기존 데이터와 내용 해시로 비교해 병합합니다.
+
+        없는 회사는 추가하고, 내용이 같은 회사는 건너뛰며, 이름은 같지만 내용이 다른 회사는 덮어쓰지 않고
+        충돌 확인 창에 모읍니다. Treeview는 병합이 끝난 뒤 한 번만 갱신합니다.
+        파일 하나를 불러오면 그 파일의 남은 편집 저널을 메모리에만 재생합니다. (replayed: 재생한 저널 기록 수)
+        편집 저널은 불러올 때가 아니라 사용자가 그 파일에 직접 저장할 때 붙입니다.
+        """
+        self.save_current_company_data()
+        digests = {}
+        added = {}
+        infos = {}
+        info_updates = {}
+        conflicts = []  # [(회사명, 파일 경로, [Question, ...], 지원 정보), ...]
+        skipped = 0
+
+        def known_digest(company_name):
+            """이미 있는 회사의 내용 해시 (불러오는 동안 편집된 회사는 다시 계산), 없으면 None"""
+            if company_name not in digests:
+                company = self.all_companies_data.get(company_name)
+                if company is None:
+                    return None
+                cached = existing.get(company_name)
+                if cached is not None and cached[0] == company.version:
+                    digests[company_name] = cached[1]
+                else:
+                    digests[company_name] = self._snapshot_digest(*self._snapshot_entry(company_name))
+            return digests[company_name]
+
+        for file_path, companies in loaded:
+            for company_name, digest, rows, info in companies:
+                current = known_digest(company_name)
+                if current is None:
+                    added[company_name] = [Question(*row) for row in rows]
+                    infos[company_name] = info
+                    digests[company_name] = digest
+                elif current == digest:
+                    skipped += 1
+                    # 문항은 같고 지원 상태/날짜만 바뀐 회사 (JSON)
+                    if info is not None:
+                        if company_name in added:
+                            infos[company_name] = info
+                        elif info != self.all_companies_data[company_name].info():
+                            info_updates[company_name] = info
+                else:
+                    conflicts.append((company_name, file_path, [Question(*row) for row in rows], info))
+
+        failed_details = "".join(f"\n- {os.path.basename(file_path)}: {error}" for file_path, error in failed)
+        if not added and not skipped and not conflicts:
+            messagebox.showwarning("파싱 오류", "파일에서 유효한 회사 및 문항 데이터를 찾을 수 없습니다." + failed_details)
+            return
+
+        # 파일 하나를 불러오면 저장 경로가 그 파일로 바뀌므로, 가져온 회사를 이전 본 파일의 저널에 기록하지 않습니다.
+        # (새 파일에는 저널을 붙이지 않으며, 그 파일에 직접 저장할 때 새로 시작합니다.)
+        single_file = len(file_paths) == 1 and not failed
+        if single_file:
+            self._detach_journal()
+
+        if added:
+            self._merge_imported_companies(added, infos)
+        for company_name, info in info_updates.items():
+            company = self.all_companies_data[company_name]
+            company.set_info(info)
+            # 저장소에는 지원 정보를 기록하지 않으므로, 그 밖의 경우에만 변경으로 기록합니다.
+            if self.document_store is None:
+                company.questions = self._get_questions(company_name)
+                self._touch_company(company_name)
+
+        # 불러오기 성공 시 last_save_path 설정 (파일 하나를 불러온 경우)
+        if single_file:
+            self.last_save_path = file_paths[0]
+
+        message = (f"파일 {len(loaded)}개에서 회사 {len(added) + skipped + len(conflicts)}개를 읽었습니다.\n"
+                   f"- 새로 추가: {len(added)}개\n"
+                   f"- 내용이 같아 건너뜀: {skipped}개\n"
+                   f"- 내용이 달라 확인 필요: {len(conflicts)}개")
+        if replayed:
+            message += (f"\n\n이전에 파일에 저장하지 못한 편집 {replayed}건을 편집 저널에서 복구했습니다."
+                        "\n파일에는 아직 반영되지 않았으므로 확인 후 저장하세요.")
+        if failed:
+            message += f"\n\n읽지 못한 파일 {len(failed)}개:" + failed_details
+        messagebox.showinfo("불러오기 완료", message)
+
+        if conflicts:
+            self.open_import_conflicts(conflicts)
+
+        if not self.current_company_name:
+            first_name = next(iter(added), None) or (conflicts[0][0] if conflicts else None)
+            if first_name in self.all_companies_data:
+                self._select_company(first_name)
+                self.load_company_data(None)
+
+    def _unique_company_name(self, base_name, reserved=()):
+        """기존 회사명, reserved와 겹치지 않는 회사명을 만듭니다."""
+        company_name = base_name
+        number = 2
+        while company_name in self.all_companies_data or company_name in reserved:
+            company_name = f"{base_name} {number}"
+            number += 1
+        return company_name
+
+    def open_import_conflicts(self, conflicts):
+        """이름은 같지만 내용이 다른 가져온 회사를 바꾸기/둘 다 유지/기존 유지 중에서 고르는 창을 엽니다.
+
+        고르지 않고 창을 닫으면 남은 항목은 데이터가 사라지지 않도록 다른 이름으로 추가합니다.
+        """
+        popup = tk.Toplevel(self)
+        popup.title("가져오기 충돌 확인")
+        popup.transient(self)
+        popup.grab_set()
+        popup.geometry("640x360")
+
+        popup_frame = ttk.Frame(popup, padding="10")
+        popup_frame.pack(expand=True, fill="both")
+
+        ttk.Label(popup_frame, text="같은 이름의 회사가 이미 있지만 내용이 다릅니다. 항목을 선택해 처리 방법을 고르세요.\n"
+                                    "창을 닫으면 남은 항목은 다른 이름으로 추가됩니다.").pack(anchor="w", pady=(0, 10))
+
+        tree_frame = ttk.Frame(popup_frame)
+        tree_frame.pack(fill="both", expand=True)
+        tree_scroll = ttk.Scrollbar(tree_frame)
+        tree_scroll.pack(side="right", fill="y")
+        tree = ttk.Treeview(tree_frame, columns=("company", "file", "existing", "incoming"), show="headings",
+                            yscrollcommand=tree_scroll.set, selectmode='extended')
+        tree_scroll.config(command=tree.yview)
+        for column, heading, width in (("company", "회사 이름", 200), ("file", "가져온 파일", 200),
+                                       ("existing", "기존 문항 수", 90), ("incoming", "가져온 문항 수", 90)):
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, stretch=(column in ("company", "file")))
+        tree.pack(side="left", fill="both", expand=True)
+
+        for i, (company_name, file_path, questions, info) in enumerate(conflicts):
+            tree.insert("", "end", iid=str(i), values=(company_name, os.path.basename(file_path),
+                                                       len(self._get_questions(company_name)), len(questions)))
+
+        def resolve(action, iids=None):
+            """선택한(또는 iids) 항목을 처리합니다. action: 'replace', 'keep_both', 'discard'"""
+            iids = list(tree.selection() if iids is None else iids)
+            if not iids:
+                return
+            new_data = {}
+            infos = {}
+            for iid in iids:
+                company_name, file_path, questions, info = conflicts[int(iid)]
+                if action == 'replace':
+                    new_data.pop(company_name, None)
+                    new_data[company_name] = questions
+                elif action == 'keep_both':
+                    base_name = f"{company_name} ({os.path.splitext(os.path.basename(file_path))[0]})"
+                    company_name = self._unique_company_name(base_name, new_data)
+                    new_data[company_name] = questions
+                infos[company_name] = info
+                tree.delete(iid)
+            if new_data:
+                self._merge_imported_companies(new_data, infos)
+            if not tree.get_children():
+                popup.destroy()
+
+        def on_close(event=None):
+            resolve('keep_both', tree.get_children())
+            if popup.winfo_exists():
+                popup.destroy()
+
+        button_frame = ttk.Frame(popup_frame)
+        button_frame.pack(fill="x", pady=(10, 0))
+        ttk.Button(button_frame, text="가져온 내용으로 바꾸기", command=lambda: resolve('replace')).pack(side="left")
+        ttk.Button(button_frame, text="둘 다 유지 (다른 이름으로 추가)",
+                   command=lambda: resolve('keep_both')).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="기존 내용 유지", command=lambda: resolve('discard')).pack(side="left")
+        ttk.Button(button_frame, text="닫기", command=on_close).pack(side="right")
+
+        popup.bind('<Escape>', on_close)
+        popup.protocol("WM_DELETE_WINDOW", on_close)
+        self.wait_window(popup)
+
+    def open_text_archive(self):
+        """큰 텍스트/아카이브 파일의 회사 목록만 읽고, 문항은 회사를 선택할 때 파일에서 읽습니다.
+
+        텍스트 파일은 회사 경계를 색인하고, 아카이브 파일은 파일 안의 디렉터리만 읽습니다.
+        """
         file_path = filedialog.askopenfilename(
             defaultextension=".txt",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-            title="불러올 자소서 텍스트 파일을 선택하세요."
+            filetypes=[("Text files", "*.txt"), ("자소서 아카이브", "*.sia"), ("All files", "*.*")],
+            title="열 자소서 텍스트/아카이브 파일을 선택하세요."
         )
 
         if not file_path:
             return
 
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            new_data = self._parse_file_content(content)
+        # 저장소 모드에서는 모든 회사가 저장소에 기록되어야 하므로 일반 불러오기와 같이 병합합니다.
+        if self.document_store is not None:
+            messagebox.showinfo("대용량 텍스트 열기", "SQLite 저장소 모드에서는 파일 전체를 읽어 저장소에 병합합니다.")
+            self._start_import([file_path])
+            return
+        # JSON은 회사 경계를 색인할 수 없으므로 스트리밍으로 한 번 읽어 병합합니다.
+        if is_json_path(file_path):
+            self._start_import([file_path])
+            return
 
-            if not new_data:
-                messagebox.showwarning("파싱 오류", "파일에서 유효한 회사 및 문항 데이터를 찾을 수 없습니다.")
+        def on_done(archive):
+            company_names = archive.company_names()
+            if not company_names:
+                messagebox.showwarning("파싱 오류", "파일에서 유효한 회사 데이터를 찾을 수 없습니다.")
                 return
 
-            # 기존 데이터에 불러온 데이터 병합 (동일 회사명은 덮어씀)
-            self.all_companies_data.update(new_data)
+            # 편집 중인 회사를 반영하고 닫은 뒤, 같은 이름의 회사는 파일 내용으로 바꿉니다. (동일 회사명은 덮어씀)
+            self.save_current_company_data()
+            self._close_current_company()
+
+            for company_name in company_names:
+                company = self.all_companies_data.get(company_name)
+                if company is None:
+                    company = self.all_companies_data[company_name] = Company(company_name)
+                company.questions = None
+                company.set_info(archive.company_info(company_name))
+                self._touch_company(company_name)
+                company.source = archive
             self._update_treeview()
 
-            # 불러오기 성공 시 last_save_path 설정
+            # 이전 세션에서 본 파일에 저장하지 못한 편집을 메모리에만 재생합니다. (파일에는 저장할 때 반영)
             self.last_save_path = file_path
+            self._detach_journal()
+            journal_records = EditJournal(file_path).read_records()
+            self._replay_journal(journal_records)
+
+            how = "저장된 색인 사용" if archive.index_from_cache else "색인 생성"
+            recovered = f", 편집 저널 {len(journal_records)}건 복구" if journal_records else ""
+            self.status_var.set(f"필요할 때 읽기: {os.path.basename(file_path)} "
+                                f"(회사 {len(company_names)}개, {how}{recovered})")
+            company_names = [company_name for company_name in company_names if company_name in self.all_companies_data]
+            if not company_names:
+                return
 
-            messagebox.showinfo("불러오기 완료", f"총 {len(new_data)}개의 회사 데이터를 성공적으로 불러왔습니다.")
-
-            first_company = next(iter(new_data))
-            self.company_tree.selection_set(first_company)
-            self.company_tree.focus(first_company)
+            self._select_company(company_names[0])
             self.load_company_data(None)
 
-        except Exception as e:
-            messagebox.showerror("불러오기 오류", f"파일을 읽거나 파싱하는 중 오류가 발생했습니다: {e}")
+        if is_archive_path(file_path):
+            title, open_archive = "아카이브 파일 열기", lambda job: BinaryArchive(file_path)
+        else:
+            title, open_archive = "대용량 텍스트 파일 색인", lambda job: TextArchive(file_path, job.progress)
+        self.run_job(title, open_archive, on_done,
+                     lambda e: messagebox.showerror("불러오기 오류", f"파일을 색인하는 중 오류가 발생했습니다: {e}"))
+
+    def _close_current_company(self):
+        """편집 중인 회사를 닫고 문항 탭을 비웁니다. (내용은 먼저 save_current_company_data로 반영해야 함)"""
+        self.current_company_name = None
+        self.current_company_name_var.set("회사를 선택하거나 추가해주세요.")
+        self._clear_notebook()
+        self._set_controls_state(False)
+
+    def _merge_imported_companies(self, new_data, infos=None):
+        """불러온 회사 데이터를 기존 데이터에 병합하고 목록을 갱신합니다. (동일 회사명은 덮어씀)
+
+        infos({회사명: 지원 정보})에 있는 회사는 지원 상태/날짜도 함께 바꿉니다.
+        """
+        # 불러오는 동안 편집한 내용을 반영하고, 편집 중인 회사가 덮어써지면 탭이 옛 내용을 보여주지 않도록 닫습니다.
+        self.save_current_company_data()
+        if self.current_company_name in new_data:
+            self._close_current_company()
+
+        # 회사마다 따로 기록하지 않고 한 번에 반영합니다. (검색 색인은 다음 검색 때 작업 스레드에서 만듦)
+        for company_name, questions in new_data.items():
+            company = self.all_companies_data.get(company_name)
+            if company is None:
+                company = self.all_companies_data[company_name] = Company(company_name)
+            company.questions = questions
+            if infos is not None and company_name in infos:
+                company.set_info(infos[company_name])
+        self._touch_companies(list(new_data))
+
+        # 저장소 모드에서는 저장소에 기록한 뒤 메모리에서 내립니다.
+        if self.document_store is not None:
+            for company_name in new_data:
+                if company_name != self.current_company_name:
+                    self.all_companies_data[company_name].questions = None
+        self._update_treeview()
 
     # 2. SQL 파일로부터 추출하기
     def load_from_sql_file(self):
@@ -990,50 +2212,46 @@ class Application(tk.Tk):
             messagebox.showerror("파일 오류", "선택한 파일이 존재하지 않습니다.")
             return
 
-        try:
-            conn = sqlite3.connect(file_path)
-            cursor = conn.cursor()
+        # 변경 여부(내용 해시) 비교를 위해 현재 편집 내용을 먼저 반영하고, 그 시점의 스냅샷과 비교합니다.
+        self.save_current_company_data()
+        entries = {entry[0]: entry for entry in self._snapshot_companies()}
 
-            cursor.execute(
-                "SELECT company_name, question_title, question_type, question_content, answer_content FROM questions")
-            rows = cursor.fetchall()
-            conn.close()
+        def is_unchanged(company_name, digest):
+            """이미 불러온 회사의 내용 해시가 digest와 같은지 확인합니다. (가져오기 시 본문 읽기 생략)"""
+            entry = entries.get(company_name)
+            return entry is not None and self._snapshot_digest(*entry) == digest
 
-            if not rows:
+        def on_done(result):
+            new_data, unchanged_names = result
+            if not new_data and not unchanged_names:
                 messagebox.showwarning("데이터 없음", "선택한 데이터베이스 파일에 유효한 'questions' 테이블 데이터가 없습니다.")
                 return
 
-            new_data = {}
-            for row in rows:
-                company_name, title, q_type, question, answer = row
-
-                if company_name not in new_data:
-                    new_data[company_name] = []
+            # 기존 데이터에 불러온 데이터 병합 (내용이 같은 회사는 건너뜀)
+            if new_data:
+                self._merge_imported_companies(new_data)
 
-                new_data[company_name].append({
-                    "제목": title,
-                    "질문": question,
-                    "문항유형": q_type,
-                    "답변": answer
-                })
-
-            # 기존 데이터에 불러온 데이터 병합
-            self.all_companies_data.update(new_data)
-            self._update_treeview()
+            message = f"SQLite 파일에서 총 {len(new_data) + len(unchanged_names)}개의 회사 데이터를 성공적으로 추출했습니다."
+            if unchanged_names:
+                message += f"\n(내용이 같은 {len(unchanged_names)}개 회사는 건너뛰었습니다.)"
+            messagebox.showinfo("추출 완료", message)
 
-            messagebox.showinfo("추출 완료", f"SQLite 파일에서 총 {len(new_data)}개의 회사 데이터를 성공적으로 추출했습니다.")
+            first_name = next(iter(new_data), None) or unchanged_names[0]
+            if first_name in self.all_companies_data:
+                self._select_company(first_name)
+                self.load_company_data(None)
 
-            first_company = next(iter(new_data))
-            self.company_tree.selection_set(first_company)
-            self.company_tree.focus(first_company)
-            self.load_company_data(None)
+        def on_error(e):
+            if isinstance(e, sqlite3.OperationalError):
+                messagebox.showerror("DB 오류", f"데이터베이스 구조 오류: 'questions' 테이블을 찾을 수 없거나 형식이 올바르지 않습니다.\n{e}")
+            else:
+                messagebox.showerror("추출 오류", f"SQLite 파일에서 데이터를 추출하는 중 오류가 발생했습니다: {e}")
 
-        except sqlite3.OperationalError as e:
-            messagebox.showerror("DB 오류", f"데이터베이스 구조 오류: 'questions' 테이블을 찾을 수 없거나 형식이 올바르지 않습니다.\n{e}")
-        except Exception as e:
-            messagebox.showerror("추출 오류", f"SQLite 파일에서 데이터를 추출하는 중 오류가 발생했습니다: {e}")
+        # 가져오기는 원본 파일을 바꾸지 않도록 읽기 전용으로 엽니다.
+        self.run_job("SQL 파일로부터 추출하기", lambda job: read_sql_file(file_path, is_unchanged, job.progress),
+                     on_done, on_error)
 
-    # --- 검색 로직 (변경 없음) ---
+    # --- 검색 로직 (n-gram 역색인 사용) ---
     def open_search_popup(self):
         """검색 팝업을 열고 검색 결과를 표시합니다."""
 
@@ -1061,53 +2279,148 @@ class Application(tk.Tk):
         results_text = tk.Text(popup_frame, wrap='word', font=('Arial', 10), state='disabled')
         results_text.pack(fill="both", expand=True)
 
-        def perform_search(event=None):
-            query = search_var.get().strip().lower()
+        # 팝업을 여는 시점에 현재 편집 내용을 한 번만 반영하고, 그 데이터의 스냅샷으로 검색합니다.
+        self.save_current_company_data()
+        snapshot = {company_name: company.questions for company_name, company in self.all_companies_data.items()}
+        # 대용량 텍스트 파일에서 읽는 회사는 색인에 없으므로 검색할 때 원본 파일을 회사 단위로 훑습니다.
+        archived = [(company_name, company.source) for company_name, company in self.all_companies_data.items()
+                    if company.source is not None]
+
+        result_queue = queue.Queue()
+        search_state = {"generation": 0, "cancel": None, "debounce_id": None, "poll_id": None, "found": 0}
+
+        def set_results_message(message):
             results_text.config(state='normal')
             results_text.delete("1.0", tk.END)
+            results_text.insert(tk.END, message)
+            results_text.config(state='disabled')
 
-            if not query:
-                results_text.insert(tk.END, "검색어를 입력해주세요.")
-                results_text.config(state='disabled')
+        @timed("search")
+        def find_hits(query, cancel_event):
+            """(회사명, 문항 인덱스, [필드명, ...], 제목, 미리보기) 목록을 반환합니다. 취소되면 None을 반환합니다."""
+            if self.document_store is not None:
+                return self.document_store.search(query, cancel_event)
+
+            hits = self.search_index.search(query, cancel_event)
+            if hits is None:
+                return None
+
+            titled_hits = []
+            for company_name, index, match_in_fields in hits:
+                questions = snapshot.get(company_name) or []
+                if index < len(questions):
+                    titled_hits.append((company_name, index, match_in_fields,
+                                        questions[index].title or f'문항 {index + 1}', None))
+
+            normalized_query = NgramIndex.normalize(query)
+            for company_name, archive in archived:
+                if cancel_event.is_set():
+                    return None
+                for index, match_in_fields, question_title in archive.search_company(company_name, normalized_query):
+                    titled_hits.append((company_name, index, match_in_fields, question_title, None))
+            return titled_hits
+
+        def search_worker(generation, query, cancel_event):
+            """작업 스레드: 색인을 조회하고 결과 문자열을 묶음 단위로 큐에 넣습니다."""
+            hits = find_hits(query, cancel_event)
+            if hits is None:
                 return
 
-            found_count = 0
-            self.save_current_company_data()
+            batch = []
+            for company_name, index, match_in_fields, question_title, snippet in hits:
+                if cancel_event.is_set():
+                    return
+                result = (f"회사: {company_name}\n"
+                          f"   - 문항: {question_title}\n"
+                          f"   - 검색 일치: {', '.join(match_in_fields)}에서 발견\n")
+                if snippet:
+                    result += f"   - 미리보기: {' '.join(snippet.split())}\n"
+                batch.append(result + "\n")
+                if len(batch) >= self.SEARCH_BATCH_SIZE:
+                    result_queue.put((generation, batch))
+                    batch = []
+
+            if batch:
+                result_queue.put((generation, batch))
+            result_queue.put((generation, None))  # 검색 완료 표시
+
+        def poll_results():
+            """메인 스레드: 큐에 쌓인 결과 묶음을 results_text에 이어 붙입니다."""
+            search_state["poll_id"] = None
+            finished = False
 
-            for company_name, questions in self.all_companies_data.items():
-                for i, q_data in enumerate(questions):
-                    question_title = q_data.get('제목', f'문항 {i + 1}')
-
-                    fields_to_search = [
-                        ("제목", question_title),
-                        ("유형", q_data.get('문항유형', '')),
-                        ("질문", q_data.get('질문', '')),
-                        ("답변", q_data.get('답변', ''))
-                    ]
-
-                    match_in_fields = []
-
-                    for field_name, content in fields_to_search:
-                        if query in content.lower():
-                            match_in_fields.append(field_name)
-
-                    if match_in_fields:
-                        found_count += 1
-                        results_text.insert(tk.END,
-                                            f"회사: {company_name}\n"
-                                            f"   - 문항: {question_title}\n"
-                                            f"   - 검색 일치: {', '.join(match_in_fields)}에서 발견\n\n",
-                                            'result_tag'
-                                            )
-
-            if found_count == 0:
-                results_text.insert(tk.END, f"'{query}'에 해당하는 항목을 찾을 수 없습니다.")
-            else:
-                results_text.insert("1.0", f"총 {found_count}개의 항목을 찾았습니다.\n\n", 'summary_tag')
+            results_text.config(state='normal')
+            try:
+                while True:
+                    generation, batch = result_queue.get_nowait()
+                    if generation != search_state["generation"]:
+                        continue  # 이미 취소된 이전 검색어의 결과
+                    if batch is None:
+                        finished = True
+                        break
+                    if search_state["found"] == 0:
+                        results_text.delete("1.0", tk.END)
+                    search_state["found"] += len(batch)
+                    results_text.insert(tk.END, "".join(batch), 'result_tag')
+                    break  # 한 번에 한 묶음만 그려 UI 응답성을 유지
+            except queue.Empty:
+                pass
 
+            if finished:
+                found_count = search_state["found"]
+                query = search_var.get().strip()
+                if found_count == 0:
+                    results_text.delete("1.0", tk.END)
+                    results_text.insert(tk.END, f"'{query}'에 해당하는 항목을 찾을 수 없습니다.")
+                else:
+                    results_text.insert("1.0", f"총 {found_count}개의 항목을 찾았습니다.\n\n", 'summary_tag')
             results_text.config(state='disabled')
 
+            if not finished:
+                search_state["poll_id"] = popup.after(self.SEARCH_POLL_MS, poll_results)
+
+        def cancel_running_search():
+            if search_state["cancel"] is not None:
+                search_state["cancel"].set()
+                search_state["cancel"] = None
+            if search_state["poll_id"] is not None:
+                popup.after_cancel(search_state["poll_id"])
+                search_state["poll_id"] = None
+
+        def perform_search(event=None):
+            if search_state["debounce_id"] is not None:
+                popup.after_cancel(search_state["debounce_id"])
+                search_state["debounce_id"] = None
+
+            cancel_running_search()
+            search_state["generation"] += 1
+            search_state["found"] = 0
+
+            query = search_var.get().strip()
+            if not query:
+                set_results_message("검색어를 입력해주세요.")
+                return
+
+            set_results_message("검색 중...")
+            cancel_event = threading.Event()
+            search_state["cancel"] = cancel_event
+            threading.Thread(
+                target=search_worker,
+                args=(search_state["generation"], query, cancel_event),
+                daemon=True
+            ).start()
+            search_state["poll_id"] = popup.after(self.SEARCH_POLL_MS, poll_results)
+
+        def on_query_changed(*args):
+            """입력할 때마다 검색을 예약합니다. (디바운스)"""
+            if search_state["debounce_id"] is not None:
+                popup.after_cancel(search_state["debounce_id"])
+            search_state["debounce_id"] = popup.after(self.SEARCH_DEBOUNCE_MS, perform_search)
+
         def on_cancel(event=None):
+            cancel_running_search()
+            if search_state["debounce_id"] is not None:
+                popup.after_cancel(search_state["debounce_id"])
             popup.destroy()
 
         search_button = ttk.Button(search_control_frame, text="검색", command=perform_search)
@@ -1116,15 +2429,133 @@ class Application(tk.Tk):
         results_text.tag_configure('summary_tag', font=('Arial', 10, 'bold'), foreground='blue')
         results_text.tag_configure('result_tag', font=('Arial', 10, 'normal'))
 
+        search_var.trace_add('write', on_query_changed)
         search_entry.bind('<Return>', perform_search)
         popup.bind('<Escape>', on_cancel)
+        popup.protocol("WM_DELETE_WINDOW", on_cancel)
 
         ttk.Button(popup_frame, text="닫기", command=on_cancel).pack(pady=(10, 0))
 
         self.wait_window(popup)
 
+    def open_perf_panel(self):
+        """성능 패널: 항목별 최근 소요 시간 백분위수를 실시간으로 보여주고 추적/프로파일 결과를 내보냅니다."""
+        if getattr(self, "_perf_panel", None) is not None and self._perf_panel.winfo_exists():
+            self._perf_panel.lift()
+            return
+
+        popup = tk.Toplevel(self)
+        popup.title("성능 패널")
+        popup.geometry("720x480")
+        self._perf_panel = popup
+
+        popup_frame = ttk.Frame(popup, padding="10")
+        popup_frame.pack(expand=True, fill="both")
+
+        control_frame = ttk.Frame(popup_frame)
+        control_frame.pack(fill="x", pady=(0, 5))
+
+        ttk.Checkbutton(control_frame, text="계측 켜기", variable=self.perf_enabled_var).pack(side="left")
+
+        def export_trace():
+            file_path = filedialog.asksaveasfilename(
+                parent=popup,
+                defaultextension=".json",
+                initialfile="selfintroduce_trace.json",
+                filetypes=[("Chrome Trace (JSON)", "*.json"), ("All files", "*.*")],
+                title="추적 파일을 저장할 위치를 선택하세요. (chrome://tracing 또는 Perfetto에서 열기)"
+            )
+            if file_path:
+                try:
+                    count = PERF.export_trace(file_path)
+                    messagebox.showinfo("내보내기 완료", f"{count}개 구간을 '{file_path}'에 저장했습니다.", parent=popup)
+                except Exception as e:
+                    messagebox.showerror("내보내기 오류", f"추적 파일 저장 중 오류가 발생했습니다: {e}", parent=popup)
+
+        ttk.Button(control_frame, text="추적 내보내기...", command=export_trace).pack(side="right")
+        ttk.Button(control_frame, text="초기화", command=PERF.reset).pack(side="right", padx=5)
+
+        columns = ("count", "last", "p50", "p90", "p99", "max")
+        headings = ("횟수", "마지막(ms)", "p50(ms)", "p90(ms)", "p99(ms)", "최대(ms)")
+        stats_tree = ttk.Treeview(popup_frame, columns=columns, height=10)
+        stats_tree.heading("#0", text="항목")
+        stats_tree.column("#0", width=180)
+        for column, heading in zip(columns, headings):
+            stats_tree.heading(column, text=heading)
+            stats_tree.column(column, width=80, anchor="e")
+        stats_tree.pack(fill="both", expand=True)
+
+        # cProfile / tracemalloc
+        capture_frame = ttk.Frame(popup_frame)
+        capture_frame.pack(fill="x", pady=5)
+
+        output_text = tk.Text(popup_frame, wrap='none', font=('Courier', 9), height=10, state='disabled')
+        output_text.pack(fill="both", expand=True)
+
+        def show_output(text):
+            output_text.config(state='normal')
+            output_text.delete("1.0", tk.END)
+            output_text.insert(tk.END, text)
+            output_text.config(state='disabled')
+
+        profile_button = ttk.Button(capture_frame)
+        tracemalloc_button = ttk.Button(capture_frame)
+
+        def update_capture_buttons():
+            profile_button.config(text="cProfile 중지 및 저장..." if PERF.profiler is not None else "cProfile 시작")
+            tracemalloc_button.config(text="tracemalloc 중지" if PERF.tracemalloc_running() else "tracemalloc 시작")
+
+        def toggle_profile():
+            if PERF.profiler is None:
+                PERF.start_profile()
+            else:
+                file_path = filedialog.asksaveasfilename(
+                    parent=popup,
+                    defaultextension=".prof",
+                    initialfile="selfintroduce.prof",
+                    filetypes=[("pstats", "*.prof"), ("All files", "*.*")],
+                    title="프로파일 결과를 저장할 위치를 선택하세요. (취소하면 요약만 표시)"
+                )
+                show_output(PERF.stop_profile(file_path or None))
+            update_capture_buttons()
+
+        def toggle_tracemalloc():
+            if PERF.tracemalloc_running():
+                show_output(PERF.tracemalloc_top())
+                PERF.stop_tracemalloc()
+            else:
+                PERF.start_tracemalloc()
+            update_capture_buttons()
+
+        profile_button.config(command=toggle_profile)
+        tracemalloc_button.config(command=toggle_tracemalloc)
+        profile_button.pack(side="left")
+        tracemalloc_button.pack(side="left", padx=5)
+        ttk.Button(capture_frame, text="메모리 상위 보기",
+                   command=lambda: show_output(PERF.tracemalloc_top() or "tracemalloc이 꺼져 있습니다.")).pack(side="left")
+        update_capture_buttons()
+
+        def refresh():
+            if not popup.winfo_exists():
+                return
+            rows = PERF.stats()
+            stats_tree.delete(*stats_tree.get_children())
+            for name, count, *timings in rows:
+                stats_tree.insert("", tk.END, text=name, values=(count, *(f"{t * 1000:.2f}" for t in timings)))
+            popup.after(self.PERF_PANEL_REFRESH_MS, refresh)
+
+        refresh()
+
 
 # 애플리케이션 실행
 if __name__ == "__main__":
+    # 패키징된 실행 파일이 파일 불러오기의 작업 프로세스로 다시 실행된 경우 작업만 처리하고 끝냅니다.
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
+    PERF.configure_from_env()
     app = Application()
+    # 시작 시간 측정 (selfintroduce_bench.py --startup): 첫 화면 시각을 기록하고 바로 종료
+    if os.environ.get("SELFINTRODUCE_STARTUP_PROBE"):
+        app.report_startup_time(os.environ["SELFINTRODUCE_STARTUP_PROBE"])
     app.mainloop()
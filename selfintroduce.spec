@@ -1,12 +1,36 @@
 # -*- mode: python ; coding: utf-8 -*-
+#
+# 빌드 프로필
+#   pyinstaller selfintroduce.spec                           (기본) 폴더형(one-dir), UPX 압축 없음
+#                                                            -> dist/selfintroduce/selfintroduce
+#   SELFINTRODUCE_ONEFILE=1 pyinstaller selfintroduce.spec   단일 실행 파일(one-file), UPX 압축
+#                                                            -> dist/selfintroduce
+#
+# 단일 파일 빌드는 실행할 때마다 번들 전체를 임시 폴더에 풀고(UPX면 압축 해제까지) 나서야 앱이 시작되므로
+# 첫 창이 늦게 뜹니다. 배포 편의가 꼭 필요할 때만 사용하고, 시작 시간은
+# `python selfintroduce_bench.py --startup --startup-command <실행 파일>`로 확인합니다.
+import os
 
+ONEFILE = os.environ.get("SELFINTRODUCE_ONEFILE", "") not in ("", "0")
 
 a = Analysis(
     ['selfintroduce.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=[],
+    # selfintroduce_core.lazy_import로 처음 사용할 때 불러오는 모듈 (정적 분석으로 찾을 수 없음)
+    hiddenimports=[
+        'concurrent.futures',
+        'hashlib',
+        'json',
+        'pathlib',
+        'shutil',
+        'sqlite3',
+        'tempfile',
+        'tkinter.filedialog',
+        'tkinter.messagebox',
+        'uuid',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -16,23 +40,51 @@ a = Analysis(
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='selfintroduce',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if ONEFILE:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='selfintroduce',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='selfintroduce',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=False,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='selfintroduce',
+    )
@@ -0,0 +1,437 @@
+# 성능 측정 도구: 합성 자소서 데이터로 파싱/포맷/SQLite/검색/화면 갱신 시간을 재고 JSON으로 기록합니다.
+#
+#   python selfintroduce_bench.py                              기본 크기로 측정 -> bench_output.json
+#   python selfintroduce_bench.py -c 2000 -n 10 -a 800 -o big.json
+#   python selfintroduce_bench.py --compare old.json           이전 결과와 비교 (느려진 항목 표시)
+#   python selfintroduce_bench.py --generate corpus.txt        합성 데이터만 텍스트 파일로 생성
+#   python selfintroduce_bench.py --startup --target-ms 800     첫 창이 뜰 때까지의 시간 측정
+#   python selfintroduce_bench.py --startup --startup-command dist/selfintroduce/selfintroduce
+#
+# 화면 관련 항목(Treeview 갱신, 회사 전환 등)은 디스플레이가 필요합니다. $DISPLAY가 없으면
+# Xvfb가 설치되어 있을 때 가상 디스플레이를 띄워 측정하고, 없으면 건너뛰고 그 사실을 기록합니다.
+import argparse
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from selfintroduce_core import (
+    BinaryArchive, EditJournal, NgramIndex, Question, company_digest, export_companies_sql, format_company, parse_companies,
+    read_archive_file, read_json_file, read_sql_file, write_archive_file, write_blocks, write_json_file,
+)
+
+# 결과 파일 형식 버전 (비교 시 확인)
+RESULT_FORMAT = 1
+
+# 문항 유형/제목에 쓰는 흔한 라벨
+QUESTION_TYPES = ("지원동기", "성장과정", "성격의 장단점", "입사 후 포부", "직무 역량", "협업 경험", "실패 경험", "")
+TITLE_WORDS = ("지원 동기", "직무 경험", "도전 경험", "갈등 해결", "리더십", "가치관", "향후 목표", "전문성")
+COMPANY_WORDS = ("전자", "바이오", "물산", "증권", "소프트", "중공업", "에너지", "건설", "통신", "제약")
+
+
+# 실제 글처럼 자주 쓰이는 음절이 반복되도록, 고정된 음절 집합에서 순위가 높을수록 자주 뽑습니다.
+SYLLABLE_POOL_SIZE = 1200
+_SYLLABLES = random.Random(0).sample([chr(0xAC00 + i) for i in range(11172)], SYLLABLE_POOL_SIZE)
+_SYLLABLE_WEIGHTS = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(SYLLABLE_POOL_SIZE)))
+
+
+def _hangul_word(rng):
+    return "".join(rng.choices(_SYLLABLES, cum_weights=_SYLLABLE_WEIGHTS, k=rng.randint(2, 5)))
+
+
+def _hangul_text(rng, length):
+    """대략 length 글자의 한글 문단 텍스트를 만듭니다. (단어, 문장 끝, 문단 구분 포함)"""
+    parts = []
+    size = 0
+    sentence_words = 0
+    while size < length:
+        word = _hangul_word(rng)
+        sentence_words += 1
+        if sentence_words >= rng.randint(6, 14):
+            word += "습니다." if rng.random() < 0.7 else "다."
+            sentence_words = 0
+            separator = "\n\n" if rng.random() < 0.15 else " "
+        else:
+            separator = " "
+        parts.append(word)
+        parts.append(separator)
+        size += len(word) + len(separator)
+    return "".join(parts).strip()
+
+
+def generate_corpus(company_count=500, questions_per_company=5, answer_length=700, seed=1):
+    """합성 자소서 데이터 {회사명: [Question, ...]}를 만듭니다.
+
+    회사마다 문항 수는 1 ~ questions_per_company, 답변 길이는 answer_length의 ±40% 범위입니다.
+    """
+    rng = random.Random(seed)
+    corpus = {}
+    for i in range(company_count):
+        company_name = f"{_hangul_word(rng)}{rng.choice(COMPANY_WORDS)} {i:05d}"
+        questions = []
+        for j in range(rng.randint(1, questions_per_company)):
+            length = max(1, int(answer_length * rng.uniform(0.6, 1.4)))
+            questions.append(Question(
+                f"{rng.choice(TITLE_WORDS)} {j + 1}",
+                rng.choice(QUESTION_TYPES),
+                _hangul_text(rng, rng.randint(40, 160)),
+                _hangul_text(rng, length),
+            ))
+        corpus[company_name] = questions
+    return corpus
+
+
+def corpus_text(corpus):
+    buffer = io.StringIO()
+    write_blocks(buffer, (format_company(company_name, questions) for company_name, questions in corpus.items()))
+    return buffer.getvalue()
+
+
+# --- 측정 ---
+
+def measure(func, repeat, setup=None):
+    """setup()의 결과를 인자로 func를 repeat번 실행하고 (최소, 중앙값, 평균) 초를 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start = time.perf_counter()
+        if setup is not None:
+            func(arg)
+        else:
+            func()
+        timings.append(time.perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings),
+            "mean": statistics.fmean(timings), "repeat": repeat}
+
+
+def _search_terms(corpus, rng, count=5):
+    """검색어 목록: 실제 답변에서 뽑은 1~3음절과 없는 단어를 섞습니다."""
+    answers = [question.answer for questions in corpus.values() for question in questions if question.answer]
+    terms = []
+    for n in (1, 2, 3, 3):
+        text = rng.choice(answers)
+        start = rng.randrange(max(1, len(text) - n))
+        terms.append(text[start:start + n])
+    terms.append("없는검색어")
+    return terms[:count]
+
+
+def run_core_benchmarks(corpus, repeat, work_dir):
+    """화면 없이 측정할 수 있는 코어 기능 (파싱, 포맷, SQLite 내보내기/가져오기, 아카이브, 검색)"""
+    results = {}
+    text = corpus_text(corpus)
+
+    results["parse_text"] = measure(lambda: parse_companies(io.StringIO(text)), repeat)
+    results["format_text"] = measure(lambda: corpus_text(corpus), repeat)
+
+    def export(path):
+        companies = ((company_name, company_digest(questions), lambda questions=questions: questions)
+                     for company_name, questions in corpus.items())
+        export_companies_sql(path, companies)
+
+    def fresh_db_path():
+        path = os.path.join(work_dir, "export.sqlite")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return path
+
+    results["export_sql_full"] = measure(export, repeat, fresh_db_path)
+
+    db_path = os.path.join(work_dir, "export.sqlite")
+    results["export_sql_unchanged"] = measure(lambda: export(db_path), repeat)
+    results["import_sql"] = measure(lambda: read_sql_file(db_path), repeat)
+
+    # 압축 아카이브: 기록, 디렉터리만 읽어 열기, 회사 하나 읽기, 전체 읽기 (크기는 텍스트와 함께 기록)
+    archive_path = os.path.join(work_dir, "export.sia")
+    results["archive_write"] = measure(lambda: write_archive_file(archive_path, corpus.items()), repeat)
+    results["archive_write"]["bytes"] = os.path.getsize(archive_path)
+    results["archive_write"]["text_bytes"] = len(text.encode("utf-8"))
+    results["archive_open"] = measure(lambda: BinaryArchive(archive_path), repeat)
+    archive = BinaryArchive(archive_path)
+    archive_names = random.Random(5).sample(list(corpus), min(30, len(corpus)))
+    results["archive_load_company"] = measure(lambda: [archive.load_company(name) for name in archive_names], repeat)
+    results["archive_load_company"]["companies_per_run"] = len(archive_names)
+    results["archive_read_all"] = measure(lambda: read_archive_file(archive_path), repeat)
+
+    # Jasoser.html JSON: 스트리밍 기록과 스트리밍 읽기 (지원 하나씩 디코딩)
+    json_path = os.path.join(work_dir, "project_data.json")
+    results["json_write"] = measure(
+        lambda: write_json_file(json_path, ((name, questions, None) for name, questions in corpus.items())), repeat)
+    results["json_write"]["bytes"] = os.path.getsize(json_path)
+    results["json_read"] = measure(lambda: read_json_file(json_path), repeat)
+
+    # 편집 저널: 회사 하나를 편집할 때 드는 비용 (화면 스레드가 기다리는 시간, 기록 스레드의 쓰기/fsync까지 마친 시간)
+    journal = EditJournal(os.path.join(work_dir, "journal.txt")).open(reset=True)
+    results["journal_put"] = measure(lambda: [journal.put(name, corpus[name]) for name in archive_names], repeat)
+    results["journal_put"]["companies_per_run"] = len(archive_names)
+    journal.flush()
+    results["journal_put_flushed"] = measure(
+        lambda: ([journal.put(name, corpus[name]) for name in archive_names], journal.flush()), repeat)
+    journal.close()
+
+    def build_index():
+        built = NgramIndex()
+        for company_name, questions in corpus.items():
+            built.update_company(company_name, questions)
+        built.flush()
+        return built
+
+    results["search_index_build"] = measure(build_index, max(1, repeat // 2))
+    index = build_index()
+    terms = _search_terms(corpus, random.Random(2))
+    results["search_index_query"] = measure(lambda: [index.search(term) for term in terms], repeat)
+    return results
+
+
+# --- 화면(Tk) 측정 ---
+
+def _start_virtual_display():
+    """$DISPLAY가 없으면 Xvfb를 띄웁니다. (프로세스, 사유)를 반환하며 실패하면 프로세스는 None입니다."""
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None, None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None, "디스플레이가 없고 Xvfb를 찾을 수 없습니다."
+    display = ":%d" % (90 + os.getpid() % 100)
+    process = subprocess.Popen([xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    if process.poll() is not None:
+        return None, "Xvfb를 시작하지 못했습니다."
+    os.environ["DISPLAY"] = display
+    return process, None
+
+
+def run_gui_benchmarks(corpus, repeat, work_dir, switch_count=30):
+    """Application 화면 동작 (Treeview 갱신, 필터, 회사 전환, 텍스트 포맷, 검색) 측정"""
+    import tkinter as tk
+    from selfintroduce import Application
+
+    class BenchApplication(Application):
+        # 측정 중 자동 저장이 사용자의 자동 저장 파일을 덮어쓰지 않도록 임시 디렉터리에 기록
+        AUTOSAVE_DEFAULT_PATH = os.path.join(work_dir, "autosave.txt")
+
+    try:
+        app = BenchApplication()
+    except tk.TclError as e:
+        return None, f"Tk를 시작하지 못했습니다: {e}"
+
+    try:
+        app.withdraw()
+        app._merge_imported_companies({name: list(questions) for name, questions in corpus.items()})
+        app.update_idletasks()
+        results = {}
+        text = corpus_text(corpus)
+        names = list(app.company_index.names)
+        rng = random.Random(3)
+
+        def clear_tree():
+            app.company_tree.delete(*app.company_tree.get_children())
+
+        results["gui_parse_file_content"] = measure(lambda: app._parse_file_content(text), repeat)
+        results["gui_update_treeview_full"] = measure(lambda _: app._update_treeview(), repeat, clear_tree)
+        results["gui_update_treeview_noop"] = measure(app._update_treeview, repeat)
+
+        def filter_cycle():
+            app.company_filter_var.set(names[rng.randrange(len(names))][:1])
+            app._apply_company_filter()
+            app.company_filter_var.set("")
+            app._apply_company_filter()
+
+        results["gui_filter_cycle"] = measure(filter_cycle, repeat)
+
+        def switch_companies():
+            for name in rng.sample(names, min(switch_count, len(names))):
+                app._select_company(name)
+                app.load_company_data(None)
+                app.update_idletasks()
+
+        results["gui_switch_companies"] = measure(switch_companies, repeat)
+        results["gui_switch_companies"]["companies_per_run"] = min(switch_count, len(names))
+
+        # 전체 텍스트 포맷: 첫 실행(캐시 없음)과 변경 없는 재실행(캐시 사용)을 따로 잽니다.
+        def drop_block_cache():
+            app._block_cache.clear()
+
+        results["gui_format_data_cold"] = measure(lambda _: app._format_data(), repeat, drop_block_cache)
+        results["gui_format_data_cached"] = measure(app._format_data, repeat)
+
+        # 검색 색인은 첫 검색 때 만들어지므로, 색인 생성은 따로 재고 검색은 색인이 준비된 상태에서 잽니다.
+        results["gui_search_index_flush"] = measure(app.search_index.flush, 1)
+        terms = _search_terms(corpus, random.Random(4))
+        results["gui_search"] = measure(lambda: [app.search_index.search(term) for term in terms], repeat)
+        return results, None
+    finally:
+        if app.autosave_writer is not None:
+            app.autosave_writer.close()
+        app.destroy()
+
+
+def run_startup_benchmark(repeat, command=None, timeout=60.0):
+    """앱을 repeat번 새 프로세스로 실행해, 실행 시작부터 첫 창이 그려질 때까지의 시간을 잽니다.
+
+    앱은 SELFINTRODUCE_STARTUP_PROBE 파일에 첫 화면 시각을 기록하고 바로 종료합니다.
+    command로 패키징된 실행 파일을 지정할 수 있습니다. (기본: 현재 파이썬으로 selfintroduce.py 실행)
+    """
+    if not command:
+        command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "selfintroduce.py")]
+    timings = []
+    with tempfile.TemporaryDirectory(prefix="selfintroduce_startup_") as work_dir:
+        probe_path = os.path.join(work_dir, "first_window")
+        env = dict(os.environ, SELFINTRODUCE_STARTUP_PROBE=probe_path)
+        for _ in range(repeat):
+            if os.path.exists(probe_path):
+                os.remove(probe_path)
+            start = time.time()
+            completed = subprocess.run(command, env=env, timeout=timeout,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if not os.path.exists(probe_path):
+                raise RuntimeError(f"첫 화면 시각이 기록되지 않았습니다. (종료 코드 {completed.returncode})\n"
+                                   f"{completed.stderr.strip()}")
+            with open(probe_path, encoding="utf-8") as f:
+                timings.append(float(f.read()) - start)
+    return {"min": min(timings), "median": statistics.median(timings),
+            "mean": statistics.fmean(timings), "repeat": repeat}
+
+
+# --- 결과 비교 ---
+
+def compare_results(old, new, threshold=0.10):
+    """두 결과의 중앙값을 비교해 (항목, 이전, 현재, 비율) 목록을 반환합니다."""
+    rows = []
+    for name, current in new["results"].items():
+        previous = old.get("results", {}).get(name)
+        if previous is None:
+            continue
+        ratio = current["median"] / previous["median"] if previous["median"] else float("inf")
+        rows.append((name, previous["median"], current["median"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="selfintroduce_bench", description="자소서 앱 성능 측정")
+    parser.add_argument("-c", "--companies", type=int, default=500, help="회사 수")
+    parser.add_argument("-n", "--questions", type=int, default=5,
+                        help="회사당 최대 문항 수 (앱의 MAX_QUESTIONS=20 이하)")
+    parser.add_argument("-a", "--answer-length", type=int, default=700, help="답변 평균 글자수")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("-s", "--seed", type=int, default=1)
+    parser.add_argument("-o", "--output", default="bench_output.json", help="결과 JSON 파일")
+    parser.add_argument("--no-gui", action="store_true", help="화면 관련 항목 건너뛰기")
+    parser.add_argument("--compare", metavar="OLD_JSON", help="이전 결과 JSON과 비교")
+    parser.add_argument("--threshold", type=float, default=0.10, help="느려졌다고 표시할 비율 (기본 10%%)")
+    parser.add_argument("--generate", metavar="TXT", help="측정하지 않고 합성 데이터를 텍스트 파일로 기록")
+    parser.add_argument("--startup", action="store_true", help="첫 창이 뜰 때까지의 시간만 측정")
+    parser.add_argument("--startup-command", nargs="+", metavar="ARG",
+                        help="시작 시간을 잴 실행 명령 (예: 패키징된 실행 파일 경로)")
+    parser.add_argument("--target-ms", type=float, default=1000.0,
+                        help="첫 창 표시 목표 시간 (중앙값 기준, 넘으면 종료 코드 1)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not 1 <= args.questions <= 20:
+        print("회사당 문항 수는 1~20 사이여야 합니다.", file=sys.stderr)
+        return 2
+
+    corpus = generate_corpus(args.companies, args.questions, args.answer_length, args.seed)
+    if args.generate:
+        with open(args.generate, "w", encoding="utf-8") as f:
+            f.write(corpus_text(corpus))
+        print(f"{args.generate}: 회사 {len(corpus)}개, 문항 {sum(map(len, corpus.values()))}개")
+        return 0
+
+    report = {
+        "format": RESULT_FORMAT,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "companies": args.companies,
+            "questions_per_company": args.questions,
+            "answer_length": args.answer_length,
+            "total_questions": sum(map(len, corpus.values())),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+
+    work_dir = tempfile.mkdtemp(prefix="selfintroduce_bench_")
+    display_process = None
+    try:
+        if args.startup:
+            report["meta"]["startup_command"] = args.startup_command
+            report["meta"]["target_ms"] = args.target_ms
+            display_process, reason = _start_virtual_display()
+            if reason is not None:
+                print(f"시작 시간 측정 불가: {reason}", file=sys.stderr)
+                return 2
+            report["results"]["startup_first_window"] = run_startup_benchmark(args.repeat, args.startup_command)
+        else:
+            report["results"].update(run_core_benchmarks(corpus, args.repeat, work_dir))
+
+            if args.no_gui:
+                report["meta"]["gui_skipped"] = "--no-gui"
+            else:
+                display_process, reason = _start_virtual_display()
+                gui_results = None
+                if reason is None:
+                    gui_results, reason = run_gui_benchmarks(corpus, args.repeat, work_dir)
+                if gui_results is not None:
+                    report["results"].update(gui_results)
+                else:
+                    report["meta"]["gui_skipped"] = reason
+                    print(f"화면 측정 건너뜀: {reason}", file=sys.stderr)
+    finally:
+        if display_process is not None:
+            display_process.terminate()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for name, result in report["results"].items():
+        print(f"{name:32s} {result['median'] * 1000:10.2f} ms (최소 {result['min'] * 1000:.2f} ms)")
+    print(f"결과 저장: {args.output}")
+
+    missed_target = False
+    if args.startup:
+        median_ms = report["results"]["startup_first_window"]["median"] * 1000
+        missed_target = median_ms > args.target_ms
+        print(f"첫 창 표시: {median_ms:.0f} ms / 목표 {args.target_ms:.0f} ms -> {'초과' if missed_target else '통과'}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        print(f"\n비교: {args.compare} ({old.get('meta', {}).get('revision')}) -> 현재 ({report['meta']['revision']})")
+        regressed = False
+        for name, before, after, ratio, slower in compare_results(old, report, args.threshold):
+            mark = "  느려짐" if slower else ""
+            regressed |= slower
+            print(f"{name:32s} {before * 1000:10.2f} -> {after * 1000:10.2f} ms  x{ratio:.2f}{mark}")
+        return 1 if regressed or missed_target else 0
+    return 1 if missed_target else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+# 자소서 데이터 일괄 처리 명령줄 도구 (화면 없이 실행)
+#
+#   python selfintroduce_cli.py to-sqlite a.txt b.txt ...        각 파일을 같은 이름의 .sqlite로 변환
+#   python selfintroduce_cli.py to-text a.sqlite ...              각 파일을 같은 이름의 .txt로 변환
+#   python selfintroduce_cli.py to-archive a.txt b.sqlite ...      각 파일을 같은 이름의 압축 아카이브(.sia)로 변환
+#   python selfintroduce_cli.py to-json a.txt b.sia ...            각 파일을 같은 이름의 Jasoser.html JSON으로 변환
+#   python selfintroduce_cli.py merge -o all.sqlite a.txt b.sia project_data.json ...   여러 파일을 하나로 병합
+#   python selfintroduce_cli.py search "지원동기" *.txt               문항 검색
+#   python selfintroduce_cli.py stats *.txt                         회사/문항/글자수 통계
+#
+# 파일 단위 작업(파싱, 변환, 검색, 통계)은 ProcessPoolExecutor로 여러 프로세스에 나눠 실행합니다.
+import argparse
+import os
+import sys
+
+from selfintroduce_core import (
+    CharCounter, NgramIndex, Question, company_digest, export_companies_sql, is_archive_path, is_json_path,
+    is_sqlite_path, read_companies, read_company_digests, run_tasks, search_questions, write_archive_file,
+    write_json_file, write_text_file,
+)
+
+
+def write_companies_file(file_path, companies, infos=None):
+    """{회사명: [Question, ...]}을 확장자에 따라 텍스트, SQLite, 아카이브 또는 JSON 파일로 기록합니다.
+
+    infos({회사명: 지원 정보})는 JSON과 아카이브에만 기록됩니다. (읽은 지원 상태/날짜/id 유지)
+    """
+    infos = infos or {}
+    if is_sqlite_path(file_path):
+        items = ((company_name, company_digest(questions), lambda questions=questions: questions)
+                 for company_name, questions in companies.items())
+        export_companies_sql(file_path, items)
+    elif is_archive_path(file_path):
+        write_archive_file(file_path, companies.items(), infos)
+    elif is_json_path(file_path):
+        write_json_file(file_path, ((company_name, questions, infos.get(company_name))
+                                    for company_name, questions in companies.items()))
+    else:
+        write_text_file(file_path, companies.items())
+
+
+# --- 작업 프로세스에서 실행되는 함수 (피클 가능하도록 모듈 수준에 둠) ---
+# 결과는 프로세스 간 전달 비용이 작은 튜플로 돌려줍니다.
+
+def _convert_worker(task):
+    source_path, target_path = task
+    companies = {}
+    infos = {}
+    for company_name, _, rows, info in read_company_digests(source_path):
+        companies[company_name] = [Question(*row) for row in rows]
+        infos[company_name] = info
+    write_companies_file(target_path, companies, infos)
+    return len(companies), sum(len(questions) for questions in companies.values())
+
+
+def _read_worker(file_path):
+    return [(company_name, rows, info) for company_name, _, rows, info in read_company_digests(file_path)]
+
+
+def _search_worker(task):
+    file_path, query = task
+    query = NgramIndex.normalize(query)
+    return [(company_name, index, fields, title)
+            for company_name, questions in read_companies(file_path).items()
+            for index, fields, title in search_questions(questions, query)]
+
+
+def _stats_worker(file_path):
+    companies = read_companies(file_path)
+    counter = CharCounter()
+    question_count = 0
+    for questions in companies.values():
+        question_count += len(questions)
+        for question in questions:
+            counter.add(question.answer)
+    return len(companies), question_count, counter.chars, counter.no_space, counter.utf8_bytes(1)
+
+
+# --- 실행 ---
+
+def _report_error(file_path, error):
+    print(f"{file_path}: 오류: {error}", file=sys.stderr)
+
+
+def _target_path(source_path, extension, out_dir):
+    root = os.path.splitext(os.path.basename(source_path) if out_dir else source_path)[0]
+    return os.path.join(out_dir, root + extension) if out_dir else root + extension
+
+
+def command_convert(args, extension):
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+    tasks = []
+    failed = 0
+    for path in args.inputs:
+        target_path = _target_path(path, extension, args.out_dir)
+        # 입력과 같은 파일에 쓰면 읽는 도중 원본을 덮어쓰게 되므로 변환하지 않습니다.
+        if os.path.abspath(target_path) == os.path.abspath(path):
+            _report_error(path, f"출력 파일이 입력 파일과 같습니다. --out-dir로 다른 폴더를 지정하세요: {target_path}")
+            failed += 1
+        else:
+            tasks.append((path, target_path))
+
+    for (source_path, target_path), result, error in run_tasks(_convert_worker, tasks, args.jobs):
+        if error is not None:
+            _report_error(source_path, error)
+            failed += 1
+        elif not args.quiet:
+            print(f"{source_path} -> {target_path} (회사 {result[0]}개, 문항 {result[1]}개)")
+    return 1 if failed else 0
+
+
+def command_merge(args):
+    # 파일 읽기는 병렬로, 병합은 입력 순서대로 합니다. (뒤 파일의 같은 회사명이 앞의 것을 덮어씀)
+    merged = {}
+    infos = {}
+    failed = 0
+    for file_path, result, error in run_tasks(_read_worker, args.inputs, args.jobs):
+        if error is not None:
+            _report_error(file_path, error)
+            failed += 1
+            continue
+        for company_name, rows, info in result:
+            merged.pop(company_name, None)
+            merged[company_name] = [Question(*row) for row in rows]
+            infos[company_name] = info
+
+    if failed and not args.keep_going:
+        print("입력 파일 오류로 병합 결과를 기록하지 않았습니다.", file=sys.stderr)
+        return 1
+
+    write_companies_file(args.output, merged, infos)
+    if not args.quiet:
+        print(f"{args.output}: 회사 {len(merged)}개, 문항 {sum(map(len, merged.values()))}개")
+    return 1 if failed else 0
+
+
+def command_search(args):
+    tasks = [(path, args.query) for path in args.inputs]
+    failed = 0
+    total = 0
+    for (file_path, _), hits, error in run_tasks(_search_worker, tasks, args.jobs):
+        if error is not None:
+            _report_error(file_path, error)
+            failed += 1
+            continue
+        for company_name, index, fields, title in hits:
+            print(f"{file_path}\t{company_name}\t{index + 1}\t{title}\t{', '.join(fields)}")
+        total += len(hits)
+    if not args.quiet:
+        print(f"검색 결과 {total}건", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def command_stats(args):
+    failed = 0
+    totals = [0, 0, 0, 0, 0]
+    print("파일\t회사\t문항\t답변 글자수\t공백 제외\tUTF-8 바이트")
+    for file_path, result, error in run_tasks(_stats_worker, args.inputs, args.jobs):
+        if error is not None:
+            _report_error(file_path, error)
+            failed += 1
+            continue
+        print(file_path + "\t" + "\t".join(map(str, result)))
+        totals = [total + value for total, value in zip(totals, result)]
+    if len(args.inputs) > 1:
+        print("합계\t" + "\t".join(map(str, totals)))
+    return 1 if failed else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="selfintroduce_cli", description="자소서 데이터 일괄 변환/병합/검색/통계")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="동시에 실행할 작업 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 메시지를 출력하지 않음")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (("to-sqlite", "텍스트 파일을 각각 SQLite 파일로 변환"),
+                            ("to-text", "SQLite/아카이브(또는 텍스트) 파일을 각각 텍스트 파일로 변환"),
+                            ("to-archive", "텍스트/SQLite 파일을 각각 압축 아카이브(.sia) 파일로 변환"),
+                            ("to-json", "각 파일을 Jasoser.html에서 불러올 수 있는 JSON 파일로 변환")):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("inputs", nargs="+")
+        sub.add_argument("-d", "--out-dir", help="결과 파일을 둘 디렉터리 (기본: 입력 파일 옆)")
+
+    sub = subparsers.add_parser("merge", help="여러 파일을 하나의 텍스트/SQLite/아카이브 파일로 병합")
+    sub.add_argument("inputs", nargs="+")
+    sub.add_argument("-o", "--output", required=True, help="결과 파일 (.txt, .sqlite, .sia 또는 .json)")
+    sub.add_argument("-k", "--keep-going", action="store_true", help="읽지 못한 입력이 있어도 나머지로 병합")
+
+    sub = subparsers.add_parser("search", help="문항 제목/유형/질문/답변에서 검색어 찾기")
+    sub.add_argument("query")
+    sub.add_argument("inputs", nargs="+")
+
+    sub = subparsers.add_parser("stats", help="파일별 회사/문항/글자수 통계")
+    sub.add_argument("inputs", nargs="+")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "to-sqlite":
+        return command_convert(args, ".sqlite")
+    if args.command == "to-text":
+        return command_convert(args, ".txt")
+    if args.command == "to-archive":
+        return command_convert(args, ".sia")
+    if args.command == "to-json":
+        return command_convert(args, ".json")
+    if args.command == "merge":
+        return command_merge(args)
+    if args.command == "search":
+        return command_search(args)
+    return command_stats(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2291 @@
+# 자소서 데이터 처리 코어: 화면(Tk) 없이 쓸 수 있는 파싱/포맷/SQLite/검색 기능을 모아 둔 모듈입니다.
+# GUI(selfintroduce.py)와 명령줄 도구(selfintroduce_cli.py)가 함께 사용합니다.
+import bisect
+import codecs
+import collections
+import functools
+import importlib.util
+import io
+import itertools
+import math
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import unicodedata
+import zlib
+
+
+def lazy_import(name):
+    """처음 속성에 접근할 때 실제로 불러오는 모듈 객체를 반환합니다.
+
+    첫 화면에 필요 없는 모듈(SQLite, 해시, 임시 파일 등)의 로드 시간을 시작 시간에서 빼기 위해 사용합니다.
+    PyInstaller는 이 모듈들을 자동으로 찾지 못하므로 selfintroduce.spec의 hiddenimports에도 적어야 합니다.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+concurrent_futures = lazy_import("concurrent.futures")
+hashlib = lazy_import("hashlib")
+json = lazy_import("json")
+pathlib = lazy_import("pathlib")
+shutil = lazy_import("shutil")
+sqlite3 = lazy_import("sqlite3")
+tempfile = lazy_import("tempfile")
+uuid = lazy_import("uuid")
+
+
+# --- 성능 계측 ---
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 span()이 돌려주는 아무것도 하지 않는 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _Span:
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class PerfRecorder:
+    """주요 작업의 소요 시간을 항목별 링 버퍼에 모으고, 선택적으로 cProfile/tracemalloc을 켭니다.
+
+    enabled가 False이면 span()/timed()는 플래그 확인 한 번만 하고 원래 함수를 그대로 실행합니다.
+    환경 변수 SELFINTRODUCE_PERF로 시작 시 켤 수 있습니다. (쉼표로 구분: spans, profile, tracemalloc)
+    """
+
+    _NULL_SPAN = _NullSpan()
+
+    def __init__(self, capacity=500, trace_capacity=20000):
+        self.enabled = False
+        self.capacity = capacity
+        self.samples = {}      # {항목: deque([소요 시간(초), ...])} 최근 capacity개
+        self.counts = {}       # {항목: 전체 호출 수}
+        self.trace = collections.deque(maxlen=trace_capacity)  # (항목, 시작, 소요 시간, 스레드 id)
+        self.lock = threading.Lock()
+        self.profiler = None
+        self._origin = time.perf_counter()
+
+    def configure_from_env(self, value=None):
+        """환경 변수 값에 따라 계측/cProfile/tracemalloc을 켭니다."""
+        value = os.environ.get("SELFINTRODUCE_PERF", "") if value is None else value
+        options = {option.strip().lower() for option in value.split(",") if option.strip()}
+        if not options or options <= {"0", "off", "false"}:
+            return
+        self.enabled = True
+        if "profile" in options:
+            self.start_profile()
+        if "tracemalloc" in options:
+            self.start_tracemalloc()
+
+    def span(self, name):
+        """with PERF.span("이름"): 형태로 구간 시간을 기록합니다."""
+        return _Span(self, name) if self.enabled else self._NULL_SPAN
+
+    def record(self, name, start, duration):
+        with self.lock:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples[name] = collections.deque(maxlen=self.capacity)
+            samples.append(duration)
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.trace.append((name, start, duration, threading.get_ident()))
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.counts.clear()
+            self.trace.clear()
+
+    @staticmethod
+    def percentile(sorted_values, fraction):
+        """정렬된 값에서 최근접 순위 방식의 백분위수를 구합니다."""
+        if not sorted_values:
+            return 0.0
+        rank = math.ceil(fraction * len(sorted_values)) - 1
+        return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+    def stats(self):
+        """[(항목, 전체 호출 수, 마지막, p50, p90, p99, 최대), ...] 를 초 단위로 반환합니다. (최근 capacity개 기준)"""
+        with self.lock:
+            snapshot = [(name, self.counts[name], list(samples)) for name, samples in self.samples.items()]
+        rows = []
+        for name, count, samples in sorted(snapshot):
+            ordered = sorted(samples)
+            rows.append((name, count, samples[-1], self.percentile(ordered, 0.5),
+                         self.percentile(ordered, 0.9), self.percentile(ordered, 0.99), ordered[-1]))
+        return rows
+
+    def export_trace(self, file_path):
+        """기록된 구간을 Chrome 추적 형식(JSON)으로 저장합니다. (chrome://tracing, Perfetto에서 열기)"""
+        with self.lock:
+            events = list(self.trace)
+        pid = os.getpid()
+        trace_events = [{"name": name, "ph": "X", "pid": pid, "tid": thread_id,
+                         "ts": round((start - self._origin) * 1e6, 1), "dur": round(duration * 1e6, 1)}
+                        for name, start, duration, thread_id in events]
+        atomic_write_text(file_path, lambda f: json.dump({"traceEvents": trace_events}, f, ensure_ascii=False))
+        return len(trace_events)
+
+    # cProfile: Tk 메인 스레드의 함수별 시간
+
+    def start_profile(self):
+        import cProfile
+        if self.profiler is None:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop_profile(self, file_path=None):
+        """프로파일링을 멈추고 file_path가 있으면 pstats 파일로 저장합니다. 누적 시간 상위 요약 문자열을 반환합니다."""
+        import pstats
+        if self.profiler is None:
+            return ""
+        profiler, self.profiler = self.profiler, None
+        profiler.disable()
+        if file_path:
+            profiler.dump_stats(file_path)
+        buffer = io.StringIO()
+        pstats.Stats(profiler, stream=buffer).sort_stats("cumulative").print_stats(30)
+        return buffer.getvalue()
+
+    # tracemalloc: 메모리 할당 위치별 사용량
+
+    @staticmethod
+    def tracemalloc_running():
+        import tracemalloc
+        return tracemalloc.is_tracing()
+
+    @staticmethod
+    def start_tracemalloc():
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+
+    @staticmethod
+    def stop_tracemalloc():
+        import tracemalloc
+        tracemalloc.stop()
+
+    @staticmethod
+    def tracemalloc_top(limit=20):
+        """현재 메모리 사용량 상위 할당 위치를 문자열로 반환합니다."""
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            return ""
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"현재 {current / 1024:,.0f} KiB, 최대 {peak / 1024:,.0f} KiB"]
+        for stat in tracemalloc.take_snapshot().statistics("lineno")[:limit]:
+            lines.append(str(stat))
+        return "\n".join(lines)
+
+
+# 앱 전체에서 공유하는 계측기
+PERF = PerfRecorder()
+
+
+def timed(name):
+    """함수 실행 시간을 PERF에 name 항목으로 기록하는 데코레이터 (계측이 꺼져 있으면 그대로 호출)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PERF.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PERF.record(name, start, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# 글자수 카운터: 삽입/삭제된 텍스트(변경분)만으로 누적 합계를 유지합니다.
+class CharCounter:
+    """답변 텍스트의 글자수와 바이트수를 변경분 기준으로 누적 계산하는 엔진"""
+
+    def __init__(self, text=""):
+        self.reset(text)
+
+    def reset(self, text=""):
+        """모든 합계를 초기화하고 주어진 텍스트 전체로 다시 계산합니다."""
+        self.chars = 0
+        self.spaces = 0
+        self.newlines = 0
+        self.ascii = 0
+        self.utf8 = 0
+        if text:
+            self.add(text)
+
+    def _apply(self, text, sign):
+        self.chars += sign * len(text)
+        self.spaces += sign * text.count(' ')
+        self.newlines += sign * text.count('\n')
+        self.ascii += sign * len(text.encode('ascii', 'ignore'))
+        self.utf8 += sign * len(text.encode('utf-8', 'surrogatepass'))
+
+    def add(self, text):
+        """삽입된 텍스트만큼 합계를 늘립니다."""
+        self._apply(text, 1)
+
+    def remove(self, text):
+        """삭제된 텍스트만큼 합계를 줄입니다."""
+        self._apply(text, -1)
+
+    @property
+    def no_space(self):
+        """띄어쓰기(' ')를 제외한 글자수 (개행 포함)"""
+        return self.chars - self.spaces
+
+    def utf8_bytes(self, newline_bytes=1):
+        """UTF-8 바이트수. newline_bytes=2이면 개행을 CRLF(2바이트)로 셉니다."""
+        return self.utf8 + self.newlines * (newline_bytes - 1)
+
+    def euckr_bytes(self, newline_bytes=1):
+        """EUC-KR 기준 바이트수 (영문/숫자 1바이트, 한글 등 나머지 2바이트)."""
+        return self.ascii + 2 * (self.chars - self.ascii) + self.newlines * (newline_bytes - 1)
+
+
+# --- 데이터 모델 ---
+
+# 문항 유형처럼 반복되는 짧은 라벨을 같은 문자열 객체로 공유할지 여부
+INTERN_TYPE_LABELS = True
+
+
+class Question:
+    """자소서 문항 하나. 값 객체로 다루며, 내용을 바꿀 때는 replace()로 같은 id의 새 객체를 만듭니다.
+
+    한국어 키 딕셔너리 형식({"제목", "문항유형", "질문", "답변"})을 쓰던 텍스트/SQL/검색 코드를 위해
+    get()과 [] 조회를 같은 키로 지원합니다.
+    tags와 read_only는 Jasoser.html JSON의 tags/isReadOnly 값으로, JSON 형식과 편집 저널에만 기록됩니다.
+    external_id는 JSON에서 읽은 문항 id로, 내보낼 때 그대로 다시 씁니다. (내용이 아니므로 비교/해시에서 제외)
+    """
+
+    __slots__ = ('id', 'title', 'type', 'question', 'answer', 'tags', 'read_only', 'external_id')
+
+    # 한국어 데이터 키 -> 속성 이름
+    KEY_ATTRS = {"제목": 'title', "문항유형": 'type', "질문": 'question', "답변": 'answer',
+                 "태그": 'tags', "읽기전용": 'read_only'}
+
+    _ids = itertools.count(1)
+
+    def __init__(self, title="제목 없음", type="", question="", answer="", tags="", read_only=False, external_id=None,
+                 id=None):
+        self.id = next(Question._ids) if id is None else id
+        self.title = title
+        self.type = sys.intern(type) if INTERN_TYPE_LABELS and type else type
+        self.question = question
+        self.answer = answer
+        self.tags = tags
+        self.read_only = read_only
+        self.external_id = external_id
+
+    @classmethod
+    def from_dict(cls, data):
+        """한국어 키 딕셔너리(또는 이미 Question인 값)를 Question으로 변환합니다."""
+        if isinstance(data, Question):
+            return data
+        return cls(data.get("제목", "제목 없음"), data.get("문항유형", ""),
+                   data.get("질문", ""), data.get("답변", ""), data.get("태그", ""), data.get("읽기전용", False))
+
+    def to_dict(self):
+        """한국어 키 딕셔너리로 변환합니다."""
+        return {"제목": self.title, "질문": self.question, "문항유형": self.type, "답변": self.answer,
+                "태그": self.tags, "읽기전용": self.read_only}
+
+    def replace(self, **changes):
+        """일부 필드만 바꾼 새 Question을 반환합니다. id와 external_id는 유지됩니다."""
+        fields = {'title': self.title, 'type': self.type, 'question': self.question, 'answer': self.answer,
+                  'tags': self.tags, 'read_only': self.read_only, 'external_id': self.external_id}
+        fields.update(changes)
+        return Question(id=self.id, **fields)
+
+    def get(self, key, default=None):
+        attr = self.KEY_ATTRS.get(key)
+        return getattr(self, attr) if attr else default
+
+    def __getitem__(self, key):
+        return getattr(self, self.KEY_ATTRS[key])
+
+    def content(self):
+        return self.title, self.type, self.question, self.answer, self.tags, self.read_only
+
+    def row(self):
+        """프로세스 간 전달/편집 저널용 튜플 (Question(*row)로 되돌림, 내용에 external_id를 덧붙임)"""
+        return self.content() + (self.external_id,)
+
+    def __eq__(self, other):
+        if not isinstance(other, Question):
+            return NotImplemented
+        return self is other or self.content() == other.content()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Question(id={self.id}, title={self.title!r})"
+
+
+class Company:
+    """회사 하나와 문항 목록. questions가 None이면 아직 저장소/원본 파일에서 불러오지 않은 상태입니다.
+
+    version은 문항 목록이 바뀔 때마다 새 값으로 바뀌며, 캐시와 자동 저장의 변경 판단에 쓰입니다.
+    문항 목록은 제자리에서 수정하지 않고 항상 새 리스트로 교체합니다.
+    source는 내용을 필요할 때 다시 읽어올 수 있는 원본(load_company(회사명)을 가진 객체, 예: TextArchive)입니다.
+    status, date, app_id는 Jasoser.html JSON의 지원 상태/날짜/지원 id로, 없으면 None입니다.
+    """
+
+    __slots__ = ('id', 'name', 'questions', 'version', 'source', 'status', 'date', 'app_id')
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name, questions=None, version=0, source=None, status=None, date=None, app_id=None):
+        self.id = next(Company._ids)
+        self.name = name
+        self.questions = questions
+        self.version = version
+        self.source = source
+        self.status = status
+        self.date = date
+        self.app_id = app_id
+
+    def info(self):
+        """지원 정보 {"status", "date", "id"} 중 값이 있는 것만 담은 딕셔너리, 모두 없으면 None"""
+        info = {key: value for key, value in (("status", self.status), ("date", self.date), ("id", self.app_id))
+                if value is not None}
+        return info or None
+
+    def set_info(self, info):
+        info = info or {}
+        self.status = info.get("status")
+        self.date = info.get("date")
+        self.app_id = info.get("id")
+
+    def __repr__(self):
+        return f"Company(id={self.id}, name={self.name!r}, version={self.version})"
+
+
+def to_questions(questions):
+    """문항 데이터 목록(딕셔너리 또는 Question)을 Question 리스트로 변환합니다."""
+    return [Question.from_dict(data) for data in questions]
+
+
+# --- 구조화된 텍스트 형식 파싱 (스트리밍) ---
+
+def iter_text_lines(binary_file, progress=None, total_bytes=None, progress_step=1 << 20):
+    """바이너리 파일 객체를 한 줄씩 UTF-8로 디코딩해 내보내며, 읽은 바이트 수로 진행률을 보고합니다.
+
+    progress(읽은 바이트, 전체 바이트)는 progress_step 바이트마다 한 번씩 호출됩니다.
+    """
+    done = 0
+    next_report = progress_step
+    for raw_line in binary_file:
+        done += len(raw_line)
+        yield raw_line.decode('utf-8')
+        if progress is not None and done >= next_report:
+            progress(done, total_bytes)
+            next_report = done + progress_step
+    if progress is not None:
+        progress(done, total_bytes)
+
+
+def iter_parse_companies(lines):
+    """구조화된 텍스트를 한 줄씩 파싱하여 완성된 회사마다 (회사명, [문항 데이터]) 를 내보냅니다.
+
+    질문/답변 조각은 리스트에 모아 문항이 끝날 때 한 번만 join 합니다. 같은 회사명이
+    파일 안에 여러 번 나오면 여러 번 내보내므로 호출 측에서 이어 붙여야 합니다.
+    """
+    current_company = None
+    company_questions = []
+    company_yielded = False
+    current_question = None
+    question_parts = []
+    answer_parts = []
+    in_answer_section = False
+
+    for line in lines:
+        line = line.strip()
+
+        if not line and current_question:
+            # 내용(질문/답변) 섹션에서 빈 줄은 포함
+            (answer_parts if in_answer_section else question_parts).append('\n')
+            continue
+
+        if line.startswith('[회사명]:'):
+            if current_company is not None and (company_questions or not company_yielded):
+                yield current_company, company_questions
+
+            current_company = line.split(':', 1)[1].strip()
+            company_questions = []
+            company_yielded = False
+            in_answer_section = False
+            current_question = None
+
+        elif line == '--- 문항 시작 ---':
+            current_question = {"제목": "제목 없음", "질문": "", "답변": "", "문항유형": ""}
+            question_parts = []
+            answer_parts = []
+            in_answer_section = False
+
+        elif line.startswith('<<제목>>:') and current_question:
+            current_question['제목'] = line.split(':', 1)[1].strip()
+        elif line.startswith('<<유형>>:') and current_question:
+            current_question['문항유형'] = line.split(':', 1)[1].strip()
+
+        elif line == '<<질문>>' and current_question:
+            in_answer_section = False
+        elif line == '<<답변>>' and current_question:
+            in_answer_section = True
+
+        elif line == '--- 문항 끝 ---' and current_company and current_question:
+            current_question['질문'] = ''.join(question_parts).strip()
+            current_question['답변'] = ''.join(answer_parts).strip()
+            company_questions.append(current_question)
+            current_question = None
+            in_answer_section = False
+
+        elif current_question:
+            # 질문/답변 내용 추가 (공백 줄은 위에서 처리했으므로 내용만 추가)
+            parts = answer_parts if in_answer_section else question_parts
+            parts.append(line)
+            parts.append('\n')
+
+        elif line == '=== 회사 끝 ===' and current_company is not None:
+            # 회사 블록이 끝났으므로 지금까지의 문항을 바로 내보냅니다.
+            if company_questions or not company_yielded:
+                yield current_company, company_questions
+                company_questions = []
+                company_yielded = True
+
+    if current_company is not None and (company_questions or not company_yielded):
+        yield current_company, company_questions
+
+
+# --- 구조화된 텍스트 형식 기록 (스트리밍, 원자적 교체) ---
+
+def format_company(company_name, questions):
+    """회사 하나를 구조화된 텍스트 블록으로 포맷합니다. (블록 끝 개행 없음)"""
+    parts = [f"[회사명]: {company_name}\n"]
+
+    for data in questions:
+        parts.append("--- 문항 시작 ---\n")
+        parts.append(f"<<제목>>: {data.get('제목', '제목 없음')}\n")
+        parts.append(f"<<유형>>: {data.get('문항유형', '')}\n")
+
+        parts.append("<<질문>>\n")
+        parts.append(f"{data.get('질문', '')}\n")
+
+        parts.append("<<답변>>\n")
+        parts.append(f"{data.get('답변', '')}\n")
+
+        parts.append("--- 문항 끝 ---\n")
+
+    parts.append("=== 회사 끝 ===")
+    return "".join(parts)
+
+
+def write_blocks(f, blocks):
+    """이미 포맷된 회사 블록들을 파일 객체에 순서대로 기록합니다. 회사 사이는 빈 줄로 구분합니다."""
+    for i, block in enumerate(blocks):
+        if i:
+            f.write("\n\n")
+        f.write(block)
+
+
+def write_companies(f, companies):
+    """(회사명, 문항 목록) 쌍을 파일 객체에 회사 단위로 바로 기록합니다."""
+    write_blocks(f, (format_company(company_name, questions) for company_name, questions in companies))
+
+
+@timed("parse_companies")
+def parse_companies(lines):
+    """줄 단위 입력을 스트리밍 파싱하여 {회사명: [Question, ...]} 형식으로 모읍니다."""
+    parsed_data = {}
+    for company_name, questions in iter_parse_companies(lines):
+        parsed_data.setdefault(company_name, []).extend(to_questions(questions))
+    return parsed_data
+
+
+def read_text_file(file_path, progress=None):
+    """텍스트 파일을 읽어 {회사명: [Question, ...]}로 반환합니다. progress는 iter_text_lines와 같습니다."""
+    total_bytes = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        return parse_companies(iter_text_lines(f, progress, total_bytes))
+
+
+def write_text_file(file_path, companies):
+    """(회사명, 문항 목록) 쌍을 텍스트 파일에 원자적으로 기록합니다."""
+    atomic_write_text(file_path, lambda f: write_companies(f, companies))
+
+
+def atomic_write_text(file_path, write_func, encoding='utf-8', buffer_size=1 << 20):
+    """같은 디렉터리의 임시 파일에 write_func(f)로 기록하고 fsync 한 뒤 대상 파일과 원자적으로 교체합니다.
+
+    기록 도중 오류가 나거나 프로그램이 종료되어도 기존 파일은 손상되지 않습니다.
+    """
+    return _atomic_write(file_path, write_func, lambda fd: open(fd, 'w', encoding=encoding, buffering=buffer_size))
+
+
+def atomic_write_bytes(file_path, write_func, buffer_size=1 << 20):
+    """atomic_write_text의 바이너리 버전입니다. write_func(f)의 반환값을 그대로 반환합니다."""
+    return _atomic_write(file_path, write_func, lambda fd: open(fd, 'wb', buffering=buffer_size))
+
+
+def _atomic_write(file_path, write_func, open_temp):
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=directory)
+    try:
+        with open_temp(fd) as f:
+            result = write_func(f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # mkstemp는 0600 권한으로 만들므로 기존 파일의 권한을 유지합니다.
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+        return result
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# 자동 저장: Tk 스레드에서 만든 스냅샷을 작업 스레드가 파일로 기록합니다.
+class AutosaveWriter:
+    """스냅샷을 받아 최소 간격마다 한 번씩 원자적으로 기록하는 자동 저장 작업 스레드
+
+    스냅샷은 (회사명, 변경 버전, 문항 목록) 목록입니다. 문항 목록은 변경될 때마다 새 리스트로
+    교체되므로(제자리 수정 없음) 참조만 넘겨도 안전합니다. 기록 간격 안에 여러 스냅샷이
+    들어오면 마지막 것만 기록하고, 바뀌지 않은 회사는 버전별로 캐시된 블록을 그대로 씁니다.
+    문항 목록 대신 함수가 오면(원본 파일에서 읽는 회사) 기록할 때 호출하며, 블록은 캐시하지 않습니다.
+    결과는 results 큐에 ('saved', 경로, 시각) 또는 ('error', 경로, 예외)로 넣습니다.
+    """
+
+    def __init__(self, min_interval=15.0):
+        self.min_interval = min_interval
+        self.results = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._last_write = 0.0
+        self._block_cache = {}
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def submit(self, file_path, snapshot):
+        """기록할 스냅샷을 맡깁니다. 아직 기록되지 않은 이전 스냅샷은 버려집니다."""
+        with self._lock:
+            self._pending = (file_path, snapshot)
+        self._wakeup.set()
+
+    def close(self, file_path=None, snapshot=None, timeout=10.0):
+        """(주어졌다면) 마지막 스냅샷을 기다리지 않고 바로 기록한 뒤 작업 스레드를 종료합니다."""
+        with self._lock:
+            if snapshot is not None:
+                self._pending = (file_path, snapshot)
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            # 직전 기록으로부터 최소 간격이 지날 때까지 기다리며 편집 묶음을 한 번에 모읍니다.
+            # (종료 요청이 오면 기다리지 않고 바로 기록)
+            delay = self._last_write + self.min_interval - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+
+            with self._lock:
+                pending, self._pending = self._pending, None
+                self._wakeup.clear()
+                stopping = self._stop.is_set()
+
+            if pending is not None:
+                self._write(*pending)
+            if stopping:
+                return
+
+    @timed("autosave_write")
+    def _write(self, file_path, snapshot):
+        blocks = []
+        block_cache = {}
+        for company_name, version, questions in snapshot:
+            cached = self._block_cache.get(company_name)
+            if callable(questions):
+                block = format_company(company_name, questions())
+            elif cached is not None and cached[0] == version:
+                block = cached[1]
+            else:
+                block = format_company(company_name, questions)
+            if not callable(questions):
+                block_cache[company_name] = (version, block)
+            blocks.append(block)
+        # 스냅샷에 없는(제거된) 회사의 블록은 버립니다.
+        self._block_cache = block_cache
+
+        try:
+            atomic_write_text(file_path, lambda f: write_blocks(f, blocks))
+        except Exception as e:
+            self.results.put(('error', file_path, e))
+        else:
+            self.results.put(('saved', file_path, time.time()))
+        self._last_write = time.monotonic()
+
+
+# 파일 작업: 불러오기/저장/내보내기를 작업 스레드에서 실행하고 진행률을 화면 스레드가 읽어 갑니다.
+class JobCancelled(Exception):
+    """취소 요청을 받은 작업이 진행률을 보고하는 시점에 발생해 작업 함수를 중단시킵니다."""
+
+
+class Job:
+    """작업 스레드 하나에서 func(job, *args)를 실행하는 파일 작업
+
+    작업 함수는 job.progress(완료, 전체)로 진행률을 보고하며, 취소가 요청되었으면 그 자리에서
+    JobCancelled가 발생합니다. 진행률과 결과는 속성에만 기록하고, 화면 스레드가 after()로
+    finished와 done/total을 주기적으로 확인합니다. (작업 스레드에서 Tk를 호출하지 않음)
+    """
+
+    def __init__(self, title, func, *args):
+        self.title = title
+        self.func = func
+        self.args = args
+        self.done = 0
+        self.total = None
+        self.result = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.finished = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name=f"job: {self.title}", daemon=True)
+        self.thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = self.func(self, *self.args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.finished.set()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return isinstance(self.error, JobCancelled)
+
+    def progress(self, done, total=None):
+        """진행률을 기록합니다. 취소가 요청되었으면 JobCancelled를 발생시킵니다."""
+        if self.cancel_event.is_set():
+            raise JobCancelled(self.title)
+        self.done = done
+        self.total = total
+
+    def iterate(self, items, total=None):
+        """items를 내보내면서 항목마다 진행률을 보고합니다. (취소 확인 포함)"""
+        if total is None and hasattr(items, '__len__'):
+            total = len(items)
+        done = 0
+        for item in items:
+            self.progress(done, total)
+            yield item
+            done += 1
+        self.progress(done, total)
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
+
+
+# 편집 저널: 본 파일을 다시 쓰지 않고 바뀐 회사만 추가 기록합니다.
+class EditJournal:
+    """본 파일 옆의 추가 전용 편집 저널 ('<본 파일>.journal')
+
+    한 줄에 기록 하나를 'CRC32(16진수)<탭>JSON' 형식으로 덧붙입니다. 기록은 회사 하나의
+    최종 상태를 통째로 지정하므로(put: 문항 목록 전체, remove: 삭제) 같은 기록을 여러 번 재생해도 결과가
+    같습니다. 따라서 저널을 본 파일에 합친 뒤 저널을 줄이기 전에 프로그램이 종료되어도, 다음에 저널 전체를
+    다시 재생하면 됩니다. 기록 도중 끊긴 마지막 줄(CRC 불일치 또는 줄바꿈 없음)은 무시하고 잘라냅니다.
+
+    put/remove는 기록을 큐에 넣고 바로 반환하며, 기록 스레드가 JSON 변환, 쓰기, fsync를 맡습니다.
+    큐에 쌓인 기록은 한 번에 쓰고 fsync도 한 번만 합니다. 문항 목록은 제자리에서 수정하지 않으므로 참조만 넘깁니다.
+    compact/squash도 기록 스레드에서 실행해 덧붙이기와 겹치지 않습니다. 쓰기에 실패하면 error에 예외를 남기고
+    이후 기록은 버립니다. (호출 측에서 error를 확인)
+    """
+
+    SUFFIX = ".journal"
+
+    def __init__(self, main_path):
+        self.main_path = os.path.abspath(main_path)
+        self.path = self.main_path + self.SUFFIX
+        self.file = None
+        self.error = None
+        self.written = 0    # 파일에 기록된 바이트 수 (기록 스레드만 바꿈)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stopped = False
+        self._stop_lock = threading.Lock()   # 기록 스레드가 끝난 뒤 큐에 넣은 요청이 영영 기다리지 않도록
+
+    def read_records(self):
+        """저널의 유효한 기록 목록을 반환합니다. (저널이 없으면 빈 목록)"""
+        return self._read()[0]
+
+    def _read(self):
+        records = []
+        valid_length = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    crc, _, payload = line.rstrip(b"\n").partition(b"\t")
+                    if not line.endswith(b"\n") or crc != b"%08x" % zlib.crc32(payload):
+                        break
+                    records.append(json.loads(payload))
+                    valid_length += len(line)
+        except FileNotFoundError:
+            pass
+        return records, valid_length
+
+    def open(self, reset=False):
+        """기록할 수 있게 열고 기록 스레드를 시작합니다. reset이면 기존 기록을 버리고, 아니면 끊긴 마지막 줄만 잘라냅니다."""
+        valid_length = 0 if reset else self._read()[1]
+        self.file = open(self.path, 'ab')
+        if self.file.tell() != valid_length:
+            self.file.truncate(valid_length)
+            self.file.seek(valid_length)
+        self.written = valid_length
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="journal", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """큐에 남은 기록을 모두 쓴 뒤 기록 스레드를 끝내고 파일을 닫습니다."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def size(self):
+        """기록 스레드가 지금까지 파일에 쓴 바이트 수 (아직 큐에 있는 기록은 제외)"""
+        return self.written
+
+    @staticmethod
+    def _line(record):
+        payload = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8', 'surrogatepass')
+        return b"%08x\t%s\n" % (zlib.crc32(payload), payload)
+
+    @timed("journal_append")
+    def put(self, company_name, questions, info=None):
+        """회사의 문항 목록 전체(와 지원 정보)를 기록합니다. (추가/편집/이름 변경 후의 새 이름)"""
+        self._submit(('put', company_name, questions, info))
+
+    @timed("journal_append")
+    def remove(self, company_name):
+        self._submit(('remove', company_name))
+
+    def _submit(self, item):
+        """기록 스레드에 요청을 넘깁니다. 스레드가 이미 끝났으면 기록은 버리고, 호출 요청은 바로 실패시킵니다."""
+        with self._stop_lock:
+            if not self._stopped:
+                self._queue.put(item)
+                return
+        if item[0] == 'call':
+            item[1].set_exception(self._stopped_error())
+
+    def _stopped_error(self):
+        return self.error if self.error is not None else RuntimeError("편집 저널 기록 스레드가 종료되었습니다.")
+
+    def _call(self, func, *args):
+        """func를 기록 스레드에서 (앞서 넣은 기록을 모두 쓴 뒤) 실행하고 결과를 기다립니다."""
+        future = concurrent_futures.Future()
+        self._submit(('call', future, func, args))
+        return future.result()
+
+    def flush(self):
+        """지금까지 넣은 기록이 모두 파일에 쓰일 때까지 기다립니다."""
+        self._call(lambda: None)
+
+    def mark(self):
+        """지금까지 넣은 기록을 모두 쓴 위치를 나중에 알려주는 Future를 반환합니다. (compact 기준 위치, 기다리지 않음)"""
+        future = concurrent_futures.Future()
+        self._submit(('call', future, self.size, ()))
+        return future
+
+    def _run(self):
+        try:
+            self._loop()
+        except BaseException as e:
+            if self.error is None:
+                self.error = e
+            raise
+        finally:
+            # 종료 뒤 남은 호출 요청은 오류로 끝내, flush/mark/compact를 기다리는 쪽이 멈추지 않게 합니다.
+            with self._stop_lock:
+                self._stopped = True
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None and item[0] == 'call':
+                    item[1].set_exception(self._stopped_error())
+
+    def _loop(self):
+        while True:
+            items = [self._queue.get()]
+            # 그 사이 쌓인 기록을 모아 한 번에 쓰고 fsync 합니다.
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for item in items:
+                if item is None or item[0] == 'call':
+                    self._write(lines)
+                    lines = []
+                    if item is None:
+                        return
+                    _, future, func, args = item
+                    try:
+                        future.set_result(func(*args))
+                    except Exception as e:
+                        future.set_exception(e)
+                elif self.error is None:
+                    # 기록으로 바꿀 수 없는 값(JSON으로 쓸 수 없는 지원 정보 등)이면 error에 남기고 이후 기록은 버립니다.
+                    try:
+                        lines.append(self._line(self._record(*item)))
+                    except Exception as e:
+                        self._write(lines)
+                        lines = []
+                        self.error = e
+            self._write(lines)
+
+    @staticmethod
+    def _record(op, company_name, questions=None, info=None):
+        if op == 'remove':
+            return {"op": "remove", "company": company_name}
+        record = {"op": "put", "company": company_name, "questions": [question.row() for question in questions]}
+        if info:
+            record["info"] = info
+        return record
+
+    @timed("journal_write")
+    def _write(self, lines):
+        if not lines or self.error is not None:
+            return
+        try:
+            data = b"".join(lines)
+            self.file.write(data)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.written += len(data)
+        except Exception as e:
+            self.error = e
+
+    def compact(self, offset):
+        """offset까지의 기록은 본 파일에 합쳐졌으므로, 그 뒤의 기록만 남기도록 저널을 원자적으로 교체합니다."""
+        self._call(self._compact, offset)
+
+    @timed("journal_compact")
+    def _compact(self, offset):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            tail = f.read()
+        self._replace(lambda f: f.write(tail))
+
+    def squash(self):
+        """회사마다 마지막 기록만 남기도록 저널을 원자적으로 다시 씁니다. (본 파일은 건드리지 않음)"""
+        self._call(self._squash)
+
+    @timed("journal_squash")
+    def _squash(self):
+        latest = {}
+        for record in self._read()[0]:
+            latest.pop(record["company"], None)
+            latest[record["company"]] = record
+        lines = [self._line(record) for record in latest.values()]
+        self._replace(lambda f: f.writelines(lines))
+
+    def _replace(self, write_func):
+        """기록 스레드에서 저널 파일을 원자적으로 교체하고 다시 엽니다."""
+        self.file.close()
+        try:
+            atomic_write_bytes(self.path, write_func)
+        finally:
+            self.file = open(self.path, 'ab')
+            self.written = self.file.tell()
+
+    def discard(self):
+        """저널을 닫고 파일을 지웁니다. (기록한 변경을 버림)"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+# 대용량 텍스트 파일: 회사 경계만 색인하고 내용은 필요할 때 읽습니다.
+class TextArchive:
+    """텍스트 파일을 메모리 매핑해 회사별 바이트 범위 색인을 만들고, 요청한 회사만 파싱하는 읽기 전용 원본
+
+    색인은 '[회사명]:' 줄의 시작 위치만 찾아 만듭니다. (파서는 이 줄에서 항상 새 회사를 시작하므로
+    범위 단위로 잘라 파싱해도 전체 파싱과 결과가 같습니다.) 같은 회사명이 여러 번 나오면 범위를 모두
+    순서대로 이어 붙입니다. 색인은 '<파일>.index' 파일에 크기/수정 시각과 함께 저장해 다음에 재사용합니다.
+
+    파일을 계속 열어 두지 않고 읽을 때마다 열어서, 같은 경로에 저장(원자적 교체)해도 문제가 없습니다.
+    파일 크기나 수정 시각이 색인과 다르면 다시 색인합니다. progress(읽은 바이트, 전체 바이트)는 처음 색인할 때만 호출됩니다.
+    """
+
+    MARKER = '[회사명]:'.encode('utf-8')
+    INDEX_SUFFIX = ".index"
+    INDEX_FORMAT = 1
+
+    def __init__(self, file_path, progress=None):
+        self.file_path = os.path.abspath(file_path)
+        self.index_path = self.file_path + self.INDEX_SUFFIX
+        self.ranges = {}          # {회사명: [(시작, 끝), ...]} 파일 내 순서 유지
+        self.file_key = None      # (크기, 수정 시각 ns)
+        self.index_from_cache = False
+        self.lock = threading.Lock()
+        with open(self.file_path, 'rb') as f:
+            self._ensure_index(f, progress)
+
+    @staticmethod
+    def _file_key(f):
+        stat = os.fstat(f.fileno())
+        return stat.st_size, stat.st_mtime_ns
+
+    def _ensure_index(self, f, progress=None):
+        """열린 파일이 색인과 다르면 (캐시 파일 또는 새 스캔으로) 색인을 다시 만듭니다."""
+        file_key = self._file_key(f)
+        if file_key == self.file_key:
+            return
+        ranges = self._load_index_cache(file_key)
+        self.index_from_cache = ranges is not None
+        if ranges is None:
+            ranges = self._scan(f, file_key[0], progress)
+            self._save_index_cache(file_key, ranges)
+        self.ranges = ranges
+        self.file_key = file_key
+
+    @timed("archive_scan")
+    def _scan(self, f, size, progress=None):
+        ranges = {}
+        if size == 0:
+            return ranges
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            starts = []
+            pos = mm.find(self.MARKER)
+            while pos != -1:
+                # 파서와 같은 규칙: 줄 앞의 공백은 무시하고 줄이 표시로 시작해야 회사 경계입니다.
+                line_start = mm.rfind(b"\n", 0, pos) + 1
+                if not mm[line_start:pos].decode('utf-8', 'replace').strip():
+                    line_end = mm.find(b"\n", pos)
+                    line_end = size if line_end == -1 else line_end
+                    company_name = mm[line_start:line_end].decode('utf-8').strip().split(':', 1)[1].strip()
+                    starts.append((line_start, company_name))
+                    if progress is not None:
+                        progress(pos, size)
+                pos = mm.find(self.MARKER, pos + len(self.MARKER))
+
+        for i, (start, company_name) in enumerate(starts):
+            end = starts[i + 1][0] if i + 1 < len(starts) else size
+            ranges.setdefault(company_name, []).append((start, end))
+        return ranges
+
+    def _load_index_cache(self, file_key):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("format") != self.INDEX_FORMAT or tuple(cached.get("file_key", ())) != file_key:
+                return None
+            return {company_name: [tuple(r) for r in ranges] for company_name, ranges in cached["companies"]}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_index_cache(self, file_key, ranges):
+        cached = {"format": self.INDEX_FORMAT, "file_key": list(file_key),
+                  "companies": [[company_name, company_ranges] for company_name, company_ranges in ranges.items()]}
+        try:
+            atomic_write_text(self.index_path, lambda f: json.dump(cached, f, ensure_ascii=False))
+        except OSError:
+            pass  # 읽기 전용 위치 등: 캐시 없이 계속 사용
+
+    def company_names(self):
+        """파일에 나오는 순서대로 회사명 목록을 반환합니다."""
+        with self.lock:
+            return list(self.ranges)
+
+    @timed("archive_load_company")
+    def load_company(self, company_name):
+        """회사 하나의 바이트 범위만 읽어 파싱한 Question 목록을 반환합니다."""
+        with self.lock, open(self.file_path, 'rb') as f:
+            self._ensure_index(f)
+            ranges = self.ranges.get(company_name)
+            if not ranges:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                chunks = [mm[start:end] for start, end in ranges]
+
+        questions = []
+        for chunk in chunks:
+            for parsed_name, parsed_questions in iter_parse_companies(iter_text_lines(io.BytesIO(chunk))):
+                questions.extend(to_questions(parsed_questions))
+        return questions
+
+    def company_info(self, company_name):
+        """텍스트 형식에는 지원 정보가 없으므로 항상 None"""
+        return None
+
+    def search_company(self, company_name, query):
+        """회사 하나를 읽어 검색어(정규화된 문자열)를 포함하는 문항을 [(문항 인덱스, [필드명, ...], 제목), ...]로 반환합니다."""
+        return search_questions(self.load_company(company_name), query)
+
+
+def search_questions(questions, query):
+    """검색어(정규화된 문자열)를 포함하는 문항을 색인 없이 찾아 [(문항 인덱스, [필드명, ...], 제목), ...]로 반환합니다."""
+    hits = []
+    for index, question in enumerate(questions):
+        fields = [field_name for field_name, data_key in NgramIndex.FIELDS
+                  if query in NgramIndex.normalize(question.get(data_key))]
+        if fields:
+            hits.append((index, fields, question.title or f'문항 {index + 1}'))
+    return hits
+
+
+# --- 압축 아카이브 형식 (.sia): 회사 목록(디렉터리)만 읽고 회사는 한 번의 seek + 압축 해제로 읽음 ---
+#
+#   [헤더 32바이트] [회사 레코드 (zlib 압축)] ... [디렉터리 (zlib 압축)]
+#
+# 헤더: 매직, 형식 버전, 플래그, 디렉터리 위치/길이, 회사 수, 디렉터리 CRC32
+# 디렉터리 항목: 레코드 위치/길이, 압축 전 길이, 레코드 CRC32, 내용 해시(SHA-1), 회사명, 지원 정보(JSON, 버전 2)
+# 레코드: 문항 수, 문항마다 제목/유형/질문/답변 (길이 + UTF-8)
+#         버전 2는 이어서 태그, [읽기 전용, JSON 문항 id] (JSON, 기본값이면 None)
+# 레코드를 먼저 쓰고 디렉터리를 마지막에 쓰므로 회사를 하나씩 스트리밍으로 기록할 수 있습니다.
+# 버전 1 파일도 계속 읽습니다. (태그/읽기 전용/지원 정보 없음)
+
+ARCHIVE_EXTENSIONS = ('.sia',)
+ARCHIVE_MAGIC = b"SIAR"
+ARCHIVE_FORMAT = 2
+ARCHIVE_HEADER = struct.Struct("<4sHHQQII")
+ARCHIVE_ENTRY = struct.Struct("<QIII20sH")
+ARCHIVE_LENGTH = struct.Struct("<I")
+ARCHIVE_NONE = 0xFFFFFFFF  # 값이 None인 필드의 길이 표시
+
+
+class ArchiveError(ValueError):
+    """아카이브 파일이 아니거나, 지원하지 않는 버전이거나, 체크섬이 맞지 않을 때 발생합니다."""
+
+
+def is_archive_path(file_path):
+    return os.path.splitext(file_path)[1].lower() in ARCHIVE_EXTENSIONS
+
+
+def _encode_text(parts, value):
+    if value is None:
+        parts.append(ARCHIVE_LENGTH.pack(ARCHIVE_NONE))
+        return
+    data = value.encode('utf-8', 'surrogatepass')
+    parts.append(ARCHIVE_LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def _decode_text(view, pos):
+    (length,) = ARCHIVE_LENGTH.unpack_from(view, pos)
+    pos += ARCHIVE_LENGTH.size
+    if length == ARCHIVE_NONE:
+        return None, pos
+    return str(view[pos:pos + length], 'utf-8', 'surrogatepass'), pos + length
+
+
+def _encode_questions(questions):
+    """Question 목록을 레코드로 인코딩합니다. (Question의 모든 필드를 그대로 기록)"""
+    parts = [ARCHIVE_LENGTH.pack(len(questions))]
+    for question in questions:
+        for value in (question.title, question.type, question.question, question.answer, question.tags or None):
+            _encode_text(parts, value)
+        extra = None
+        if question.read_only or question.external_id is not None:
+            extra = json.dumps([bool(question.read_only), question.external_id], ensure_ascii=False)
+        _encode_text(parts, extra)
+    return b"".join(parts)
+
+
+def _decode_questions(data, version=ARCHIVE_FORMAT):
+    view = memoryview(data)
+    (count,), pos = ARCHIVE_LENGTH.unpack_from(view, 0), ARCHIVE_LENGTH.size
+    questions = []
+    for _ in range(count):
+        fields = []
+        for _ in range(4):
+            value, pos = _decode_text(view, pos)
+            fields.append(value)
+        if version >= 2:
+            tags, pos = _decode_text(view, pos)
+            extra, pos = _decode_text(view, pos)
+            read_only, external_id = json.loads(extra) if extra is not None else (False, None)
+            fields += [tags or "", read_only, external_id]
+        questions.append(Question(*fields))
+    return questions
+
+
+def write_archive(f, companies, level=6, infos=None):
+    """(회사명, 문항 목록) 쌍을 seek 가능한 바이너리 파일 객체에 아카이브 형식으로 기록하고 회사 수를 반환합니다.
+
+    infos({회사명: 지원 정보})는 디렉터리 항목에 함께 기록합니다.
+    같은 회사명이 여러 번 나오면 마지막 것만 디렉터리에 남습니다.
+    """
+    infos = infos or {}
+    start = f.tell()
+    f.write(bytes(ARCHIVE_HEADER.size))
+    entries = {}
+    for company_name, questions in companies:
+        raw = _encode_questions(questions)
+        record = zlib.compress(raw, level)
+        entries.pop(company_name, None)
+        # 레코드에는 내용 필드가 모두 그대로 들어가므로, 다시 읽은 문항의 해시도 이 값과 같습니다.
+        entries[company_name] = (f.tell() - start, len(record), len(raw), zlib.crc32(record),
+                                 bytes.fromhex(company_digest(questions)))
+        f.write(record)
+
+    directory = []
+    for company_name, entry in entries.items():
+        name = company_name.encode('utf-8', 'surrogatepass')
+        directory.append(ARCHIVE_ENTRY.pack(*entry, len(name)))
+        directory.append(name)
+        info = infos.get(company_name)
+        _encode_text(directory, json.dumps(info, ensure_ascii=False) if info else None)
+    directory = zlib.compress(b"".join(directory), level)
+
+    directory_offset = f.tell() - start
+    f.write(directory)
+    end = f.tell()
+    f.seek(start)
+    f.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_FORMAT, 0, directory_offset, len(directory),
+                                len(entries), zlib.crc32(directory)))
+    f.seek(end)
+    return len(entries)
+
+
+@timed("write_archive_file")
+def write_archive_file(file_path, companies, infos=None):
+    """(회사명, 문항 목록) 쌍과 지원 정보를 아카이브 파일에 원자적으로 기록하고 회사 수를 반환합니다."""
+    return atomic_write_bytes(file_path, lambda f: write_archive(f, companies, infos=infos))
+
+
+class BinaryArchive:
+    """아카이브 파일을 여는 읽기 전용 원본 (TextArchive와 같은 인터페이스)
+
+    열 때는 헤더와 디렉터리만 읽고, 회사는 요청할 때 레코드 하나만 읽어 체크섬을 확인한 뒤 압축을 풉니다.
+    파일을 계속 열어 두지 않으며, 파일 크기나 수정 시각이 바뀌면 디렉터리를 다시 읽습니다.
+    """
+
+    index_from_cache = True  # 디렉터리가 파일 안에 있으므로 따로 색인하지 않음
+
+    def __init__(self, file_path):
+        self.file_path = os.path.abspath(file_path)
+        self.entries = {}   # {회사명: (위치, 길이, 압축 전 길이, CRC32, 내용 해시)}
+        self.infos = {}     # {회사명: 지원 정보} (버전 2, 정보가 있는 회사만)
+        self.version = None
+        self.file_key = None
+        self.lock = threading.Lock()
+        with open(self.file_path, 'rb') as f:
+            self._ensure_directory(f)
+
+    def _ensure_directory(self, f):
+        stat = os.fstat(f.fileno())
+        file_key = stat.st_size, stat.st_mtime_ns
+        if file_key == self.file_key:
+            return
+
+        header = f.read(ARCHIVE_HEADER.size)
+        if len(header) < ARCHIVE_HEADER.size or header[:4] != ARCHIVE_MAGIC:
+            raise ArchiveError(f"자소서 아카이브 파일이 아닙니다: {self.file_path}")
+        magic, version, flags, directory_offset, directory_length, count, crc = ARCHIVE_HEADER.unpack(header)
+        if version > ARCHIVE_FORMAT:
+            raise ArchiveError(f"지원하지 않는 아카이브 형식 버전입니다: {version}")
+
+        f.seek(directory_offset)
+        directory = f.read(directory_length)
+        if len(directory) != directory_length or zlib.crc32(directory) != crc:
+            raise ArchiveError(f"아카이브 디렉터리가 손상되었습니다: {self.file_path}")
+        directory = zlib.decompress(directory)
+
+        entries = {}
+        infos = {}
+        pos = 0
+        for _ in range(count):
+            *entry, name_length = ARCHIVE_ENTRY.unpack_from(directory, pos)
+            pos += ARCHIVE_ENTRY.size
+            company_name = directory[pos:pos + name_length].decode('utf-8', 'surrogatepass')
+            pos += name_length
+            entries[company_name] = tuple(entry)
+            if version >= 2:
+                info, pos = _decode_text(directory, pos)
+                if info is not None:
+                    infos[company_name] = json.loads(info)
+        self.entries = entries
+        self.infos = infos
+        self.version = version
+        self.file_key = file_key
+
+    def company_names(self):
+        """아카이브에 기록된 순서대로 회사명 목록을 반환합니다."""
+        with self.lock:
+            return list(self.entries)
+
+    def digest(self, company_name):
+        """기록할 때 저장한 회사 내용 해시 (company_digest와 같은 값), 없으면 None"""
+        with self.lock:
+            entry = self.entries.get(company_name)
+        return entry[4].hex() if entry is not None else None
+
+    def company_info(self, company_name):
+        """기록할 때 저장한 지원 정보(상태/날짜/id), 없으면 None"""
+        with self.lock:
+            return self.infos.get(company_name)
+
+    @timed("archive_load_company")
+    def load_company(self, company_name):
+        """회사 하나의 레코드만 읽어 Question 목록을 반환합니다."""
+        with self.lock, open(self.file_path, 'rb') as f:
+            self._ensure_directory(f)
+            entry = self.entries.get(company_name)
+            if entry is None:
+                return []
+            offset, length, raw_length, crc, digest = entry
+            version = self.version
+            f.seek(offset)
+            record = f.read(length)
+        if len(record) != length or zlib.crc32(record) != crc:
+            raise ArchiveError(f"'{company_name}' 레코드가 손상되었습니다: {self.file_path}")
+        return _decode_questions(zlib.decompress(record, bufsize=raw_length or zlib.DEF_BUF_SIZE), version)
+
+    def search_company(self, company_name, query):
+        """회사 하나를 읽어 검색어(정규화된 문자열)를 포함하는 문항을 [(문항 인덱스, [필드명, ...], 제목), ...]로 반환합니다."""
+        return search_questions(self.load_company(company_name), query)
+
+
+def iter_archive_companies(file_path):
+    """아카이브 파일의 회사마다 (회사명, [Question, ...], 지원 정보 또는 None)를 내보냅니다."""
+    archive = BinaryArchive(file_path)
+    for company_name in archive.company_names():
+        yield company_name, archive.load_company(company_name), archive.company_info(company_name)
+
+
+def read_archive_file(file_path):
+    """아카이브 파일 전체를 {회사명: [Question, ...]}로 읽습니다. (지원 정보는 버림)"""
+    return {company_name: questions for company_name, questions, _ in iter_archive_companies(file_path)}
+
+
+# --- Jasoser.html JSON 형식 (project_data.json): 지원(회사) 배열을 원소 하나씩 스트리밍 ---
+#
+#   [{"id": "...", "company": "회사명", "date": "2024-03-01", "status": "기본",
+#     "items": [{"id": 1, "title": "...", "type": "자소서", "tags": "", "question": "...", "answer": "...",
+#                "isReadOnly": false}, ...]}, ...]
+
+JSON_EXTENSIONS = ('.json',)
+
+# 웹 도구가 새 회사에 쓰는 기본 상태
+JSON_DEFAULT_STATUS = "기본"
+
+
+def is_json_path(file_path):
+    return os.path.splitext(file_path)[1].lower() in JSON_EXTENSIONS
+
+
+def iter_json_array(binary_file, progress=None, total_bytes=None, chunk_size=1 << 20):
+    """JSON 배열 파일의 원소를 하나씩 디코딩해 내보냅니다.
+
+    메모리에는 읽기 버퍼와 원소 하나만 두므로 수백 MB 파일도 원소 크기에 비례하는 메모리로 읽습니다.
+    원소가 버퍼보다 크면 읽는 양을 두 배씩 늘려 다시 디코딩합니다. progress는 iter_text_lines와 같습니다.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    buffer = ""
+    pos = 0
+    done = 0
+    eof = False
+
+    def read_more(size):
+        nonlocal buffer, pos, done, eof
+        data = binary_file.read(size)
+        done += len(data)
+        eof = not data
+        buffer = buffer[pos:] + text_decoder.decode(data, final=eof)
+        pos = 0
+        if progress is not None:
+            progress(done, total_bytes)
+
+    def next_char():
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            read_more(chunk_size)
+
+    if next_char() != "[":
+        raise ValueError("JSON 배열 형식이 아닙니다.")
+    pos += 1
+    first = True
+    while True:
+        char = next_char()
+        if char == "]":
+            return
+        if not first:
+            if char != ",":
+                raise ValueError("JSON 형식 오류: 배열 원소 사이에 ','가 필요합니다.")
+            pos += 1
+            next_char()
+        first = False
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more(max(chunk_size, len(buffer)))
+                continue
+            if end == len(buffer) and not eof:
+                # 버퍼 끝에서 끝난 숫자 등은 잘렸을 수 있으므로 더 읽고 다시 디코딩합니다.
+                read_more(chunk_size)
+                continue
+            break
+        pos = end
+        yield value
+
+
+def _json_text(value, default=""):
+    return value if isinstance(value, str) else default if value is None else str(value)
+
+
+def json_questions(items):
+    """Jasoser.html 문항(items) 목록을 Question 목록으로 변환합니다."""
+    return [Question(_json_text(item.get("title"), "제목 없음"), _json_text(item.get("type")),
+                     _json_text(item.get("question")), _json_text(item.get("answer")),
+                     _json_text(item.get("tags")), bool(item.get("isReadOnly", False)), item.get("id"))
+            for item in items or () if isinstance(item, dict)]
+
+
+def iter_json_companies(file_path, progress=None):
+    """JSON 파일을 스트리밍 파싱해 지원마다 (회사명, [Question, ...], 지원 정보 또는 None)를 내보냅니다.
+
+    웹 도구는 같은 회사명을 여러 번 쓸 수 있으므로, 겹치는 회사명에는 ' 2', ' 3' ...을 붙입니다.
+    """
+    seen = set()
+    total_bytes = os.path.getsize(file_path)
+    with open(file_path, 'rb') as f:
+        for application in iter_json_array(f, progress, total_bytes):
+            if not isinstance(application, dict):
+                raise ValueError("JSON 배열의 원소가 지원(회사) 객체가 아닙니다.")
+            base_name = _json_text(application.get("company")).strip() or "이름 없는 회사"
+            company_name = base_name
+            number = 2
+            while company_name in seen:
+                company_name = f"{base_name} {number}"
+                number += 1
+            seen.add(company_name)
+            info = {key: application[key] for key in ("status", "date", "id") if isinstance(application.get(key), str)}
+            yield company_name, json_questions(application.get("items")), info or None
+
+
+def read_json_file(file_path, progress=None):
+    """JSON 파일을 {회사명: [Question, ...]}로 읽습니다. (지원 정보는 버림)"""
+    return {company_name: questions for company_name, questions, _ in iter_json_companies(file_path, progress)}
+
+
+def json_item_ids(questions):
+    """문항마다 JSON 문항 id를 정합니다. 읽어 온 id(external_id)는 그대로 쓰고, 없으면 겹치지 않는 정수를 붙입니다."""
+    used = {question.external_id for question in questions if question.external_id is not None}
+    next_id = max((value for value in used if isinstance(value, int) and not isinstance(value, bool)), default=0) + 1
+    ids = []
+    for question in questions:
+        item_id = question.external_id
+        if item_id is None:
+            item_id = question.id
+            if item_id in used:
+                item_id = next_id
+            next_id = max(next_id, item_id + 1)
+            used.add(item_id)
+        ids.append(item_id)
+    return ids
+
+
+def json_application(company_name, questions, info=None):
+    """회사 하나를 Jasoser.html 지원 객체로 변환합니다. 읽어 온 지원/문항 id가 있으면 그대로 씁니다."""
+    info = info or {}
+    return {
+        "id": info.get("id") or str(uuid.uuid4()),
+        "company": company_name,
+        "date": info.get("date") or time.strftime("%Y-%m-%d"),
+        "status": info.get("status") or JSON_DEFAULT_STATUS,
+        "items": [{"id": item_id, "title": question.title or "", "type": question.type or "",
+                   "tags": question.tags or "", "question": question.question or "",
+                   "answer": question.answer or "", "isReadOnly": bool(question.read_only)}
+                  for question, item_id in zip(questions, json_item_ids(questions))],
+    }
+
+
+def new_json_app_id():
+    """새 Jasoser.html 지원 id (웹 도구와 같은 UUID 문자열)"""
+    return str(uuid.uuid4())
+
+
+def write_json(f, companies):
+    """(회사명, 문항 목록, 지원 정보) 항목을 웹 도구와 같은 들여쓰기(2칸)의 JSON 배열로 회사 단위로 기록합니다."""
+    f.write("[")
+    for i, (company_name, questions, info) in enumerate(companies):
+        text = json.dumps(json_application(company_name, questions, info), ensure_ascii=False, indent=2)
+        f.write(",\n  " if i else "\n  ")
+        f.write(text.replace("\n", "\n  "))
+    f.write("\n]")
+
+
+@timed("write_json_file")
+def write_json_file(file_path, companies):
+    """(회사명, 문항 목록, 지원 정보) 항목을 JSON 파일에 원자적으로 기록합니다."""
+    atomic_write_text(file_path, lambda f: write_json(f, companies))
+
+
+# --- SQLite 스키마 / 내보내기 / 가져오기 ---
+
+# 스키마 버전 (PRAGMA user_version)
+#   1: 이전 평면 형식 - questions(company_name, ...) 단일 테이블 (버전 번호는 기록되지 않음)
+#   2: companies + questions(company_id, position, ...) 정규화 형식
+SQL_SCHEMA_VERSION = 2
+
+SQL_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS companies
+    (
+        id     INTEGER PRIMARY KEY AUTOINCREMENT,
+        name   TEXT NOT NULL UNIQUE,
+        digest TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS questions
+    (
+        id               INTEGER PRIMARY KEY AUTOINCREMENT,
+        company_id       INTEGER NOT NULL REFERENCES companies (id) ON DELETE CASCADE,
+        position         INTEGER NOT NULL,
+        question_title   TEXT,
+        question_type    TEXT,
+        question_content TEXT,
+        answer_content   TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_questions_company ON questions (company_id, position)",
+)
+
+
+# FTS5 전문 검색 색인 (questions 테이블을 외부 콘텐츠로 사용하고 트리거로 동기화)
+# trigram 토크나이저는 공백 단위가 아닌 3글자 단위로 색인하므로 조사가 붙은 한국어도 부분 문자열로 찾습니다.
+SQL_FTS_SCHEMA = (
+    """
+    CREATE VIRTUAL TABLE questions_fts USING fts5
+    (
+        question_title, question_type, question_content, answer_content,
+        content='questions', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER questions_fts_insert AFTER INSERT ON questions
+    BEGIN
+        INSERT INTO questions_fts (rowid, question_title, question_type, question_content, answer_content)
+        VALUES (new.id, new.question_title, new.question_type, new.question_content, new.answer_content);
+    END
+    """,
+    """
+    CREATE TRIGGER questions_fts_delete AFTER DELETE ON questions
+    BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, question_title, question_type, question_content, answer_content)
+        VALUES ('delete', old.id, old.question_title, old.question_type, old.question_content, old.answer_content);
+    END
+    """,
+    """
+    CREATE TRIGGER questions_fts_update
+        AFTER UPDATE OF question_title, question_type, question_content, answer_content ON questions
+    BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, question_title, question_type, question_content, answer_content)
+        VALUES ('delete', old.id, old.question_title, old.question_type, old.question_content, old.answer_content);
+        INSERT INTO questions_fts (rowid, question_title, question_type, question_content, answer_content)
+        VALUES (new.id, new.question_title, new.question_type, new.question_content, new.answer_content);
+    END
+    """,
+    "INSERT INTO questions_fts (questions_fts) VALUES ('rebuild')",
+)
+
+# trigram 색인으로 찾을 수 있는 최소 검색어 길이
+FTS_MIN_QUERY_LENGTH = 3
+
+
+def question_rows(questions):
+    """문항 목록을 SQL 행 값 (제목, 유형, 질문, 답변) 목록으로 변환합니다."""
+    return [(q_data.get('제목', '제목 없음'),
+             q_data.get('문항유형', ''),
+             q_data.get('질문', ''),
+             q_data.get('답변', ''))
+            for q_data in questions]
+
+
+def company_digest(questions):
+    """회사 문항 내용의 해시. 증분 내보내기/가져오기에서 바뀐 회사를 찾는 데 사용합니다."""
+    digest = hashlib.sha1()
+    for q_data, row in zip(questions, question_rows(questions)):
+        # 태그/읽기 전용 값은 있을 때만 넣어, 그 값이 없는 문항의 해시는 이전과 같게 유지합니다.
+        extra = (q_data.get('태그', ''), q_data.get('읽기전용', False))
+        for value in (row + extra if any(extra) else row):
+            digest.update(str(value).encode('utf-8', 'surrogatepass'))
+            digest.update(b'\0')
+        digest.update(b'\1')
+    return digest.hexdigest()
+
+
+def _table_columns(conn, table_name):
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")]
+
+
+def ensure_sql_schema(conn):
+    """SQLite 파일을 현재 스키마 버전으로 맞춥니다. 이전 평면 형식(questions.company_name)은 변환합니다.
+
+    변환은 하나의 트랜잭션으로 실행되므로 중간에 실패해도 원래 파일이 그대로 남습니다.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SQL_SCHEMA_VERSION:
+        return
+
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # BEGIN/COMMIT을 직접 관리 (DDL 포함)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            is_flat = "company_name" in _table_columns(conn, "questions")
+            if is_flat:
+                conn.execute("DROP INDEX IF EXISTS idx_questions_company_name")
+                conn.execute("ALTER TABLE questions RENAME TO questions_v1")
+
+            for statement in SQL_SCHEMA:
+                conn.execute(statement)
+            if "digest" not in _table_columns(conn, "companies"):
+                conn.execute("ALTER TABLE companies ADD COLUMN digest TEXT")
+
+            if is_flat:
+                # 회사는 처음 등장한 순서로, 문항은 기존 id 순서로 position을 매깁니다.
+                conn.execute("""
+                             INSERT INTO companies (name)
+                             SELECT company_name
+                             FROM questions_v1
+                             GROUP BY company_name
+                             ORDER BY MIN(id)
+                             """)
+                conn.execute("""
+                             INSERT INTO questions (company_id, position, question_title, question_type,
+                                                    question_content, answer_content)
+                             SELECT c.id,
+                                    ROW_NUMBER() OVER (PARTITION BY q.company_name ORDER BY q.id) - 1,
+                                    q.question_title, q.question_type, q.question_content, q.answer_content
+                             FROM questions_v1 q
+                                      JOIN companies c ON c.name = q.company_name
+                             ORDER BY q.id
+                             """)
+                if _table_columns(conn, "export_sync"):
+                    conn.execute("""
+                                 UPDATE companies
+                                 SET digest = (SELECT s.digest FROM export_sync s WHERE s.company_name = companies.name)
+                                 """)
+                conn.execute("DROP TABLE questions_v1")
+                conn.execute("DROP TABLE IF EXISTS export_sync")
+
+            conn.execute(f"PRAGMA user_version = {SQL_SCHEMA_VERSION}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.isolation_level = isolation_level
+
+
+def has_fts_index(conn):
+    """questions_fts 전문 검색 색인이 있는지 확인합니다."""
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'questions_fts'").fetchone() is not None
+
+
+def ensure_fts_index(conn):
+    """FTS5 전문 검색 색인과 동기화 트리거를 만들고 기존 행으로 색인을 채웁니다.
+
+    SQLite에 FTS5 또는 trigram 토크나이저(3.34 이상)가 없으면 만들지 않고 False를 반환합니다.
+    """
+    if has_fts_index(conn):
+        return True
+
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in SQL_FTS_SCHEMA:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+            return True
+        except sqlite3.OperationalError:
+            conn.execute("ROLLBACK")
+            return False
+    finally:
+        conn.isolation_level = isolation_level
+
+
+def _company_id(conn, company_name):
+    row = conn.execute("SELECT id FROM companies WHERE name = ?", (company_name,)).fetchone()
+    return row[0] if row else None
+
+
+def sync_company_rows(conn, company_name, questions, digest=None):
+    """회사 하나의 문항을 (회사, position) 기준으로 비교하여 바뀐 행만 UPDATE/INSERT/DELETE 합니다.
+
+    트랜잭션은 호출 측에서 관리합니다. 회사가 없으면 새로 추가합니다.
+    """
+    rows = question_rows(questions)
+    if digest is None:
+        digest = company_digest(questions)
+
+    company_id = _company_id(conn, company_name)
+    if company_id is None:
+        company_id = conn.execute("INSERT INTO companies (name, digest) VALUES (?, ?)",
+                                  (company_name, digest)).lastrowid
+        existing = []
+    else:
+        conn.execute("UPDATE companies SET digest = ? WHERE id = ?", (digest, company_id))
+        existing = conn.execute("""
+                                SELECT id, position, question_title, question_type, question_content, answer_content
+                                FROM questions
+                                WHERE company_id = ?
+                                ORDER BY position
+                                """, (company_id,)).fetchall()
+
+    updates = [(position,) + row + (old[0],)
+               for position, (old, row) in enumerate(zip(existing, rows))
+               if old[1] != position or tuple(old[2:]) != row]
+    inserts = [(company_id, position) + row for position, row in enumerate(rows) if position >= len(existing)]
+    deletes = [(old[0],) for old in existing[len(rows):]]
+
+    conn.executemany("DELETE FROM questions WHERE id = ?", deletes)
+    conn.executemany("""
+                     UPDATE questions
+                     SET position = ?, question_title = ?, question_type = ?, question_content = ?, answer_content = ?
+                     WHERE id = ?
+                     """, updates)
+    conn.executemany("""
+                     INSERT INTO questions (company_id, position, question_title, question_type,
+                                            question_content, answer_content)
+                     VALUES (?, ?, ?, ?, ?, ?)
+                     """, inserts)
+
+
+def delete_company_rows(conn, company_name):
+    """회사와 그 문항을 삭제합니다. 트랜잭션은 호출 측에서 관리합니다."""
+    company_id = _company_id(conn, company_name)
+    if company_id is not None:
+        conn.execute("DELETE FROM questions WHERE company_id = ?", (company_id,))
+        conn.execute("DELETE FROM companies WHERE id = ?", (company_id,))
+
+
+@timed("export_companies_sql")
+def export_companies_sql(file_path, companies):
+    """회사 데이터를 SQLite 파일로 내보내고 (바뀐 회사 수, 기존 파일 갱신 여부)를 반환합니다.
+
+    companies는 (회사명, 내용 해시, 문항 목록을 반환하는 함수)의 iterable입니다. 파일에 저장된 회사별
+    해시와 비교해 바뀐 회사의 행만 갱신하고, 목록에 없는 회사는 삭제합니다. 이전 평면 형식 파일은
+    먼저 현재 스키마로 변환합니다. 모든 변경은 하나의 트랜잭션입니다.
+    """
+    conn = sqlite3.connect(file_path)
+    try:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        ensure_sql_schema(conn)
+        ensure_fts_index(conn)
+
+        changed = 0
+        with conn:
+            stored_digests = dict(conn.execute("SELECT name, digest FROM companies"))
+            seen = set()
+
+            for company_name, digest, load_questions in companies:
+                seen.add(company_name)
+                if stored_digests.get(company_name) == digest:
+                    continue
+                sync_company_rows(conn, company_name, load_questions(), digest)
+                changed += 1
+
+            for company_name in stored_digests:
+                if company_name not in seen:
+                    delete_company_rows(conn, company_name)
+                    changed += 1
+
+        return changed, bool(stored_digests)
+    finally:
+        conn.close()
+
+
+def _iter_chunked(cursor, chunk_size):
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def iter_sql_companies(conn, is_unchanged=None, chunk_size=500):
+    """SQLite 파일의 회사 데이터를 저장된 순서대로 (회사명, 문항 목록)으로 내보냅니다.
+
+    커서를 chunk_size 행씩 읽습니다. is_unchanged(회사명, 해시)가 참인 회사는 문항 본문을 읽지 않고
+    (회사명, None)을 내보냅니다. 이전 평면 형식 파일은 변환하지 않고 id 순서로 읽습니다.
+    """
+    if "company_name" in _table_columns(conn, "questions"):
+        cursor = conn.execute("""
+                              SELECT company_name, question_title, question_type, question_content, answer_content
+                              FROM questions
+                              ORDER BY id
+                              """)
+        grouped = {}
+        for company_name, title, q_type, question, answer in _iter_chunked(cursor, chunk_size):
+            grouped.setdefault(company_name, []).append(
+                {"제목": title, "질문": question, "문항유형": q_type, "답변": answer})
+        yield from grouped.items()
+        return
+
+    companies = conn.execute("SELECT id, name, digest FROM companies ORDER BY id").fetchall()
+    wanted_ids = {company_id for company_id, company_name, digest in companies
+                  if not (is_unchanged and digest and is_unchanged(company_name, digest))}
+
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS import_wanted (id INTEGER PRIMARY KEY)")
+    conn.execute("DELETE FROM temp.import_wanted")
+    conn.executemany("INSERT INTO temp.import_wanted (id) VALUES (?)", [(i,) for i in wanted_ids])
+
+    cursor = conn.execute("""
+                          SELECT company_id, question_title, question_type, question_content, answer_content
+                          FROM questions
+                          WHERE company_id IN (SELECT id FROM temp.import_wanted)
+                          ORDER BY company_id, position
+                          """)
+    rows = _iter_chunked(cursor, chunk_size)
+    pending = next(rows, None)
+
+    for company_id, company_name, digest in companies:
+        if company_id not in wanted_ids:
+            yield company_name, None
+            continue
+
+        while pending is not None and pending[0] < company_id:
+            pending = next(rows, None)  # 회사 행이 없는 문항은 건너뜀
+
+        questions = []
+        while pending is not None and pending[0] == company_id:
+            _, title, q_type, question, answer = pending
+            questions.append({"제목": title, "질문": question, "문항유형": q_type, "답변": answer})
+            pending = next(rows, None)
+        yield company_name, questions
+
+
+def connect_readonly(file_path):
+    """원본 파일을 바꾸지 않도록 SQLite 파일을 읽기 전용으로 엽니다."""
+    return sqlite3.connect(pathlib.Path(file_path).resolve().as_uri() + "?mode=ro", uri=True)
+
+
+def count_sql_companies(conn):
+    """SQLite 파일에 저장된 회사 수를 반환합니다. (이전 평면 형식 파일 포함)"""
+    if "company_name" in _table_columns(conn, "questions"):
+        return conn.execute("SELECT COUNT(DISTINCT company_name) FROM questions").fetchone()[0]
+    return conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+
+@timed("read_sql_file")
+def read_sql_file(file_path, is_unchanged=None, progress=None):
+    """SQLite 파일을 읽기 전용으로 읽어 ({회사명: [Question, ...]}, [건너뛴 회사명, ...])을 반환합니다.
+
+    is_unchanged는 iter_sql_companies와 같으며, 참인 회사는 본문 없이 건너뛴 목록에 들어갑니다.
+    progress(읽은 회사 수, 전체 회사 수)는 회사마다 호출됩니다.
+    """
+    conn = connect_readonly(file_path)
+    try:
+        companies = {}
+        unchanged_names = []
+        total = count_sql_companies(conn) if progress is not None else None
+        for done, (company_name, questions) in enumerate(iter_sql_companies(conn, is_unchanged), 1):
+            if progress is not None:
+                progress(done, total)
+            if questions is None:
+                unchanged_names.append(company_name)
+            else:
+                companies.setdefault(company_name, []).extend(to_questions(questions))
+        return companies, unchanged_names
+    finally:
+        conn.close()
+
+
+# --- 여러 파일 읽기 (텍스트/SQLite, 작업 프로세스 병렬 처리) ---
+
+SQLITE_EXTENSIONS = ('.sqlite', '.sqlite3', '.db')
+
+
+def is_sqlite_path(file_path):
+    return os.path.splitext(file_path)[1].lower() in SQLITE_EXTENSIONS
+
+
+def read_companies(file_path, progress=None):
+    """확장자에 따라 텍스트, SQLite, 아카이브 또는 JSON 파일을 읽어 {회사명: [Question, ...]}로 반환합니다."""
+    if is_sqlite_path(file_path):
+        return read_sql_file(file_path, progress=progress)[0]
+    if is_archive_path(file_path):
+        return read_archive_file(file_path)
+    if is_json_path(file_path):
+        return read_json_file(file_path, progress)
+    return read_text_file(file_path, progress)
+
+
+def read_company_digests(file_path, progress=None):
+    """작업 프로세스에서 실행: 파일을 읽어 [(회사명, 내용 해시, [문항 내용 튜플, ...], 지원 정보), ...]을 반환합니다.
+
+    프로세스 간 전달 비용이 작도록 Question 대신 내용 튜플을 돌려주며, 해시도 작업 프로세스에서 계산합니다.
+    지원 정보는 JSON과 아카이브 파일에만 있고 나머지 형식은 None입니다. JSON은 회사 단위로 읽으며 바로 튜플로 바꿉니다.
+    """
+    if is_json_path(file_path):
+        companies = iter_json_companies(file_path, progress)
+    elif is_archive_path(file_path):
+        companies = iter_archive_companies(file_path)
+    else:
+        companies = ((company_name, questions, None)
+                     for company_name, questions in read_companies(file_path, progress).items())
+    return [(company_name, company_digest(questions), [question.row() for question in questions], info)
+            for company_name, questions, info in companies]
+
+
+def replay_journal(companies, records):
+    """read_company_digests 결과에 편집 저널 기록을 차례로 적용한 목록을 반환합니다. (편집된 회사는 제자리 유지)"""
+    merged = {company_name: (digest, rows, info) for company_name, digest, rows, info in companies}
+    for record in records:
+        company_name = record["company"]
+        if record["op"] == "put":
+            rows = [tuple(row) for row in record["questions"]]
+            merged[company_name] = (company_digest([Question(*row) for row in rows]), rows, record.get("info"))
+        else:
+            merged.pop(company_name, None)
+    return [(company_name, digest, rows, info) for company_name, (digest, rows, info) in merged.items()]
+
+
+def run_tasks(func, tasks, jobs):
+    """tasks를 func로 처리해 입력 순서대로 (작업, 결과, 오류) 를 내보냅니다. jobs가 1이면 현재 프로세스에서 실행합니다.
+
+    func는 작업 프로세스에서 실행되므로 모듈 수준 함수여야 합니다. 중간에 반복을 멈추면(close)
+    아직 시작하지 않은 작업은 취소하고, 실행 중인 작업은 기다리지 않습니다.
+    현재 프로세스에서 실행할 때 func가 job.progress로 JobCancelled를 일으키면 오류로 모으지 않고 그대로 전달합니다.
+    """
+    tasks = list(tasks)
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            try:
+                result = func(task)
+            except JobCancelled:
+                raise  # 작업 취소는 파일 오류가 아니므로 작업 전체를 중단합니다.
+            except Exception as e:
+                yield task, None, e
+            else:
+                yield task, result, None
+        return
+
+    executor = concurrent_futures.ProcessPoolExecutor(max_workers=min(jobs, len(tasks)))
+    try:
+        futures = [executor.submit(func, task) for task in tasks]
+        for task, future in zip(tasks, futures):
+            try:
+                yield task, future.result(), None
+            except Exception as e:
+                yield task, None, e
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 검색 색인: 전체 문항 검색을 위한 n-gram 역색인
+class NgramIndex:
+    """회사별 문항의 제목/유형/질문/답변 필드에 대한 한글 음절 단위 3-gram 역색인
+
+    문서 키는 (회사명, 문항 인덱스, 필드명)이며, 각 3-gram마다 해당 3-gram을 포함하는
+    문서 키 집합(posting list)을 유지합니다. 검색어의 3-gram posting list를 교집합한 후보만
+    실제 부분 문자열 여부를 확인합니다. 3음절보다 짧은 검색어는 정규화된 필드 텍스트를 직접 훑습니다.
+
+    update_company/remove_company는 바뀐 회사만 기록해 두고 바로 반환하며, 실제 색인은 다음 검색
+    (검색 작업 스레드) 또는 flush()에서 만듭니다. 그래서 편집/불러오기 중 화면 스레드는 색인 비용을 치르지 않습니다.
+    """
+
+    GRAM = 3
+
+    # (검색 결과에 표시할 필드명, 문항 데이터 키)
+    FIELDS = (("제목", "제목"), ("유형", "문항유형"), ("질문", "질문"), ("답변", "답변"))
+
+    def __init__(self):
+        self.docs = {}            # {문서 키: 정규화된 텍스트}
+        self.postings = {}        # {3-gram: {문서 키, ...}}
+        self.company_docs = {}    # {회사명: {문서 키, ...}}
+        self.pending = {}         # {회사명: 문항 목록 또는 None(제거)} 아직 색인에 반영하지 않은 변경
+
+        # 검색은 작업 스레드에서도 실행되므로 색인 변경/조회를 직렬화합니다.
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text):
+        """한글 조합형(NFD) 입력도 같은 음절로 비교되도록 NFC 정규화 후 소문자로 바꿉니다."""
+        return unicodedata.normalize('NFC', text or "").lower()
+
+    def _grams(self, text):
+        n = self.GRAM
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def _add_doc(self, key, text):
+        self.docs[key] = text
+        self.company_docs.setdefault(key[0], set()).add(key)
+        for gram in self._grams(text):
+            self.postings.setdefault(gram, set()).add(key)
+
+    def _remove_doc(self, key):
+        text = self.docs.pop(key)
+        self.company_docs[key[0]].discard(key)
+        for gram in self._grams(text):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self.postings[gram]
+
+    def update_company(self, company_name, questions):
+        """회사의 문항 목록이 바뀌었음을 기록합니다. (문항 목록은 제자리 수정 없이 교체되므로 참조만 보관)"""
+        with self.lock:
+            self.pending[company_name] = questions
+
+    def remove_company(self, company_name):
+        """회사가 제거되었음을 기록합니다."""
+        with self.lock:
+            self.pending[company_name] = None
+
+    @timed("search_index_update")
+    def flush(self, cancel_event=None):
+        """기록해 둔 변경을 색인에 반영합니다. 취소되면 False를 반환하며 남은 변경은 다음에 반영합니다."""
+        with self.lock:
+            return self._flush(cancel_event)
+
+    def _flush(self, cancel_event=None):
+        while self.pending:
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            company_name = next(iter(self.pending))
+            questions = self.pending.pop(company_name)
+            self._update_company(company_name, questions or ())
+        return True
+
+    def _update_company(self, company_name, questions):
+        """내용이 바뀐 필드만 다시 색인합니다."""
+        new_docs = {}
+        for i, q_data in enumerate(questions):
+            for field_name, data_key in self.FIELDS:
+                default = f'문항 {i + 1}' if data_key == '제목' else ''
+                text = self.normalize(q_data.get(data_key, default))
+                if text:
+                    new_docs[(company_name, i, field_name)] = text
+
+        for key in list(self.company_docs.get(company_name, ())):
+            if new_docs.get(key) != self.docs[key]:
+                self._remove_doc(key)
+
+        for key, text in new_docs.items():
+            if key not in self.docs:
+                self._add_doc(key, text)
+
+        if not self.company_docs.get(company_name):
+            self.company_docs.pop(company_name, None)
+
+    @timed("search_index_query")
+    def search(self, query, cancel_event=None):
+        """검색어를 부분 문자열로 포함하는 문항을 [(회사명, 문항 인덱스, [필드명, ...]), ...]로 반환합니다.
+
+        아직 반영하지 않은 변경이 있으면 먼저 색인합니다.
+        cancel_event(threading.Event)가 설정되면 중간에 중단하고 None을 반환합니다.
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+
+        with self.lock:
+            if not self._flush(cancel_event):
+                return None
+            return self._search(query, cancel_event)
+
+    def _search(self, query, cancel_event):
+        if len(query) < self.GRAM:
+            # 짧은 검색어는 posting list로 후보를 줄일 수 없으므로 모든 필드 텍스트를 훑습니다.
+            candidates = self.docs
+        else:
+            posting_lists = []
+            for gram in self._grams(query):
+                posting = self.postings.get(gram)
+                if not posting:
+                    return []
+                posting_lists.append(posting)
+
+            # 가장 작은 posting list부터 교집합
+            posting_lists.sort(key=len)
+            candidates = set(posting_lists[0])
+            for posting in posting_lists[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+
+        # 3-gram이 모두 있어도 연속된 부분 문자열이 아닐 수 있으므로 최종 확인
+        matched = {}
+        field_order = {field_name: i for i, (field_name, _) in enumerate(self.FIELDS)}
+        for checked, key in enumerate(candidates):
+            if cancel_event is not None and checked % 1024 == 0 and cancel_event.is_set():
+                return None
+            if len(query) == self.GRAM or query in self.docs[key]:
+                matched.setdefault(key[:2], []).append(key[2])
+
+        return [(company_name, index, sorted(fields, key=field_order.get))
+                for (company_name, index), fields in sorted(matched.items())]
+
+
+# 회사명 정렬 색인: 회사 목록 Treeview의 순서와 필터링 기준
+class SortedNameIndex:
+    """회사명을 정렬된 리스트로 유지하는 색인 (bisect로 삽입/삭제, 접두어/부분 문자열 필터)"""
+
+    def __init__(self, names=()):
+        self.names = sorted(names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        i = bisect.bisect_left(self.names, name)
+        return i < len(self.names) and self.names[i] == name
+
+    def index(self, name):
+        """정렬 순서에서 name의 위치를 반환합니다."""
+        return bisect.bisect_left(self.names, name)
+
+    def add(self, name):
+        """이름을 정렬 위치에 삽입합니다. 이미 있으면 아무것도 하지 않습니다."""
+        i = bisect.bisect_left(self.names, name)
+        if i == len(self.names) or self.names[i] != name:
+            self.names.insert(i, name)
+
+    def update(self, names):
+        """여러 이름을 한 번에 추가합니다. (가져오기처럼 많이 추가할 때 삽입을 반복하지 않고 한 번 정렬)"""
+        self.names = sorted(set(self.names).union(names))
+
+    def discard(self, name):
+        """이름을 제거합니다. 없으면 아무것도 하지 않습니다."""
+        i = bisect.bisect_left(self.names, name)
+        if i < len(self.names) and self.names[i] == name:
+            del self.names[i]
+
+    def prefix_range(self, prefix):
+        """prefix로 시작하는 이름들의 (시작, 끝) 위치를 이진 탐색으로 구합니다."""
+        start = bisect.bisect_left(self.names, prefix)
+        end = bisect.bisect_left(self.names, prefix + '\U0010ffff', start)
+        return start, end
+
+    def filter(self, text):
+        """text로 시작하는 이름을 먼저, 그 밖에 text를 (대소문자 무시) 포함하는 이름을 뒤에 정렬 순서로 반환합니다."""
+        start, end = self.prefix_range(text)
+        lowered = text.lower()
+        rest = [name for name in self.names[:start] + self.names[end:] if lowered in name.lower()]
+        return self.names[start:end] + rest
+
+
+# SQLite 문서 저장소: 회사 목록만 먼저 읽고, 문항은 회사를 선택할 때 불러옵니다.
+class DocumentStore:
+    """WAL 저널 모드의 SQLite 파일을 기본 저장소로 사용하는 문서 저장소 (스키마는 SQL 내보내기와 동일)
+
+    쓰기는 저장소를 연 스레드에서만 합니다. load_company는 작업 스레드에서도 호출할 수 있으며,
+    그때는 스레드별 읽기 전용 연결을 씁니다. (WAL 모드에서 쓰기와 동시 실행 가능)
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.owner_thread = threading.get_ident()
+        self.readers = threading.local()
+        self.search_conn = None
+        self.search_lock = threading.Lock()
+        self.conn = sqlite3.connect(file_path)
+        try:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            ensure_sql_schema(self.conn)
+            self.has_fts = ensure_fts_index(self.conn)
+        except Exception:
+            self.conn.close()
+            raise
+
+    def close(self):
+        with self.search_lock:
+            if self.search_conn is not None:
+                self.search_conn.close()
+                self.search_conn = None
+        self.conn.close()
+
+    def company_names(self):
+        """저장된 회사명 목록을 추가된 순서대로 반환합니다. (문항 내용은 읽지 않음)"""
+        return [name for (name,) in self.conn.execute("SELECT name FROM companies ORDER BY id")]
+
+    def _read_conn(self):
+        """현재 스레드에서 읽기에 쓸 연결 (저장소를 연 스레드는 기본 연결, 그 외는 스레드별 읽기 전용 연결)"""
+        if threading.get_ident() == self.owner_thread:
+            return self.conn
+        conn = getattr(self.readers, "conn", None)
+        if conn is None:
+            conn = self.readers.conn = connect_readonly(self.file_path)
+        return conn
+
+    def _search_conn(self):
+        """검색 전용 읽기 연결 (search_lock을 잡은 상태에서 호출, 검색마다 새로 열지 않고 재사용)
+
+        대소문자/조합형 비교가 메모리 색인(NgramIndex.normalize)과 같도록 정규화 함수를 등록합니다.
+        """
+        if self.search_conn is None:
+            conn = sqlite3.connect(pathlib.Path(self.file_path).resolve().as_uri() + "?mode=ro", uri=True,
+                                   check_same_thread=False)
+            conn.create_function("normalize_text", 1, NgramIndex.normalize, deterministic=True)
+            self.search_conn = conn
+        return self.search_conn
+
+    @timed("store_load_company")
+    def load_company(self, company_name):
+        """회사 하나의 문항 목록을 순서대로 읽어옵니다."""
+        rows = self._read_conn().execute("""
+                                 SELECT q.question_title, q.question_type, q.question_content, q.answer_content
+                                 FROM questions q
+                                          JOIN companies c ON c.id = q.company_id
+                                 WHERE c.name = ?
+                                 ORDER BY q.position
+                                 """, (company_name,))
+        return [Question(title, q_type, question, answer) for title, q_type, question, answer in rows]
+
+    @timed("store_save_company")
+    def save_company(self, company_name, questions):
+        """회사 하나의 문항 목록을 하나의 트랜잭션으로 기록합니다. (바뀐 행만 갱신, 없으면 새로 추가)"""
+        with self.conn:
+            sync_company_rows(self.conn, company_name, questions)
+
+    @timed("store_save_companies")
+    def save_companies(self, companies):
+        """[(회사명, 문항 목록), ...]을 하나의 트랜잭션으로 기록합니다. (가져오기 병합용)"""
+        with self.conn:
+            for company_name, questions in companies:
+                sync_company_rows(self.conn, company_name, questions)
+
+    def rename_company(self, old_name, new_name):
+        with self.conn:
+            self.conn.execute("UPDATE companies SET name = ? WHERE name = ?", (new_name, old_name))
+
+    def delete_company(self, company_name):
+        with self.conn:
+            delete_company_rows(self.conn, company_name)
+
+    @timed("store_search")
+    def search(self, query, cancel_event=None):
+        """문항을 검색해 [(회사명, 문항 인덱스, [필드명, ...], 제목, 미리보기), ...]를 반환합니다.
+
+        검색어가 3글자 이상이고 FTS5 색인이 있으면 색인으로 찾아 관련도(bm25) 순으로 정렬하고
+        일치 부분의 미리보기(snippet)를 함께 반환합니다. 그 외에는 부분 문자열 검사로 찾습니다.
+        작업 스레드에서 호출되므로 검색 전용 읽기 연결을 사용합니다. (WAL 모드에서 쓰기와 동시 실행 가능)
+        일치 여부는 Python의 NgramIndex.normalize로 판단하므로 메모리 색인 검색과 결과가 같습니다.
+        cancel_event가 설정되면 SQLite 실행을 중단하고 None을 반환합니다.
+        """
+        query = NgramIndex.normalize(query)
+        if not query:
+            return []
+
+        flag_columns = """
+                       instr(normalize_text(q.question_title), :q) > 0,
+                       instr(normalize_text(q.question_type), :q) > 0,
+                       instr(normalize_text(q.question_content), :q) > 0,
+                       instr(normalize_text(q.answer_content), :q) > 0
+                       """
+        if self.has_fts and len(query) >= FTS_MIN_QUERY_LENGTH:
+            sql = f"""
+                  SELECT c.name, q.position, q.question_title,
+                         snippet(questions_fts, -1, '[', ']', '…', 16),
+                         {flag_columns}
+                  FROM questions_fts f
+                           JOIN questions q ON q.id = f.rowid
+                           JOIN companies c ON c.id = q.company_id
+                  WHERE questions_fts MATCH :match
+                  ORDER BY f.rank
+                  """
+        else:
+            sql = f"""
+                  SELECT c.name, q.position, q.question_title, NULL,
+                         {flag_columns}
+                  FROM questions q
+                           JOIN companies c ON c.id = q.company_id
+                  WHERE instr(normalize_text(coalesce(q.question_title, '') || char(10) ||
+                                             coalesce(q.question_type, '') || char(10) ||
+                                             coalesce(q.question_content, '') || char(10) ||
+                                             coalesce(q.answer_content, '')), :q) > 0
+                  ORDER BY c.name, q.position
+                  """
+        # 검색어 전체를 하나의 구문(phrase)으로 검색
+        match = '"' + query.replace('"', '""') + '"'
+
+        with self.search_lock:
+            conn = self._search_conn()
+            conn.set_progress_handler(cancel_event.is_set if cancel_event is not None else None, 10000)
+            try:
+                rows = conn.execute(sql, {"q": query, "match": match}).fetchall()
+            except sqlite3.OperationalError:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                raise
+
+        # FTS 후보 중 정규화한 텍스트에 실제로 들어 있지 않은 행은 메모리 검색과 맞추기 위해 제외합니다.
+        field_names = [field_name for field_name, _ in NgramIndex.FIELDS]
+        return [(company_name, position, [name for name, hit in zip(field_names, flags) if hit], title, snippet)
+                for company_name, position, title, snippet, *flags in rows if any(flags)]
@@ -0,0 +1,59 @@
+# selfintroduce_cli 테스트 (python -m pytest)
+from selfintroduce_cli import main
+from selfintroduce_core import Question, read_company_digests, read_text_file, write_text_file
+
+
+def write_sample(path, companies):
+    write_text_file(str(path), ((name, [Question(*fields) for fields in questions])
+                                for name, questions in companies.items()))
+
+
+def test_convert_files_in_worker_processes(tmp_path):
+    write_sample(tmp_path / "a.txt", {"삼성": [("지원동기", "자소서", "q", "a")]})
+    write_sample(tmp_path / "b.txt", {"LG": [("협업", "", "q", "a")], "빈 회사": []})
+    out_dir = tmp_path / "out"
+    assert main(["-q", "-j", "2", "to-sqlite", str(tmp_path / "a.txt"), str(tmp_path / "b.txt"),
+                 "-d", str(out_dir)]) == 0
+    assert [company[0] for company in read_company_digests(str(out_dir / "b.sqlite"))] == ["LG", "빈 회사"]
+
+    assert main(["-q", "to-text", str(out_dir / "a.sqlite"), str(out_dir / "b.sqlite")]) == 0
+    assert list(read_text_file(str(out_dir / "b.txt"))) == ["LG", "빈 회사"]
+
+
+def test_convert_refuses_to_overwrite_input(tmp_path, capsys):
+    path = tmp_path / "a.txt"
+    write_sample(path, {"삼성": [("지원동기", "", "q", "a")]})
+    before = path.read_bytes()
+    assert main(["-q", "to-text", str(path)]) == 1
+    assert "입력 파일과 같습니다" in capsys.readouterr().err
+    assert path.read_bytes() == before
+
+
+def test_merge_later_files_win_and_keep_infos(tmp_path):
+    write_sample(tmp_path / "a.txt", {"삼성": [("옛 문항", "", "q", "a")], "LG": []})
+    (tmp_path / "b.json").write_text(
+        '[{"id": "app-9", "company": "삼성", "date": "2024-03-01", "status": "서합", "items": '
+        '[{"id": 5, "title": "새 문항", "type": "", "question": "q", "answer": "a"}]}]', encoding="utf-8")
+    output = tmp_path / "all.sia"
+    assert main(["-q", "-j", "2", "merge", "-o", str(output), str(tmp_path / "a.txt"), str(tmp_path / "b.json")]) == 0
+
+    merged = read_company_digests(str(output))
+    assert [(name, [row[0] for row in rows]) for name, _, rows, _ in merged] == [("LG", []), ("삼성", ["새 문항"])]
+    assert merged[1][3]["id"] == "app-9"
+
+
+def test_merge_stops_on_unreadable_input(tmp_path):
+    write_sample(tmp_path / "a.txt", {"삼성": []})
+    output = tmp_path / "all.txt"
+    args = ["-q", "merge", "-o", str(output), str(tmp_path / "a.txt"), str(tmp_path / "missing.txt")]
+    assert main(args) == 1
+    assert not output.exists()
+    assert main(args[:2] + ["-k"] + args[2:]) == 1
+    assert list(read_text_file(str(output))) == ["삼성"]
+
+
+def test_search_prints_matching_questions(tmp_path, capsys):
+    path = tmp_path / "a.txt"
+    write_sample(path, {"삼성": [("지원동기", "", "Hello World", ""), ("성장과정", "", "", "가나다")]})
+    assert main(["-q", "search", "WORLD", str(path)]) == 0
+    assert capsys.readouterr().out.splitlines() == [f"{path}\t삼성\t1\t지원동기\t질문"]
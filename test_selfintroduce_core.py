@@ -0,0 +1,402 @@
+# selfintroduce_core 테스트 (python -m pytest)
+import io
+import json
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from selfintroduce_core import (
+    ArchiveError, AutosaveWriter, BinaryArchive, CharCounter, DocumentStore, EditJournal, JobCancelled, NgramIndex,
+    Question, SortedNameIndex, TextArchive, company_digest, export_companies_sql, format_company, iter_json_array,
+    parse_companies, read_company_digests, read_json_file, read_sql_file, read_text_file, replay_journal, run_tasks,
+    write_archive_file, write_blocks, write_json_file, write_text_file, ARCHIVE_HEADER,
+)
+
+
+def sample_companies():
+    return {
+        "삼성전자": [Question("지원동기", "자소서", "지원한 이유는?", "첫 줄\n둘째 줄\n\n넷째 줄"),
+                  Question("성장과정", "", "", "")],
+        "LG": [Question("협업 경험", "경험", "협업한 경험을 쓰세요.", "--- 답변 안의 구분선 비슷한 줄")],
+        "빈 회사": [],
+    }
+
+
+def contents(companies):
+    return {company_name: [question.content()[:4] for question in questions]
+            for company_name, questions in companies.items()}
+
+
+def totals(counter):
+    return counter.chars, counter.spaces, counter.newlines, counter.ascii, counter.utf8
+
+
+# --- 글자수 카운터 ---
+
+def test_char_counter_byte_modes():
+    counter = CharCounter("가 a\nb")
+    assert (counter.chars, counter.no_space) == (5, 4)
+    assert (counter.utf8_bytes(), counter.utf8_bytes(2)) == (7, 8)
+    assert (counter.euckr_bytes(), counter.euckr_bytes(2)) == (6, 7)
+
+
+def test_char_counter_tracks_deltas():
+    counter = CharCounter("첫 줄\n")
+    counter.add("둘째 😀 줄")
+    counter.remove("첫 ")
+    counter.remove("😀")
+    assert totals(counter) == totals(CharCounter("줄\n둘째  줄"))
+    counter.remove("줄\n둘째  줄")
+    assert totals(counter) == (0, 0, 0, 0, 0)
+
+
+# --- 검색 색인 ---
+
+def test_ngram_index_is_built_lazily():
+    index = NgramIndex()
+    index.update_company("A", [Question("지원 동기", "", "Hello World", "가나다라")])
+    assert index.postings == {}
+    assert index.search("world") == [("A", 0, ["질문"])]
+    assert index.search("가") == [("A", 0, ["답변"])]
+    index.update_company("A", [Question("", "", "", "마바사"), Question("가나다", "", "", "")])
+    assert index.search("가나다") == [("A", 1, ["제목"])]
+    index.remove_company("A")
+    assert index.search("가나다") == []
+
+
+# --- 구조화된 텍스트 ---
+
+def test_text_round_trip(tmp_path):
+    companies = sample_companies()
+    path = tmp_path / "data.txt"
+    write_text_file(str(path), companies.items())
+    assert contents(read_text_file(str(path))) == contents(companies)
+
+
+def test_format_then_parse_is_stable():
+    companies = sample_companies()
+    buffer = io.StringIO()
+    write_blocks(buffer, (format_company(name, questions) for name, questions in companies.items()))
+    text = buffer.getvalue()
+    parsed = parse_companies(io.StringIO(text))
+    buffer = io.StringIO()
+    write_blocks(buffer, (format_company(name, questions) for name, questions in parsed.items()))
+    assert buffer.getvalue() == text
+
+
+# --- SQLite 문서 저장소 ---
+
+def test_store_loads_companies_lazily_and_renames(tmp_path):
+    path = str(tmp_path / "store.sqlite")
+    store = DocumentStore(path)
+    try:
+        for name, questions in sample_companies().items():
+            store.save_company(name, questions)
+        store.rename_company("LG", "LG전자")
+        store.delete_company("빈 회사")
+    finally:
+        store.close()
+
+    store = DocumentStore(path)
+    try:
+        assert store.company_names() == ["삼성전자", "LG전자"]
+        assert contents({"LG전자": store.load_company("LG전자")}) == contents({"LG전자": sample_companies()["LG"]})
+        assert store.load_company("LG") == []
+
+        # 작업 스레드에서는 스레드별 읽기 연결로 기록된 내용을 읽습니다.
+        store.save_company("삼성전자", [Question("새 문항", "", "q", "a")])
+        result = []
+        worker = threading.Thread(target=lambda: result.append(store.load_company("삼성전자")))
+        worker.start()
+        worker.join()
+        assert [question.title for question in result[0]] == ["새 문항"]
+    finally:
+        store.close()
+
+
+# --- SQL 내보내기 ---
+
+def _export(path, companies):
+    return export_companies_sql(str(path), ((name, company_digest(questions), lambda questions=questions: questions)
+                                            for name, questions in companies.items()))
+
+
+def test_sql_export_syncs_only_changed_companies(tmp_path):
+    path = tmp_path / "data.sqlite"
+    companies = sample_companies()
+    assert _export(path, companies) == (len(companies), False)
+    assert _export(path, companies) == (0, True)
+
+    companies["LG"] = [companies["LG"][0].replace(answer="새 답변")]
+    del companies["빈 회사"]
+    assert _export(path, companies) == (2, True)
+    assert contents(read_sql_file(str(path))[0]) == contents(companies)
+
+
+def test_sql_migrates_flat_schema(tmp_path):
+    path = tmp_path / "old.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE questions (id INTEGER PRIMARY KEY AUTOINCREMENT, company_name TEXT,
+                    question_title TEXT, question_type TEXT, question_content TEXT, answer_content TEXT)""")
+    conn.executemany("INSERT INTO questions (company_name, question_title, question_type, question_content, "
+                     "answer_content) VALUES (?, ?, ?, ?, ?)",
+                     [("B", "b1", "", "q", "a"), ("A", "a1", "", "q", "a"), ("B", "b2", "", "q2", "a2")])
+    conn.commit()
+    conn.close()
+
+    store = DocumentStore(str(path))
+    try:
+        assert store.company_names() == ["B", "A"]
+        assert [question.title for question in store.load_company("B")] == ["b1", "b2"]
+    finally:
+        store.close()
+
+
+def test_store_search_folds_non_ascii_case(tmp_path):
+    store = DocumentStore(str(tmp_path / "store.sqlite"))
+    try:
+        store.save_company("회사", [Question("ÄRGER 제목", "", "Über 질문", "답변")])
+        hits = store.search("über")
+        assert [(name, index, fields) for name, index, fields, _, _ in hits] == [("회사", 0, ["질문"])]
+        result = []
+        worker = threading.Thread(target=lambda: result.append(store.search("ärger")))
+        worker.start()
+        worker.join()
+        assert [hit[2] for hit in result[0]] == [["제목"]]
+    finally:
+        store.close()
+
+
+# --- 회사 목록 필터 ---
+
+def test_sorted_name_index_filters_prefix_first():
+    index = SortedNameIndex(["삼성전자", "LG전자", "삼성SDI", "카카오"])
+    index.add("삼성")
+    index.add("카카오")
+    index.update(["현대전자", "LG전자"])
+    index.discard("없는 회사")
+    assert index.names == ["LG전자", "삼성", "삼성SDI", "삼성전자", "카카오", "현대전자"]
+    assert index.prefix_range("삼성") == (1, 4)
+    assert index.prefix_range("네이버") == (1, 1)
+    assert index.filter("삼성") == ["삼성", "삼성SDI", "삼성전자"]
+    assert index.filter("전자") == ["LG전자", "삼성전자", "현대전자"]
+    assert index.filter("sdi") == ["삼성SDI"]
+
+    index.discard("삼성")
+    assert "삼성" not in index and "삼성SDI" in index
+    assert index.filter("") == index.names
+
+
+# --- 자동 저장 ---
+
+def test_autosave_coalesces_snapshots_and_writes_on_close(tmp_path):
+    path = str(tmp_path / "autosave.txt")
+    writer = AutosaveWriter(min_interval=60)
+    lg = sample_companies()["LG"]
+    writer.submit(path, [("LG", 1, lg)])
+    assert writer.results.get(timeout=5)[:2] == ("saved", path)
+
+    # 최소 간격 안에 들어온 스냅샷은 기록하지 않고, 종료할 때 마지막 것만 바로 기록합니다.
+    writer.submit(path, [("LG", 1, lg), ("A", 1, [Question("첫 스냅샷")])])
+    writer.submit(path, [("LG", 1, lg), ("B", 1, lambda: [Question("둘째 스냅샷")])])
+    assert writer.results.empty()
+    writer.close(path, [("LG", 1, lg), ("C", 1, [Question("마지막")])])
+    assert writer.results.get_nowait()[:2] == ("saved", path)
+    assert writer.results.empty()
+    assert contents(read_text_file(path)) == contents({"LG": lg, "C": [Question("마지막")]})
+
+
+def test_autosave_reports_write_errors(tmp_path):
+    path = str(tmp_path / "missing" / "autosave.txt")
+    writer = AutosaveWriter(min_interval=0)
+    writer.close(path, [("A", 1, [])])
+    status, error_path, error = writer.results.get_nowait()
+    assert (status, error_path) == ("error", path)
+    assert isinstance(error, OSError)
+
+
+# --- 큰 텍스트 파일 지연 읽기 ---
+
+def test_text_archive_loads_companies_by_range(tmp_path):
+    path = str(tmp_path / "big.txt")
+    companies = sample_companies()
+    write_text_file(path, [("삼성전자", companies["삼성전자"][:1]), ("LG", companies["LG"]),
+                           ("삼성전자", companies["삼성전자"][1:]), ("빈 회사", [])])
+
+    archive = TextArchive(path)
+    assert not archive.index_from_cache
+    assert archive.company_names() == ["삼성전자", "LG", "빈 회사"]
+    assert contents({"삼성전자": archive.load_company("삼성전자")}) == contents({"삼성전자": companies["삼성전자"]})
+    assert archive.load_company("빈 회사") == [] and archive.load_company("없는 회사") == []
+
+    # 두 번째로 열 때는 '.index' 파일의 색인을 재사용합니다.
+    assert TextArchive(path).index_from_cache
+
+    # 파일이 바뀌면 다시 색인합니다.
+    write_text_file(path, [("LG", []), ("카카오", companies["LG"])])
+    assert contents({"카카오": archive.load_company("카카오")}) == contents({"카카오": companies["LG"]})
+    assert archive.company_names() == ["LG", "카카오"]
+    reopened = TextArchive(path)
+    assert reopened.index_from_cache and reopened.company_names() == ["LG", "카카오"]
+
+
+# --- 여러 파일 병렬 처리 ---
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_tasks_collects_errors_per_task(jobs):
+    results = [(task, result, type(error)) for task, result, error in run_tasks(int, ["1", "x", "3"], jobs)]
+    assert results == [("1", 1, type(None)), ("x", None, ValueError), ("3", 3, type(None))]
+
+
+def test_run_tasks_propagates_cancel():
+    def convert(task):
+        if task == "stop":
+            raise JobCancelled()
+        return task
+
+    tasks = run_tasks(convert, ["a", "stop", "b"], 1)
+    assert next(tasks) == ("a", "a", None)
+    with pytest.raises(JobCancelled):
+        next(tasks)
+
+
+# --- 압축 아카이브 ---
+
+def test_archive_keeps_all_fields_and_digest(tmp_path):
+    path = str(tmp_path / "data.sia")
+    questions = [Question("t", "유형", "q", "a", "태그", True, 123), Question(None, "", "", "")]
+    info = {"status": "서합", "date": "2024-03-01", "id": "app-1"}
+    write_archive_file(path, [("회사", questions), ("빈 회사", [])], {"회사": info})
+
+    archive = BinaryArchive(path)
+    loaded = archive.load_company("회사")
+    assert [question.row() for question in loaded] == [question.row() for question in questions]
+    assert archive.digest("회사") == company_digest(loaded)
+    assert archive.company_info("회사") == info
+    assert archive.company_info("빈 회사") is None
+    assert read_company_digests(path)[0][3] == info
+
+
+def test_archive_detects_corruption(tmp_path):
+    path = str(tmp_path / "data.sia")
+    write_archive_file(path, sample_companies().items())
+    with open(path, "r+b") as f:
+        f.seek(ARCHIVE_HEADER.size + 4)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+    archive = BinaryArchive(path)
+    with pytest.raises(ArchiveError):
+        archive.load_company("삼성전자")
+
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([byte[0] ^ 0xFF]))
+    with pytest.raises(ArchiveError):
+        BinaryArchive(path)
+
+
+def test_archive_rejects_other_files(tmp_path):
+    path = tmp_path / "data.sia"
+    path.write_bytes(b"not an archive")
+    with pytest.raises(ArchiveError):
+        BinaryArchive(str(path))
+
+
+
+# --- 편집 저널 ---
+
+def test_journal_replay_ignores_torn_tail(tmp_path):
+    main_path = str(tmp_path / "main.txt")
+    journal = EditJournal(main_path).open(reset=True)
+    journal.put("A", [Question("t", "", "q", "a", "태그", True, 7)], {"status": "서합"})
+    journal.remove("B")
+    journal.close()
+    with open(journal.path, "ab") as f:
+        f.write(b'0000abcd\t{"op":"put","company":"C","questions":[]')  # 기록 도중 끊긴 줄
+
+    records = EditJournal(main_path).read_records()
+    assert [(record["op"], record["company"]) for record in records] == [("put", "A"), ("remove", "B")]
+
+    companies = [("B", "digest", [], None), ("D", "digest", [], None)]
+    replayed = replay_journal(companies, records)
+    assert [company[0] for company in replayed] == ["D", "A"]
+    assert replayed[1][2] == [("t", "", "q", "a", "태그", True, 7)]
+    assert replayed[1][3] == {"status": "서합"}
+
+    # 다시 열면 끊긴 줄을 잘라내고 이어서 기록합니다.
+    journal = EditJournal(main_path).open()
+    journal.put("C", [])
+    journal.close()
+    assert [record["company"] for record in journal.read_records()] == ["A", "B", "C"]
+
+
+def test_journal_compact_keeps_records_after_mark(tmp_path):
+    journal = EditJournal(str(tmp_path / "main.txt")).open(reset=True)
+    journal.put("A", [])
+    offset = journal.mark()
+    journal.put("B", [])
+    journal.compact(offset.result())
+    journal.put("A", [])
+    journal.put("A", [Question("x")])
+    journal.squash()
+    journal.close()
+    records = journal.read_records()
+    assert [record["company"] for record in records] == ["B", "A"]
+    assert records[1]["questions"][0][0] == "x"
+
+
+
+def test_journal_records_error_for_unencodable_info(tmp_path):
+    journal = EditJournal(str(tmp_path / "main.txt")).open(reset=True)
+    journal.put("A", [])
+    journal.put("B", [], {"status": object()})
+    journal.put("C", [])
+    journal.flush()
+    assert isinstance(journal.error, TypeError)
+    journal.close()
+    assert [record["company"] for record in journal.read_records()] == ["A"]
+
+    journal.discard()
+    assert not os.path.exists(journal.path)
+
+
+# --- Jasoser.html JSON ---
+
+def test_json_array_streams_elements_larger_than_buffer():
+    elements = [{"company": "가" * 100, "items": [{"answer": "나" * 500}]}, [1, 2, {"a": "b"}], "문자열", 3.5]
+    data = json.dumps(elements, ensure_ascii=False).encode("utf-8")
+    assert list(iter_json_array(io.BytesIO(data), chunk_size=7)) == elements
+    assert list(iter_json_array(io.BytesIO(b"\xef\xbb\xbf [ ] "))) == []
+
+
+def test_json_array_rejects_truncated_file():
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(b'[{"company": "A"}, {"comp'), chunk_size=4))
+
+
+def test_json_round_trip_keeps_ids(tmp_path):
+    source = tmp_path / "project_data.json"
+    applications = [
+        {"id": "app-1", "company": "삼성", "date": "2024-03-01", "status": "서합",
+         "items": [{"id": 1717, "title": "지원동기", "type": "자소서", "tags": "t", "question": "q",
+                    "answer": "a", "isReadOnly": True}]},
+        {"id": "app-2", "company": "삼성", "date": "2024-03-02", "status": "기본", "items": []},
+    ]
+    source.write_text(json.dumps(applications, ensure_ascii=False), encoding="utf-8")
+
+    companies = read_company_digests(str(source))
+    assert [company[0] for company in companies] == ["삼성", "삼성 2"]
+
+    target = tmp_path / "out.json"
+    write_json_file(str(target), ((name, [Question(*row) for row in rows], info)
+                                  for name, digest, rows, info in companies))
+    written = json.loads(target.read_text(encoding="utf-8"))
+    assert [application["id"] for application in written] == ["app-1", "app-2"]
+    assert written[0]["items"] == applications[0]["items"]
+    assert list(read_json_file(str(target))) == ["삼성", "삼성 2"]
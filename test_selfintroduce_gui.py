@@ -0,0 +1,47 @@
+# selfintroduce 화면 테스트 (python -m pytest, 디스플레이가 없으면 건너뜀)
+import tkinter as tk
+
+import pytest
+
+from selfintroduce import QuestionFrame
+from selfintroduce_core import CharCounter
+
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Tk를 열 수 없습니다: {e}")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+def assert_counter_matches(frame):
+    expected = CharCounter(frame.answer_text.get("1.0", "end-1c"))
+    counter = frame.char_counter
+    assert (counter.chars, counter.spaces, counter.newlines, counter.utf8) == \
+        (expected.chars, expected.spaces, expected.newlines, expected.utf8)
+
+
+def test_answer_edits_update_counter_by_delta(root):
+    frame = QuestionFrame(root, 1)
+    answer = frame.answer_text
+    answer.insert("1.0", "가나 다\n라마\n")
+    answer.insert("2.1", "X", (), "YZ")
+    answer.delete("1.2")
+    assert_counter_matches(frame)
+
+    # 끝까지 지우면 Tk는 마지막 개행을 남기고 그 앞의 개행을 지웁니다.
+    answer.delete("3.0", "end")
+    assert_counter_matches(frame)
+    answer.delete("2.0", "end")
+    assert answer.get("1.0", "end-1c") == "가나다"
+    assert_counter_matches(frame)
+
+    answer.delete("end-1c")
+    answer.replace("1.0", "1.1", "ab\n")
+    assert_counter_matches(frame)
+    answer.delete("1.0", "end")
+    assert frame.char_counter.chars == 0